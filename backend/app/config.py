@@ -10,15 +10,60 @@ load_dotenv()
 
 class Settings(BaseModel):
     database_url: str = Field(..., min_length=1)
+    database_read_url: str | None = Field(default=None, min_length=1)
+    db_pool_size: int = Field(default=5, ge=1)
+    db_max_overflow: int = Field(default=10, ge=0)
+    db_pool_pre_ping: bool = Field(default=True)
+    db_pool_recycle_seconds: int = Field(default=1800, ge=-1)
+    db_statement_timeout_ms: int = Field(default=0, ge=0)
     scrape_interval_seconds: int = Field(..., ge=1)
+    scrape_cycle_deadline_seconds: int = Field(default=0, ge=0)
+    scrape_max_articles_per_site: int = Field(default=0, ge=0)
+    scraper_shutdown_timeout_seconds: float = Field(default=10.0, gt=0)
+    scrape_adaptive: bool = Field(default=True)
+    scrape_recent_urls: int = Field(default=50000, ge=0)
+    scrape_recent_urls_warm_days: int = Field(default=7, ge=0)
+    scrape_writer_queue_size: int = Field(default=4, ge=1)
+    scrape_writer_batch_size: int = Field(default=500, ge=1)
+    scrape_writer_batch_seconds: float = Field(default=1.0, ge=0)
+    scrape_writer_max_retries: int = Field(default=3, ge=0)
+    scrape_writer_retry_delay_seconds: float = Field(default=0.5, gt=0)
+    scraper_metrics_port: int = Field(default=0, ge=0, le=65535)
+    scraper_metrics_textfile: str | None = Field(default=None, min_length=1)
+    snapshot_archive_dir: str | None = Field(default=None, min_length=1)
+    snapshot_retention_days: int = Field(default=30, ge=1)
+    scraper_specs_file: str | None = Field(default=None, min_length=1)
+    news_partition_months_ahead: int = Field(default=3, ge=1)
+    news_retention_months: int = Field(default=0, ge=0)
+    news_archive_dir: str = Field(default="news-archive", min_length=1)
+    profile_dir: str = Field(default="profiles", min_length=1)
+    profile_sample_interval_ms: float = Field(default=5.0, gt=0)
+    profile_token: str | None = Field(default=None, min_length=16)
+    scrape_min_interval_seconds: int = Field(default=30, ge=1)
+    scrape_max_interval_seconds: int = Field(default=900, ge=1)
+    scrape_interval_jitter: float = Field(default=0.1, ge=0, lt=1)
+    scrape_target_new_per_poll: float = Field(default=2.0, gt=0)
+    scrape_distributed: bool = Field(default=False)
+    scrape_lease_seconds: int = Field(default=300, ge=10)
+    scrape_claim_batch_size: int = Field(default=0, ge=0)
     allowed_origins: list[str] = Field(default_factory=list)
     allowed_domains: list[str] = Field(default_factory=list)
     max_retries: int = Field(default=3, ge=0)
     retry_delay_seconds: float = Field(default=1.0, ge=0.1)
     request_timeout_seconds: int = Field(default=10, ge=1)
+    scrape_retry_budget: int = Field(default=10, ge=0)
+    circuit_failure_threshold: int = Field(default=5, ge=1)
+    circuit_cooldown_seconds: float = Field(default=300.0, gt=0)
+    hedge_requests: bool = Field(default=False)
+    hedge_max_ratio: float = Field(default=0.1, ge=0, le=1)
+    hedge_min_samples: int = Field(default=10, ge=1)
+    hedge_max_workers: int = Field(default=8, ge=2)
+    scrape_host_concurrency: int = Field(default=4, ge=1)
     max_search_results: int = Field(default=1000, ge=1, le=10000)
     search_query_timeout_seconds: int = Field(default=5, ge=1)
     max_search_pattern_length: int = Field(default=50, ge=1, le=200)
+    news_coalesce_max_keys: int = Field(default=256, ge=0)
+    news_coalesce_timeout_seconds: float = Field(default=5.0, gt=0)
 
 
 def _parse_allowed_origins(value: str) -> list[str]:
@@ -198,7 +243,21 @@ def _get_env_float(key: str, default: float) -> float:
         return default
 
 
-def _parse_database_settings() -> dict[str, str | int]:
+def _get_env_bool(key: str, default: bool) -> bool:
+    """Get boolean from environment variable with fallback."""
+    value = os.getenv(key)
+    if value is None:
+        return default
+
+    value = value.strip().lower()
+    if value in ("1", "true", "yes", "on"):
+        return True
+    if value in ("0", "false", "no", "off"):
+        return False
+    return default
+
+
+def _parse_database_settings() -> dict[str, str | int | None]:
     """Parse and validate database and scraping settings."""
     database_url = os.getenv("DATABASE_URL", "")
 
@@ -207,12 +266,120 @@ def _parse_database_settings() -> dict[str, str | int]:
     except ValueError as exc:
         raise ValueError(f"DATABASE_URL validation failed: {exc}")
 
+    validated_read_url: str | None = None
+    if read_url := os.getenv("DATABASE_READ_URL", "").strip():
+        try:
+            validated_read_url = _validate_database_url(read_url)
+        except ValueError as exc:
+            raise ValueError(f"DATABASE_READ_URL validation failed: {exc}")
+
     return {
         "database_url": validated_url,
+        "database_read_url": validated_read_url,
         "scrape_interval_seconds": _get_env_int("SCRAPE_INTERVAL_SECONDS", 60),
     }
 
 
+def _parse_schedule_settings() -> dict[str, int | float | bool]:
+    """Parse cycle deadline, article cap and adaptive per-site scheduling settings."""
+    return {
+        "scrape_cycle_deadline_seconds": _get_env_int(
+            "SCRAPE_CYCLE_DEADLINE_SECONDS", 0
+        ),
+        "scrape_max_articles_per_site": _get_env_int("SCRAPE_MAX_ARTICLES_PER_SITE", 0),
+        "scraper_shutdown_timeout_seconds": _get_env_float(
+            "SCRAPER_SHUTDOWN_TIMEOUT_SECONDS", 10.0
+        ),
+        "scrape_adaptive": _get_env_bool("SCRAPE_ADAPTIVE", True),
+        "scrape_min_interval_seconds": _get_env_int("SCRAPE_MIN_INTERVAL_SECONDS", 30),
+        "scrape_max_interval_seconds": _get_env_int("SCRAPE_MAX_INTERVAL_SECONDS", 900),
+        "scrape_interval_jitter": _get_env_float("SCRAPE_INTERVAL_JITTER", 0.1),
+        "scrape_target_new_per_poll": _get_env_float("SCRAPE_TARGET_NEW_PER_POLL", 2.0),
+    }
+
+
+def _parse_dedupe_settings() -> dict[str, int]:
+    """Parse the scraper's in-memory filter of recently stored URLs."""
+    return {
+        "scrape_recent_urls": _get_env_int("SCRAPE_RECENT_URLS", 50000),
+        "scrape_recent_urls_warm_days": _get_env_int("SCRAPE_RECENT_URLS_WARM_DAYS", 7),
+    }
+
+
+def _parse_writer_settings() -> dict[str, int | float]:
+    """Parse the batching of the scraper's database writer."""
+    return {
+        "scrape_writer_queue_size": _get_env_int("SCRAPE_WRITER_QUEUE_SIZE", 4),
+        "scrape_writer_batch_size": _get_env_int("SCRAPE_WRITER_BATCH_SIZE", 500),
+        "scrape_writer_batch_seconds": _get_env_float(
+            "SCRAPE_WRITER_BATCH_SECONDS", 1.0
+        ),
+        "scrape_writer_max_retries": _get_env_int("SCRAPE_WRITER_MAX_RETRIES", 3),
+        "scrape_writer_retry_delay_seconds": _get_env_float(
+            "SCRAPE_WRITER_RETRY_DELAY_SECONDS", 0.5
+        ),
+    }
+
+
+def _parse_scraper_metrics_settings() -> dict[str, int | str | None]:
+    """Parse how the standalone scraper exposes its metrics."""
+    return {
+        "scraper_metrics_port": _get_env_int("SCRAPER_METRICS_PORT", 0),
+        "scraper_metrics_textfile": os.getenv("SCRAPER_METRICS_TEXTFILE") or None,
+    }
+
+
+def _parse_snapshot_settings() -> dict[str, int | str | None]:
+    """Parse the raw page archive settings."""
+    return {
+        "snapshot_archive_dir": os.getenv("SNAPSHOT_ARCHIVE_DIR") or None,
+        "snapshot_retention_days": _get_env_int("SNAPSHOT_RETENTION_DAYS", 30),
+    }
+
+
+def _parse_scraper_spec_settings() -> dict[str, str | None]:
+    """Parse the location of the site extraction specs."""
+    return {"scraper_specs_file": os.getenv("SCRAPER_SPECS_FILE") or None}
+
+
+def _parse_partition_settings() -> dict[str, int | str]:
+    """Parse the news partitioning and retention settings."""
+    return {
+        "news_partition_months_ahead": _get_env_int("NEWS_PARTITION_MONTHS_AHEAD", 3),
+        "news_retention_months": _get_env_int("NEWS_RETENTION_MONTHS", 0),
+        "news_archive_dir": os.getenv("NEWS_ARCHIVE_DIR") or "news-archive",
+    }
+
+
+def _parse_profiling_settings() -> dict[str, float | str | None]:
+    """Parse on-demand profiling settings for the scraper and the API."""
+    return {
+        "profile_dir": os.getenv("PROFILE_DIR", "profiles"),
+        "profile_sample_interval_ms": _get_env_float("PROFILE_SAMPLE_INTERVAL_MS", 5.0),
+        "profile_token": os.getenv("PROFILE_TOKEN") or None,
+    }
+
+
+def _parse_coordination_settings() -> dict[str, int | bool]:
+    """Parse multi-worker scraping coordination settings."""
+    return {
+        "scrape_distributed": _get_env_bool("SCRAPE_DISTRIBUTED", False),
+        "scrape_lease_seconds": _get_env_int("SCRAPE_LEASE_SECONDS", 300),
+        "scrape_claim_batch_size": _get_env_int("SCRAPE_CLAIM_BATCH_SIZE", 0),
+    }
+
+
+def _parse_pool_settings() -> dict[str, int | bool]:
+    """Parse connection pool and statement timeout settings."""
+    return {
+        "db_pool_size": _get_env_int("DB_POOL_SIZE", 5),
+        "db_max_overflow": _get_env_int("DB_MAX_OVERFLOW", 10),
+        "db_pool_pre_ping": _get_env_bool("DB_POOL_PRE_PING", True),
+        "db_pool_recycle_seconds": _get_env_int("DB_POOL_RECYCLE_SECONDS", 1800),
+        "db_statement_timeout_ms": _get_env_int("DB_STATEMENT_TIMEOUT_MS", 0),
+    }
+
+
 def _parse_security_settings() -> dict[str, list[str] | int]:
     """Parse security and CORS settings."""
     return {
@@ -221,12 +388,20 @@ def _parse_security_settings() -> dict[str, list[str] | int]:
     }
 
 
-def _parse_request_settings() -> dict[str, int | float]:
+def _parse_request_settings() -> dict[str, int | float | bool]:
     """Parse HTTP request and retry settings."""
     return {
         "max_retries": _get_env_int("MAX_RETRIES", 3),
         "retry_delay_seconds": _get_env_float("RETRY_DELAY_SECONDS", 1.0),
         "request_timeout_seconds": _get_env_int("REQUEST_TIMEOUT_SECONDS", 10),
+        "scrape_retry_budget": _get_env_int("SCRAPE_RETRY_BUDGET", 10),
+        "circuit_failure_threshold": _get_env_int("CIRCUIT_FAILURE_THRESHOLD", 5),
+        "circuit_cooldown_seconds": _get_env_float("CIRCUIT_COOLDOWN_SECONDS", 300.0),
+        "hedge_requests": _get_env_bool("HEDGE_REQUESTS", False),
+        "hedge_max_ratio": _get_env_float("HEDGE_MAX_RATIO", 0.1),
+        "hedge_min_samples": _get_env_int("HEDGE_MIN_SAMPLES", 10),
+        "hedge_max_workers": _get_env_int("HEDGE_MAX_WORKERS", 8),
+        "scrape_host_concurrency": _get_env_int("SCRAPE_HOST_CONCURRENCY", 4),
     }
 
 
@@ -239,19 +414,51 @@ def _parse_search_settings() -> dict[str, int]:
     }
 
 
+def _parse_api_settings() -> dict[str, int | float]:
+    """Parse API request coalescing settings."""
+    return {
+        "news_coalesce_max_keys": _get_env_int("NEWS_COALESCE_MAX_KEYS", 256),
+        "news_coalesce_timeout_seconds": _get_env_float(
+            "NEWS_COALESCE_TIMEOUT_SECONDS", 5.0
+        ),
+    }
+
+
 def get_settings() -> Settings:
     """Load and validate application settings from environment variables."""
     database_settings = _parse_database_settings()
+    pool_settings = _parse_pool_settings()
+    schedule_settings = _parse_schedule_settings()
+    coordination_settings = _parse_coordination_settings()
+    dedupe_settings = _parse_dedupe_settings()
+    writer_settings = _parse_writer_settings()
+    scraper_metrics_settings = _parse_scraper_metrics_settings()
+    snapshot_settings = _parse_snapshot_settings()
+    scraper_spec_settings = _parse_scraper_spec_settings()
+    partition_settings = _parse_partition_settings()
+    profiling_settings = _parse_profiling_settings()
     security_settings = _parse_security_settings()
     request_settings = _parse_request_settings()
     search_settings = _parse_search_settings()
+    api_settings = _parse_api_settings()
 
     # Merge all settings - type checker needs explicit cast
     all_settings = {
         **database_settings,
+        **pool_settings,
+        **schedule_settings,
+        **coordination_settings,
+        **dedupe_settings,
+        **writer_settings,
+        **scraper_metrics_settings,
+        **snapshot_settings,
+        **scraper_spec_settings,
+        **partition_settings,
+        **profiling_settings,
         **security_settings,
         **request_settings,
         **search_settings,
+        **api_settings,
     }
 
     # Pydantic will validate the types at runtime
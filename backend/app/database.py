@@ -1,16 +1,55 @@
 from collections.abc import Generator
+from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.config import settings
+from app.metrics import instrument_engine
 
-engine = create_engine(settings.database_url, future=True)
+
+def _engine_options() -> dict[str, Any]:
+    """Build pool and connection options shared by the primary and replica engines."""
+    options: dict[str, Any] = {
+        "future": True,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+    }
+
+    if settings.db_statement_timeout_ms > 0:
+        options["connect_args"] = {
+            "options": f"-c statement_timeout={settings.db_statement_timeout_ms}"
+        }
+
+    return options
+
+
+def _create_read_engine() -> Engine:
+    """Create the read-only engine, falling back to the primary when unset."""
+    if not settings.database_read_url:
+        return engine
+
+    return create_engine(settings.database_read_url, **_engine_options())
+
+
+# Primary engine: used by the scraper and anything that writes.
+engine = create_engine(settings.database_url, **_engine_options())
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
+# Read engine: used by the API's GET routes, may point at a replica.
+read_engine = _create_read_engine()
+ReadSessionLocal = sessionmaker(bind=read_engine, autoflush=False, autocommit=False)
+
+instrument_engine(engine, "primary")
+if read_engine is not engine:
+    instrument_engine(read_engine, "replica")
+
 
 def get_db() -> Generator[Session, None, None]:
-    db = SessionLocal()
+    """Yield a read-only session, routed to the replica when configured."""
+    db = ReadSessionLocal()
     try:
         yield db
     finally:
@@ -1,12 +1,14 @@
-from collections.abc import AsyncGenerator
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 
 from app.config import settings
-from app.routers import api_router
+from app.metrics import HTTP_REQUEST_SECONDS
+from app.routers import api_router, debug
 
 
 @asynccontextmanager
@@ -16,6 +18,40 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("API server shutting down")
 
 
+async def record_request_latency(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # Label by route template, not raw path, to keep cardinality bounded.
+        route = request.scope.get("route")
+        HTTP_REQUEST_SECONDS.labels(
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=str(status),
+        ).observe(time.perf_counter() - start)
+
+
+async def profile_requests(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    if (sampler := debug.request_profiler.claim(request.url.path)) is None:
+        return await call_next(request)
+
+    sampler.start()
+    try:
+        with sampler.section(f"{request.method} {request.url.path}"):
+            return await call_next(request)
+    finally:
+        sampler.stop()
+        debug.request_profiler.collect(sampler)
+
+
 def create_app() -> FastAPI:
     app = FastAPI(title="Eclipse News API", lifespan=lifespan)
 
@@ -28,8 +64,15 @@ def create_app() -> FastAPI:
             allow_headers=["*"],
         )
 
+    app.middleware("http")(record_request_latency)
     app.include_router(api_router)
 
+    # Without a token neither the endpoint nor the middleware exist, so
+    # profiling costs nothing unless it is configured.
+    if settings.profile_token:
+        app.middleware("http")(profile_requests)
+        app.include_router(debug.router)
+
     return app
 
 
@@ -0,0 +1,151 @@
+"""
+Prometheus metrics shared by the API and the scraper process.
+
+The API serves them at `/metrics`; the scraper exposes them through its own
+HTTP endpoint or a textfile for the node exporter (see `run_scraper.py`).
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import Engine, event
+
+_FAST_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+_NETWORK_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0)
+
+# Scraper
+
+SCRAPE_STAGE_SECONDS = Histogram(
+    "eclipse_scrape_stage_seconds",
+    "Time spent in each stage of scraping a site",
+    ["site", "stage"],
+    buckets=_NETWORK_BUCKETS,
+)
+SCRAPE_RESPONSE_BYTES = Counter(
+    "eclipse_scrape_response_bytes_total",
+    "Bytes downloaded from each site's pages",
+    ["site"],
+)
+SCRAPE_ELEMENTS = Counter(
+    "eclipse_scrape_elements_total",
+    "Candidate elements found on each site's pages",
+    ["site"],
+)
+SCRAPE_ARTICLES = Counter(
+    "eclipse_scrape_articles_total",
+    "Articles per site by outcome: extracted, filtered, duplicate, invalid, "
+    "recent, known or new",
+    ["site", "outcome"],
+)
+SCRAPE_FEEDS = Counter(
+    "eclipse_scrape_feeds_total",
+    "Feed reads per site by outcome: used, failed or stale (the site's pages "
+    "were scraped instead)",
+    ["site", "outcome"],
+)
+SCRAPE_SECTIONS = Counter(
+    "eclipse_scrape_sections_total",
+    "Section page fetches per site by outcome: fetched or failed (the section "
+    "was skipped)",
+    ["site", "section", "outcome"],
+)
+SCRAPE_SECTION_ARTICLES = Counter(
+    "eclipse_scrape_section_articles_total",
+    "Articles kept from each section page, not counting those already found on "
+    "an earlier page of the site",
+    ["site", "section"],
+)
+SCRAPE_RECENT_URLS = Gauge(
+    "eclipse_scrape_recent_urls",
+    "Keys held by the scraper's in-memory filter of recently stored articles",
+)
+SCRAPE_FETCH_ERRORS = Counter(
+    "eclipse_scrape_fetch_errors_total",
+    "Failed page fetches per site and error class",
+    ["site", "error"],
+)
+SCRAPE_HEDGED_REQUESTS = Counter(
+    "eclipse_scrape_hedged_requests_total",
+    "Second requests sent because the first one was slower than the site's p95",
+)
+SCRAPE_CIRCUIT_STATE = Gauge(
+    "eclipse_scrape_circuit_state",
+    "Circuit breaker state per host: 0 closed, 1 half-open, 2 open",
+    ["host"],
+)
+SCRAPE_CYCLE_SECONDS = Histogram(
+    "eclipse_scrape_cycle_seconds",
+    "Duration of a full scraping cycle",
+    buckets=(1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0),
+)
+SCRAPE_COMMIT_SECONDS = Histogram(
+    "eclipse_scrape_commit_seconds",
+    "Time spent committing each batch of articles",
+    buckets=_FAST_BUCKETS,
+)
+SCRAPE_WRITER_QUEUE = Gauge(
+    "eclipse_scrape_writer_queue",
+    "Sites whose articles are waiting for the database writer",
+)
+SCRAPE_WRITER_WAIT_SECONDS = Histogram(
+    "eclipse_scrape_writer_wait_seconds",
+    "Time scraping waited for room in the database writer's queue",
+    buckets=_FAST_BUCKETS,
+)
+SCRAPE_WRITER_LAG_SECONDS = Histogram(
+    "eclipse_scrape_writer_lag_seconds",
+    "Time from a site's articles being extracted to being committed",
+    buckets=_NETWORK_BUCKETS,
+)
+SCRAPE_WRITER_BATCHES = Counter(
+    "eclipse_scrape_writer_batches_total",
+    "Batches of articles written, by outcome: committed, retried or failed",
+    ["outcome"],
+)
+
+# API and database
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "eclipse_http_request_duration_seconds",
+    "API request latency per route",
+    ["method", "route", "status"],
+    buckets=_FAST_BUCKETS,
+)
+DB_QUERY_SECONDS = Histogram(
+    "eclipse_db_query_duration_seconds",
+    "Database statement latency per engine and statement type",
+    ["engine", "statement"],
+    buckets=_FAST_BUCKETS,
+)
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """Record the duration of every statement executed through `engine`."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        context.query_started_at = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        verb = statement.lstrip().split(None, 1)[0].upper() if statement else ""
+        DB_QUERY_SECONDS.labels(engine=name, statement=verb).observe(
+            time.perf_counter() - context.query_started_at
+        )
@@ -1,8 +1,20 @@
 from __future__ import annotations
 
+import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, UniqueConstraint, func
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Identity,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    Uuid,
+    func,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -31,20 +43,101 @@ class SiteModel(Base):
 
 
 class NewsModel(Base):
+    """
+    A scraped article.
+
+    On PostgreSQL the table is range-partitioned by month of `scraped_at`
+    (see `app.services.news_partitions`), which is why `scraped_at` is part
+    of the primary key. Unique constraints would have to include it as well,
+    so the uniqueness of an article's URL per site is enforced by
+    `NewsKeyModel` instead.
+    """
+
     __tablename__ = "news"
-    __table_args__ = (UniqueConstraint("site_id", "url", name="uq_news_site_url"),)
+    __table_args__ = (
+        Index("ix_news_site_url_hash", "site_id", "url_hash"),
+        {"postgresql_partition_by": "RANGE (scraped_at)"},
+    )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, Identity(), primary_key=True)
     site_id: Mapped[int] = mapped_column(
         ForeignKey("sites.id"), nullable=False, index=True
     )
     title: Mapped[str] = mapped_column(String(500), nullable=False)
     url: Mapped[str] = mapped_column(String(1000), nullable=False)
+    url_hash: Mapped[uuid.UUID] = mapped_column(Uuid, nullable=False)
     scraped_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        primary_key=True,
+        index=True,
+    )
+    last_seen_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
         nullable=False,
         index=True,
     )
+    seen_count: Mapped[int] = mapped_column(
+        Integer, server_default="1", default=1, nullable=False
+    )
+    # As stated by the site's feed; unknown for articles scraped from pages.
+    published_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
 
     site: Mapped[SiteModel] = relationship(back_populates="news")
+
+
+class NewsKeyModel(Base):
+    """
+    The `url_hash` of every article stored per site, one row each.
+
+    Its primary key is what keeps a URL from being stored twice for a site,
+    as `news` is partitioned and can't carry that constraint. Rows outlive
+    the archival of their article's partition, so an archived article isn't
+    scraped again.
+    """
+
+    __tablename__ = "news_keys"
+
+    site_id: Mapped[int] = mapped_column(ForeignKey("sites.id"), primary_key=True)
+    url_hash: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True)
+
+
+class ScrapeJobModel(Base):
+    __tablename__ = "scrape_jobs"
+
+    site_id: Mapped[int] = mapped_column(ForeignKey("sites.id"), primary_key=True)
+    next_run_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        index=True,
+    )
+    lease_owner: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    last_run_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+
+class ScrapeRunModel(Base):
+    __tablename__ = "scrape_runs"
+    __table_args__ = (Index("ix_scrape_runs_site_started", "site_id", "started_at"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    site_id: Mapped[int] = mapped_column(ForeignKey("sites.id"), nullable=False)
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+    duration_ms: Mapped[int] = mapped_column(Integer, nullable=False)
+    http_status: Mapped[int | None] = mapped_column(SmallInteger, nullable=True)
+    response_bytes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    elements: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    extracted: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    new_articles: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    error: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    unchanged: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
@@ -0,0 +1,218 @@
+"""
+On-demand sampling profiler for the scraper and the API.
+
+`StackSampler` periodically captures the Python stacks of every busy thread
+and counts them in the folded format read by flamegraph.pl, speedscope and
+similar tools. Samples are prefixed with the labels of the section their
+thread was running at the time (site and stage for the scraper, route for the
+API), so each section shows up as its own subtree.
+
+Nothing here runs unless profiling was requested: `section()` returns a
+shared no-op context while no sampler is active.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from pathlib import Path
+from types import FrameType
+
+# Innermost frames of threads that are blocked rather than working. Their
+# samples are dropped, so idle workers and the thread waiting on a fetch don't
+# drown out the thread doing it.
+_IDLE_FRAMES = {
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("threading.py", "join"),
+    ("selectors.py", "select"),
+    ("socketserver.py", "serve_forever"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),
+}
+
+_NO_SECTION: AbstractContextManager[None] = nullcontext()
+_active: StackSampler | None = None
+
+
+class StackSampler:
+    """
+    Samples the stacks of all busy threads at a fixed interval.
+
+    Args:
+        interval: Seconds between samples.
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+        # By thread ident: the pages of several sites are scraped at once.
+        self._labels: dict[int, tuple[str, ...]] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    @contextmanager
+    def section(self, *labels: str) -> Iterator[None]:
+        """Prefix the samples of this thread taken inside the block with `labels`."""
+        thread_id = threading.get_ident()
+        previous = self._labels.get(thread_id)
+        self._labels[thread_id] = labels
+        try:
+            yield
+        finally:
+            if previous is None:
+                del self._labels[thread_id]
+            else:
+                self._labels[thread_id] = previous
+
+    def labels(self) -> tuple[str, ...]:
+        """The labels of the section this thread is in, if any."""
+        return self._labels.get(threading.get_ident(), ())
+
+    def section_totals(self) -> Counter[tuple[str, ...]]:
+        """Return the number of samples per section label, e.g. (site, stage)."""
+        totals: Counter[tuple[str, ...]] = Counter()
+        for stack, count in self.samples.items():
+            labels = tuple(
+                frame.removeprefix("[").removesuffix("]")
+                for frame in stack.split(";")
+                if frame.startswith("[")
+            )
+            totals[labels] += count
+        return totals
+
+    def write_folded(self, path: Path) -> None:
+        """Write the samples as folded stacks, one `frames count` per line."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.folded())
+
+    def folded(self) -> str:
+        return _format_folded(self.samples)
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_id and not _is_idle(frame):
+                    labels = self._labels.get(thread_id, ())
+                    prefix = "".join(f"[{label}];" for label in labels)
+                    self.samples[prefix + _fold(frame)] += 1
+
+
+def _frame_key(frame: FrameType) -> tuple[str, str]:
+    return Path(frame.f_code.co_filename).name, frame.f_code.co_name
+
+
+def _is_idle(frame: FrameType) -> bool:
+    return _frame_key(frame) in _IDLE_FRAMES
+
+
+def _fold(frame: FrameType) -> str:
+    frames: list[str] = []
+    current: FrameType | None = frame
+    while current is not None:
+        filename = Path(current.f_code.co_filename).name
+        frames.append(f"{current.f_code.co_qualname} ({filename})")
+        current = current.f_back
+    return ";".join(reversed(frames))
+
+
+def _format_folded(samples: Counter[str]) -> str:
+    return "".join(f"{stack} {count}\n" for stack, count in sorted(samples.items()))
+
+
+@contextmanager
+def activate(sampler: StackSampler) -> Iterator[StackSampler]:
+    """Run `sampler` and make it the target of `section()` inside the block."""
+    global _active
+    _active = sampler
+    sampler.start()
+    try:
+        yield sampler
+    finally:
+        sampler.stop()
+        _active = None
+
+
+def section(*labels: str) -> AbstractContextManager[None]:
+    """Label this thread's samples; a no-op when not profiling."""
+    if _active is None:
+        return _NO_SECTION
+    return _active.section(*labels)
+
+
+def current_labels() -> tuple[str, ...]:
+    """
+    The labels of this thread's section, for a thread that works on its behalf.
+
+    Labels belong to the thread that entered the section, so a helper thread
+    enters a section with these to have its samples counted in the same one.
+    """
+    if _active is None:
+        return ()
+    return _active.labels()
+
+
+class RequestProfiler:
+    """
+    Profiles the next requests to an API path once armed.
+
+    Requests to the path are sampled one at a time, so a request that arrives
+    while another one is being profiled is skipped. Concurrent requests to
+    other paths may still show up in the samples.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.path: str | None = None
+        self.remaining = 0
+        self.profiled = 0
+        self.samples: Counter[str] = Counter()
+        self._sampling = False
+        self._lock = threading.Lock()
+
+    def arm(self, path: str, requests: int) -> None:
+        """Profile the next `requests` requests to `path`, discarding old samples."""
+        with self._lock:
+            self.path = path
+            self.remaining = requests
+            self.profiled = 0
+            self.samples = Counter()
+
+    def claim(self, path: str) -> StackSampler | None:
+        """Return a sampler if this request to `path` should be profiled."""
+        if self.remaining <= 0 or path != self.path:
+            return None
+
+        with self._lock:
+            if self._sampling or self.remaining <= 0 or path != self.path:
+                return None
+            self._sampling = True
+            self.remaining -= 1
+            return StackSampler(self.interval)
+
+    def collect(self, sampler: StackSampler) -> None:
+        with self._lock:
+            self.samples.update(sampler.samples)
+            self.profiled += 1
+            self._sampling = False
+
+    def folded(self) -> str:
+        with self._lock:
+            return _format_folded(self.samples)
@@ -1,8 +1,10 @@
 from fastapi import APIRouter
 
-from . import news, sites
+from . import metrics, news, scrape_runs, sites
 
 
 api_router = APIRouter()
 api_router.include_router(sites.router)
 api_router.include_router(news.router)
+api_router.include_router(scrape_runs.router)
+api_router.include_router(metrics.router)
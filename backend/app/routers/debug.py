@@ -0,0 +1,73 @@
+import secrets
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from app.config import settings
+from app.profiling import RequestProfiler
+from app.schemas import ProfileStatus
+
+router = APIRouter(prefix="/debug", tags=["debug"], include_in_schema=False)
+
+request_profiler = RequestProfiler(settings.profile_sample_interval_ms / 1000)
+
+
+def _require_profile_token(
+    x_profile_token: Annotated[str | None, Header()] = None,
+) -> None:
+    """Rejeita a requisição se o cabeçalho `X-Profile-Token` não confere."""
+    expected = settings.profile_token
+    if (
+        expected is None
+        or x_profile_token is None
+        or not secrets.compare_digest(x_profile_token, expected)
+    ):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+
+
+def _status() -> ProfileStatus:
+    return ProfileStatus(
+        path=request_profiler.path,
+        remaining=request_profiler.remaining,
+        profiled=request_profiler.profiled,
+    )
+
+
+@router.post(
+    "/profile",
+    response_model=ProfileStatus,
+    dependencies=[Depends(_require_profile_token)],
+)
+def start_profile(
+    path: Annotated[str, Query(pattern=r"^/", max_length=200)],
+    requests: Annotated[int, Query(ge=1, le=1000)] = 10,
+) -> ProfileStatus:
+    """Perfila as próximas `requests` requisições ao caminho `path`.
+
+    As amostras anteriores são descartadas. Só existe quando `PROFILE_TOKEN`
+    está configurado e exige esse token no cabeçalho `X-Profile-Token`.
+    """
+    request_profiler.arm(path, requests)
+    return _status()
+
+
+@router.get(
+    "/profile",
+    response_class=PlainTextResponse,
+    dependencies=[Depends(_require_profile_token)],
+)
+def get_profile() -> PlainTextResponse:
+    """Retorna as pilhas amostradas no formato "folded" do flamegraph.
+
+    O progresso vai nos cabeçalhos `X-Profile-Remaining` e
+    `X-Profile-Profiled`.
+    """
+    current = _status()
+    return PlainTextResponse(
+        request_profiler.folded(),
+        headers={
+            "X-Profile-Remaining": str(current.remaining),
+            "X-Profile-Profiled": str(current.profiled),
+        },
+    )
@@ -0,0 +1,10 @@
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    """Expõe as métricas do processo no formato de texto do Prometheus."""
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -5,14 +5,22 @@ from typing import Annotated, Sequence
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.database import get_db
 from app.models import NewsModel, SiteModel
 from app.schemas import NewsOut, NewsQueryParams, PaginatedNewsOut
-from app.services.scraping_core import SUPPORTED_SITE_SLUGS
-from app.utils import parse_time_range
+from app.services.site_registry import SUPPORTED_SITE_SLUGS
+from app.utils import SingleFlight, parse_time_range
 
 router = APIRouter(prefix="/news", tags=["news"])
 
+_news_flight: SingleFlight[PaginatedNewsOut] = SingleFlight(
+    max_keys=settings.news_coalesce_max_keys,
+    timeout_seconds=settings.news_coalesce_timeout_seconds,
+)
+
+_NewsQueryKey = tuple[tuple[str, ...], str | None, str | None, str, int, int]
+
 
 @router.get(
     "",
@@ -35,12 +43,18 @@ def list_news(
     - Por sites: `GET /news?sites=veja,globo`
     - Com busca: `GET /news?search=economia`
     - Últimas 24h: `GET /news?time_range=24h`
+    - Ainda na página inicial: `GET /news?sort=homepage`
     - Completo: `GET /news?sites=cnn&search=política&time_range=7d&page=2`
 
     **Filtro temporal (formato: {número}{unidade}):**
     - Unidades: `h` (horas), `d` (dias), `w` (semanas), `m` (meses)
     - Exemplos: `1h`, `6h`, `24h`, `7d`, `14d`, `2w`, `30d`, `3m`
 
+    **Ordenação (`sort`):**
+    - `recent` (padrão): mais recentes primeiro, por `scraped_at`
+    - `homepage`: por `last_seen_at`, a última vez em que a notícia foi vista na
+      página inicial do site; as que continuam lá vêm primeiro
+
     **Resposta:**
     - `items`: Lista de notícias da página atual
     - `total`: Total de notícias que correspondem aos filtros
@@ -63,20 +77,47 @@ def list_news(
             pages=0,
         )
 
+    key = _normalize_query(params, slug_list)
+    return _news_flight.do(key, lambda: _query_news(db, key))
+
+
+def _normalize_query(params: NewsQueryParams, slug_list: list[str]) -> _NewsQueryKey:
+    """Reduz os parâmetros a uma chave canônica para coalescer consultas iguais."""
+    search = params.search.strip() if params.search else ""
+    time_range = params.time_range.strip().lower() if params.time_range else ""
+    return (
+        tuple(sorted(set(slug_list))),
+        search or None,
+        time_range or None,
+        params.sort,
+        params.page,
+        params.page_size,
+    )
+
+
+def _query_news(db: Session, key: _NewsQueryKey) -> PaginatedNewsOut:
+    """Executa a contagem e a consulta paginada para uma chave normalizada."""
+    slugs, search, time_range, sort, page, page_size = key
+
     base_query = (
         db.query(NewsModel)
         .join(SiteModel, NewsModel.site_id == SiteModel.id)
-        .filter(SiteModel.slug.in_(slug_list))
-        .order_by(NewsModel.scraped_at.desc())
+        .filter(SiteModel.slug.in_(slugs))
     )
+    if sort == "homepage":
+        base_query = base_query.order_by(
+            NewsModel.last_seen_at.desc(), NewsModel.scraped_at.desc()
+        )
+    else:
+        base_query = base_query.order_by(NewsModel.scraped_at.desc())
 
-    if params.search is not None and params.search.strip():
-        pattern = f"%{params.search.strip()}%"
+    if search is not None:
+        pattern = f"%{search}%"
         base_query = base_query.filter(NewsModel.title.ilike(pattern))
 
-    if params.time_range is not None and params.time_range.strip():
+    if time_range is not None:
         now = datetime.now(timezone.utc)
-        delta = parse_time_range(params.time_range.strip())
+        delta = parse_time_range(time_range)
         min_scraped_at = now - delta
         base_query = base_query.filter(NewsModel.scraped_at >= min_scraped_at)
 
@@ -84,25 +125,23 @@ def list_news(
         return PaginatedNewsOut(
             items=[],
             total=0,
-            page=params.page,
-            page_size=params.page_size,
+            page=page,
+            page_size=page_size,
             pages=0,
         )
 
-    pages = ceil(total / params.page_size)
+    pages = ceil(total / page_size)
 
-    current_page = params.page if params.page <= pages else pages
+    current_page = page if page <= pages else pages
 
     items: Sequence[NewsModel] = (
-        base_query.offset((current_page - 1) * params.page_size)
-        .limit(params.page_size)
-        .all()
+        base_query.offset((current_page - 1) * page_size).limit(page_size).all()
     )
 
     return PaginatedNewsOut(
         items=[NewsOut.model_validate(item) for item in items],
         total=total,
         page=current_page,
-        page_size=params.page_size,
+        page_size=page_size,
         pages=pages,
     )
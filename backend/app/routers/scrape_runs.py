@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta, timezone
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.schemas import ScrapeRunSummary
+from app.services.scrape_runs import summarize_runs
+
+router = APIRouter(prefix="/scrape-runs", tags=["scrape-runs"])
+
+
+@router.get(
+    "/summary",
+    response_model=list[ScrapeRunSummary],
+    summary="Resumir as execuções recentes do scraper por site",
+    response_description="Estatísticas das execuções recentes de cada site",
+)
+def summarize_scrape_runs(
+    hours: Annotated[
+        int,
+        Query(ge=1, le=720, description="Janela de tempo analisada, em horas"),
+    ] = 24,
+    db: Session = Depends(get_db),
+) -> list[ScrapeRunSummary]:
+    """Retorna um resumo das execuções do scraper de cada site na janela pedida.
+
+    Serve para diagnosticar problemas sem consultar os logs: um seletor quebrado
+    aparece como `last_extracted` zerado e um host lento como `avg_duration_ms`
+    alto.
+
+    **Exemplos de uso:**
+
+    - Últimas 24 horas: `GET /scrape-runs/summary`
+    - Última semana: `GET /scrape-runs/summary?hours=168`
+
+    **Resposta (um item por site que executou na janela):**
+    - `runs`, `failures`, `unchanged_runs`: Execuções, falhas e páginas inalteradas
+    - `avg_duration_ms`, `max_duration_ms`: Duração da busca e extração
+    - `avg_extracted`, `new_articles`: Artigos extraídos em média e novos no total
+    - `last_*`: Resultado da execução mais recente
+    """
+    since = datetime.now(timezone.utc) - timedelta(hours=hours)
+    return [ScrapeRunSummary.model_validate(row) for row in summarize_runs(db, since)]
@@ -4,7 +4,7 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models import SiteModel
 from app.schemas import SiteOut
-from app.services.scraping_core import SUPPORTED_SITE_SLUGS
+from app.services.site_registry import SUPPORTED_SITE_SLUGS
 
 router = APIRouter(prefix="/sites", tags=["sites"])
 
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -39,6 +39,9 @@ class NewsOut(NewsBase):
     id: int = Field(..., strict=True)
     site_id: int = Field(..., strict=True)
     scraped_at: datetime = Field(..., strict=True)
+    last_seen_at: datetime = Field(..., strict=True)
+    seen_count: int = Field(..., strict=True)
+    published_at: Optional[datetime] = Field(None, strict=True)
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -73,6 +76,7 @@ class NewsQueryParams(BaseModel):
         sites: Lista de slugs de sites separados por vírgula.
         search: Termo de busca para filtrar notícias pelo título.
         time_range: Filtro temporal dinâmico no formato '{número}{unidade}'.
+        sort: Ordenação dos resultados.
         page: Número da página para paginação.
         page_size: Quantidade de itens por página.
     """
@@ -96,6 +100,14 @@ class NewsQueryParams(BaseModel):
             "Exemplos: 1h, 6h, 24h, 7d, 2w, 3m"
         ),
     )
+    sort: Literal["recent", "homepage"] = Field(
+        "recent",
+        description=(
+            "Ordenação: 'recent' (mais recentes primeiro) ou 'homepage' "
+            "(as que seguem na página inicial do site primeiro, pela última "
+            "vez em que foram vistas)"
+        ),
+    )
     page: int = Field(
         1,
         ge=1,
@@ -115,3 +127,25 @@ class PaginatedNewsOut(BaseModel):
     page: int = Field(..., strict=True)
     page_size: int = Field(..., strict=True)
     pages: int = Field(..., strict=True)
+
+
+class ScrapeRunSummary(BaseModel):
+    site_slug: str = Field(..., strict=True)
+    runs: int = Field(..., strict=True)
+    failures: int = Field(..., strict=True)
+    unchanged_runs: int = Field(..., strict=True)
+    avg_duration_ms: float = Field(..., strict=True)
+    max_duration_ms: int = Field(..., strict=True)
+    avg_extracted: float = Field(..., strict=True)
+    new_articles: int = Field(..., strict=True)
+    last_run_at: datetime = Field(..., strict=True)
+    last_http_status: Optional[int] = Field(None, strict=True)
+    last_error: Optional[str] = Field(None, strict=True)
+    last_extracted: int = Field(..., strict=True)
+    last_new_articles: int = Field(..., strict=True)
+
+
+class ProfileStatus(BaseModel):
+    path: Optional[str] = Field(None, strict=True)
+    remaining: int = Field(..., strict=True)
+    profiled: int = Field(..., strict=True)
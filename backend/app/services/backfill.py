@@ -0,0 +1,163 @@
+"""
+Re-extraction of articles from archived page snapshots.
+
+After a scraper is fixed, running the current extraction code over the pages
+archived while it was broken recovers the articles it missed. Snapshots are
+parsed in worker processes; the articles not yet stored are inserted with the
+time the page was captured as `scraped_at`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+
+from loguru import logger
+from sqlalchemy import insert, tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.models import NewsKeyModel, NewsModel, SiteModel
+from app.services.scrape.base import FetchError, offline_pages
+from app.services.scraping_core import get_scraper
+from app.services.snapshot_archive import Snapshot, SnapshotArchive
+from app.services.url_keys import url_hash
+
+_BATCH_SIZE = 1000
+
+# (site slug, capture time, [(title, url), ...]) for one snapshot.
+_Extracted = tuple[str, datetime, list[tuple[str, str]]]
+
+
+@dataclass(frozen=True)
+class BackfillResult:
+    snapshots: int
+    articles: int
+    missing: int
+
+
+def _extract(task: tuple[str, Snapshot]) -> _Extracted:
+    """Run the site's current scraper over one archived page."""
+    root, snapshot = task
+    body = SnapshotArchive(Path(root), retention_days=1).load(snapshot.sha256)
+    html = body.decode(snapshot.encoding or "utf-8", errors="replace")
+
+    if (scraper := get_scraper(snapshot.site)) is None:
+        return snapshot.site, snapshot.captured_at, []
+
+    token = offline_pages.set({snapshot.url: html})
+    try:
+        articles = [(article.title, article.url) for article in scraper.iter_articles()]
+    except FetchError as exc:
+        # The scraper asked for a page that was not captured with this one.
+        logger.warning("Skipping snapshot of {url}: {exc}", url=snapshot.url, exc=exc)
+        articles = []
+    except ValueError as exc:
+        # The page has something the extraction can't handle; the others go on.
+        logger.warning(
+            "Failed to extract snapshot of {url}: {exc}", url=snapshot.url, exc=exc
+        )
+        articles = []
+    finally:
+        offline_pages.reset(token)
+
+    return snapshot.site, snapshot.captured_at, articles
+
+
+def backfill(
+    db: Session,
+    archive: SnapshotArchive,
+    *,
+    since: date | None = None,
+    until: date | None = None,
+    sites: Iterable[str] | None = None,
+    workers: int | None = None,
+    dry_run: bool = False,
+) -> BackfillResult:
+    """
+    Insert the articles found in archived snapshots that are not stored yet.
+
+    Each distinct page body is parsed once, at its earliest capture; an
+    article found in several snapshots gets the earliest capture time.
+
+    Args:
+        db: Database session.
+        archive: The snapshot archive to read.
+        since: First capture day to include.
+        until: Last capture day to include.
+        sites: Only these site slugs. Defaults to every archived site.
+        workers: Worker processes. Defaults to the number of CPUs.
+        dry_run: Count the missing articles without inserting them.
+    """
+    unique: dict[tuple[str, str, str], Snapshot] = {}
+    for snapshot in archive.snapshots(since, until, sites):
+        unique.setdefault((snapshot.site, snapshot.url, snapshot.sha256), snapshot)
+
+    logger.info("Re-extracting {count} archived pages", count=len(unique))
+    found: dict[tuple[str, str], tuple[str, datetime]] = {}
+    tasks = [(str(archive.root), snapshot) for snapshot in unique.values()]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for slug, captured_at, articles in pool.map(_extract, tasks, chunksize=8):
+            for title, url in articles:
+                known = found.get((slug, url))
+                if known is None or captured_at < known[1]:
+                    found[(slug, url)] = (title, captured_at)
+
+    slug_to_id = dict(db.query(SiteModel.slug, SiteModel.id).all())
+    candidates = [
+        {
+            "site_id": slug_to_id[slug],
+            "title": title,
+            "url": url,
+            "url_hash": url_hash(url),
+            "scraped_at": captured_at,
+            "last_seen_at": captured_at,
+        }
+        for (slug, url), (title, captured_at) in found.items()
+        if slug in slug_to_id
+    ]
+
+    missing = 0
+    for start in range(0, len(candidates), _BATCH_SIZE):
+        batch = candidates[start : start + _BATCH_SIZE]
+        existing = set(
+            db.query(NewsKeyModel.site_id, NewsKeyModel.url_hash)
+            .filter(
+                tuple_(NewsKeyModel.site_id, NewsKeyModel.url_hash).in_(
+                    [(row["site_id"], row["url_hash"]) for row in batch]
+                )
+            )
+            .all()
+        )
+        rows = [
+            row for row in batch if (row["site_id"], row["url_hash"]) not in existing
+        ]
+        if not rows or dry_run:
+            missing += len(rows)
+            continue
+
+        # The scraper may store some of these keys meanwhile: only the news
+        # whose key this statement wrote are inserted.
+        written = set(
+            db.execute(
+                postgresql.insert(NewsKeyModel)
+                .on_conflict_do_nothing()
+                .returning(NewsKeyModel.site_id, NewsKeyModel.url_hash),
+                [
+                    {"site_id": row["site_id"], "url_hash": row["url_hash"]}
+                    for row in rows
+                ],
+            ).tuples()
+        )
+        rows = [row for row in rows if (row["site_id"], row["url_hash"]) in written]
+        missing += len(rows)
+        if rows:
+            db.execute(insert(NewsModel), rows)
+        db.commit()
+
+    return BackfillResult(
+        snapshots=len(unique), articles=len(candidates), missing=missing
+    )
@@ -0,0 +1,146 @@
+"""
+Per-cycle deadline and cooperative cancellation for the scraper.
+
+A `CycleContext` is active while a scraping cycle runs. Blocking work such as
+HTTP requests goes through `run_cancellable`, which returns control to the
+cycle as soon as the context is cancelled or its deadline passes, instead of
+waiting for the request timeout.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+from app import profiling
+
+T = TypeVar("T")
+
+
+class CycleCancelled(Exception):
+    """Raised when the running cycle was cancelled, e.g. on shutdown."""
+
+
+class CycleDeadlineExceeded(CycleCancelled):
+    """Raised when the running cycle ran past its deadline."""
+
+
+class CycleContext:
+    """
+    Deadline and cancellation flag of one scraping cycle.
+
+    Args:
+        deadline_seconds: Time budget of the cycle. None means no deadline.
+    """
+
+    def __init__(self, deadline_seconds: float | None) -> None:
+        self._deadline = (
+            None if deadline_seconds is None else time.monotonic() + deadline_seconds
+        )
+        self._cancelled = threading.Event()
+        self._waiters: set[threading.Event] = set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def remaining(self) -> float | None:
+        """Return the seconds left before the deadline, or None without one."""
+        if self._deadline is None:
+            return None
+        return max(self._deadline - time.monotonic(), 0.0)
+
+    def expired(self) -> bool:
+        return self._deadline is not None and time.monotonic() >= self._deadline
+
+    def cancel(self) -> None:
+        """
+        Cancel the cycle and wake everything waiting on it.
+
+        Takes no lock, so it is safe in a signal handler that interrupted the
+        very thread waiting in `run()`.
+        """
+        self._cancelled.set()
+        for waiter in list(self._waiters):
+            waiter.set()
+
+    def check(self) -> None:
+        """
+        Raise if the cycle should stop.
+
+        Raises:
+            CycleCancelled: If the cycle was cancelled.
+            CycleDeadlineExceeded: If the deadline passed.
+        """
+        if self.cancelled:
+            raise CycleCancelled("Scraping cycle cancelled")
+        if self.expired():
+            raise CycleDeadlineExceeded("Scraping cycle deadline exceeded")
+
+    def wait(self, seconds: float) -> bool:
+        """
+        Sleep up to `seconds`, bounded by the deadline.
+
+        Returns:
+            True if the cycle was cancelled or its deadline passed meanwhile.
+        """
+        if (remaining := self.remaining()) is not None:
+            seconds = min(seconds, remaining)
+        self._cancelled.wait(timeout=seconds)
+        return self.cancelled or self.expired()
+
+    def run(self, fn: Callable[[], T]) -> T:
+        """
+        Run blocking `fn` on a daemon thread and wait for it cancellably.
+
+        If the cycle is cancelled or its deadline passes first, the call is
+        abandoned: it finishes on its own thread and its result is dropped.
+
+        Raises:
+            CycleCancelled: If the cycle stopped before `fn` finished.
+        """
+        done = threading.Event()
+        outcome: dict[str, Any] = {}
+        labels = profiling.current_labels()
+
+        def target() -> None:
+            try:
+                with profiling.section(*labels):
+                    outcome["result"] = fn()
+            except BaseException as exc:
+                outcome["error"] = exc
+            finally:
+                done.set()
+
+        self.check()
+        self._waiters.add(done)
+        try:
+            # A cancel() that ran before the waiter was added could not wake it.
+            self.check()
+            threading.Thread(target=target, name="cancellable", daemon=True).start()
+            done.wait(timeout=self.remaining())
+        finally:
+            self._waiters.discard(done)
+
+        if "error" in outcome:
+            raise outcome["error"]
+        if "result" in outcome:
+            return outcome["result"]
+
+        self.check()
+        raise CycleDeadlineExceeded("Scraping cycle deadline exceeded")
+
+
+current_cycle: ContextVar[CycleContext | None] = ContextVar(
+    "current_cycle", default=None
+)
+
+
+def run_cancellable(fn: Callable[[], T]) -> T:
+    """Run `fn` under the active cycle's cancellation, or directly without one."""
+    if (cycle := current_cycle.get()) is None:
+        return fn()
+    return cycle.run(fn)
@@ -0,0 +1,190 @@
+"""
+Monthly partitions of the `news` table.
+
+`news` is range-partitioned by `scraped_at`, one partition per calendar month
+in UTC named `news_yYYYYmMM`, so each index only covers a month of rows and
+`/news` queries with a `time_range` only scan the months they reach. The
+scraper creates the partitions of the coming months ahead of time.
+
+Partitions older than the retention are detached, exported to a
+gzip-compressed CSV (`COPY ... TO STDOUT`, loadable back with `COPY FROM`)
+and dropped by `archive_news.py`.
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+import re
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+from loguru import logger
+from sqlalchemy import Connection, text
+from sqlalchemy.orm import Session
+
+# Serializes partition DDL between scraper replicas.
+_ADVISORY_LOCK_KEY = 0x6E657773  # "news"
+
+_PARTITION_NAME = re.compile(r"^news_y(\d{4})m(\d{2})$")
+
+
+def month_start(moment: datetime) -> date:
+    """First day of the UTC month containing `moment`."""
+    moment = moment.astimezone(timezone.utc)
+    return date(moment.year, moment.month, 1)
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"news_y{month.year:04d}m{month.month:02d}"
+
+
+def _partition_month(name: str) -> date | None:
+    if (match := _PARTITION_NAME.match(name)) is None:
+        return None
+    return date(int(match[1]), int(match[2]), 1)
+
+
+def _utc_midnight(day: date) -> str:
+    return datetime(day.year, day.month, day.day, tzinfo=timezone.utc).isoformat()
+
+
+def attached_partitions(conn: Session | Connection) -> dict[date, str]:
+    """The monthly partitions currently attached to `news`, by month."""
+    names = conn.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = 'news'::regclass"
+        )
+    ).scalars()
+    return {
+        month: name for name in names if (month := _partition_month(name)) is not None
+    }
+
+
+def create_partitions(conn: Session | Connection, first: date, last: date) -> list[str]:
+    """
+    Create the missing monthly partitions from `first` through `last`.
+
+    Returns:
+        The names of the partitions created.
+    """
+    conn.execute(
+        text("SELECT pg_advisory_xact_lock(:key)"), {"key": _ADVISORY_LOCK_KEY}
+    )
+    existing = attached_partitions(conn)
+
+    created = []
+    month = date(first.year, first.month, 1)
+    while month <= last:
+        if month not in existing:
+            name = partition_name(month)
+            # DDL takes no bind parameters; the name and bounds are generated here.
+            conn.execute(
+                text(
+                    f"CREATE TABLE {name} PARTITION OF news FOR VALUES "
+                    f"FROM ('{_utc_midnight(month)}') "
+                    f"TO ('{_utc_midnight(add_months(month, 1))}')"
+                )
+            )
+            created.append(name)
+        month = add_months(month, 1)
+    return created
+
+
+def ensure_partitions(
+    db: Session, now: datetime | None = None, months_ahead: int = 3
+) -> list[str]:
+    """
+    Make sure `news` has partitions for this month and the next `months_ahead`.
+
+    A no-op on databases other than PostgreSQL, where `news` is a plain table.
+    The caller commits.
+
+    Returns:
+        The names of the partitions created.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return []
+
+    current = month_start(now or datetime.now(timezone.utc))
+    return create_partitions(db, current, add_months(current, months_ahead))
+
+
+def _detached_partitions(db: Session) -> dict[date, str]:
+    """Monthly tables left detached by an archival that didn't finish."""
+    names = db.execute(
+        text(
+            "SELECT tablename FROM pg_tables "
+            "WHERE schemaname = current_schema() AND tablename LIKE 'news\\_y%'"
+        )
+    ).scalars()
+    attached = set(attached_partitions(db).values())
+    return {
+        month: name
+        for name in names
+        if name not in attached and (month := _partition_month(name)) is not None
+    }
+
+
+def _export(db: Session, name: str, path: Path) -> None:
+    """COPY a table into a gzip-compressed CSV, replacing `path` atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(path.name + ".partial")
+    cursor = db.connection().connection.cursor()
+    with open(partial, "wb") as raw:
+        with gzip.GzipFile(fileobj=raw, mode="wb") as compressed:
+            cursor.copy_expert(
+                f"COPY {name} TO STDOUT WITH (FORMAT csv, HEADER)", compressed
+            )
+        raw.flush()
+        # The partition is dropped next, so the export must be on disk first.
+        os.fsync(raw.fileno())
+    os.replace(partial, path)
+
+
+def archive_expired_partitions(
+    db: Session,
+    retention_months: int,
+    archive_dir: Path,
+    now: datetime | None = None,
+) -> list[Path]:
+    """
+    Archive and drop the partitions older than `retention_months` full months.
+
+    Each partition is detached in its own transaction, so `/news` stops
+    reading it right away, then exported to `archive_dir` and dropped.
+    Partitions left detached by an earlier run that failed are picked up too.
+
+    Returns:
+        The archive files written.
+    """
+    cutoff = add_months(
+        month_start(now or datetime.now(timezone.utc)), -retention_months
+    )
+
+    for month, name in sorted(attached_partitions(db).items()):
+        if month < cutoff:
+            db.execute(text(f"ALTER TABLE news DETACH PARTITION {name}"))
+            db.commit()
+            logger.info("Detached partition {name}", name=name)
+
+    written = []
+    for month, name in sorted(_detached_partitions(db).items()):
+        if month >= cutoff:
+            continue
+
+        path = archive_dir / f"{name}.csv.gz"
+        _export(db, name, path)
+        db.execute(text(f"DROP TABLE {name}"))
+        db.commit()
+        logger.info("Archived partition {name} to {path}", name=name, path=path)
+        written.append(path)
+
+    return written
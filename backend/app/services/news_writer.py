@@ -0,0 +1,357 @@
+"""
+Background writer that stores the articles extracted during a cycle.
+
+Scraping a site and storing its articles used to alternate in one loop and one
+transaction per cycle: a slow database held up fetching, and nothing became
+visible until the whole cycle committed. Sites are now handed to a
+`NewsWriter` through a bounded queue; its thread deduplicates and stores them
+with its own session, committing in batches while the next sites are fetched.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import update
+from sqlalchemy.exc import DBAPIError, IntegrityError, OperationalError
+from sqlalchemy.orm import Session
+
+from app.metrics import (
+    SCRAPE_ARTICLES,
+    SCRAPE_COMMIT_SECONDS,
+    SCRAPE_RECENT_URLS,
+    SCRAPE_STAGE_SECONDS,
+    SCRAPE_WRITER_BATCHES,
+    SCRAPE_WRITER_LAG_SECONDS,
+    SCRAPE_WRITER_QUEUE,
+    SCRAPE_WRITER_WAIT_SECONDS,
+)
+from app.models import NewsKeyModel, NewsModel
+from app.services.recent_urls import RecentUrls
+from app.services.scrape.base import ArticleRecord, validate_articles
+from app.services.url_keys import url_hash
+
+# How often a blocked `submit()` or `close()` checks that the thread still runs.
+_POLL_SECONDS = 0.1
+
+
+@dataclass
+class SiteArticles:
+    """Articles extracted from one site's pages, waiting to be stored."""
+
+    slug: str
+    site_id: int
+    articles: list[ArticleRecord]
+    scraped_at: datetime
+    _submitted: float = field(default_factory=time.perf_counter, repr=False)
+
+
+@dataclass
+class WriteResult:
+    """What storing a site's articles came to; `error` is set if it failed."""
+
+    new_articles: int = 0
+    error: str | None = None
+
+
+@dataclass
+class _Staged:
+    item: SiteArticles
+    new_keys: list[UUID]
+    recent: int
+    known: int
+    invalid: int
+
+
+def mark_seen(db: Session, site_id: int, keys: list[UUID], seen_at: datetime) -> None:
+    """Record that stored articles are still on the site's page, in one UPDATE."""
+    db.execute(
+        update(NewsModel)
+        .where(NewsModel.site_id == site_id, NewsModel.url_hash.in_(keys))
+        .values(last_seen_at=seen_at, seen_count=NewsModel.seen_count + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _is_transient(exc: Exception) -> bool:
+    """Whether writing the batch again may succeed."""
+    if isinstance(exc, DBAPIError) and exc.connection_invalidated:
+        return True
+    # An IntegrityError is a key stored concurrently by another process;
+    # deduplicating again skips it.
+    return isinstance(exc, (OperationalError, IntegrityError))
+
+
+class NewsWriter:
+    """
+    Stores the articles of the sites submitted to it from a background thread.
+
+    Sites are stored in batches of about `batch_size` articles, or whatever
+    arrived within `batch_seconds` of the first one, each batch in its own
+    transaction. `submit()` blocks while `queue_size` sites are waiting, so a
+    slow database slows fetching down instead of piling up extracted pages.
+    A batch failing with a transient error (lost connection, lock timeout,
+    concurrent insert) is rolled back and written again up to `max_retries`
+    times; otherwise its sites are reported as failed. If the thread itself
+    dies, the sites it was writing or had yet to write are reported as failed,
+    and so are those submitted afterwards, without blocking.
+
+    Args:
+        session_factory: Creates the writer's session, used only by its thread.
+        recent_urls: Filter of recently stored keys, checked before querying
+            and updated after each commit.
+        queue_size: Sites that may wait to be stored before `submit()` blocks.
+        batch_size: Articles that end a batch.
+        batch_seconds: Longest a site waits for others to join its batch.
+        max_retries: Attempts to write a batch again after a transient error.
+        retry_delay: Delay before the first retry; doubled on each attempt.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        recent_urls: RecentUrls,
+        *,
+        queue_size: int,
+        batch_size: int,
+        batch_seconds: float,
+        max_retries: int,
+        retry_delay: float,
+    ) -> None:
+        self.session_factory = session_factory
+        self.recent_urls = recent_urls
+        self.batch_size = batch_size
+        self.batch_seconds = batch_seconds
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.results: dict[str, WriteResult] = {}
+        self._queue: queue.Queue[SiteArticles | None] = queue.Queue(maxsize=queue_size)
+        self._thread: threading.Thread | None = None
+        # Why the thread died, if it did.
+        self._error: str | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="news-writer", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, item: SiteArticles) -> None:
+        """Queue a site's articles, waiting while the queue is full."""
+        start = time.perf_counter()
+        if not self._put(item):
+            self._fail([item], self._error or "WriterStopped")
+        SCRAPE_WRITER_WAIT_SECONDS.observe(time.perf_counter() - start)
+        SCRAPE_WRITER_QUEUE.set(self._queue.qsize())
+
+    def close(self) -> dict[str, WriteResult]:
+        """
+        Wait until every submitted site is stored and stop the thread.
+
+        Returns:
+            The result of each submitted site, by slug, adding up the site's
+            submissions; it has an error if any of them failed.
+        """
+        if self._thread is not None:
+            self._put(None)
+            self._thread.join()
+            self._thread = None
+        # Sites queued while the thread was dying were never written.
+        self._fail(self._drain(), self._error or "WriterStopped")
+        SCRAPE_WRITER_QUEUE.set(0)
+        return self.results
+
+    def _put(self, item: SiteArticles | None) -> bool:
+        """
+        Queue an item while the thread runs, waiting while the queue is full.
+
+        Returns:
+            False if the thread is not running, so nothing would take the item.
+        """
+        while self._thread is not None and self._thread.is_alive():
+            try:
+                self._queue.put(item, timeout=_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _drain(self) -> list[SiteArticles]:
+        items = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return items
+            if item is not None:
+                items.append(item)
+
+    def _fail(self, items: list[SiteArticles], error: str) -> None:
+        for item in items:
+            self.results.setdefault(item.slug, WriteResult()).error = error
+
+    def _run(self) -> None:
+        batch: list[SiteArticles] = []
+        try:
+            with self.session_factory() as db:
+                while True:
+                    batch, stopping = self._next_batch()
+                    if batch:
+                        self._write(db, batch)
+                        batch = []
+                    if stopping:
+                        return
+        except Exception as exc:
+            self._error = type(exc).__name__
+            SCRAPE_WRITER_BATCHES.labels(outcome="failed").inc()
+            logger.exception("News writer stopped: {exc}", exc=exc)
+            self._fail(batch + self._drain(), self._error)
+
+    def _next_batch(self) -> tuple[list[SiteArticles], bool]:
+        """Wait for a site, then gather more until the batch is full or due.
+
+        Returns:
+            The batch and whether the writer was asked to stop.
+        """
+        first = self._queue.get()
+        if first is None:
+            return [], True
+
+        batch = [first]
+        size = len(first.articles)
+        deadline = time.monotonic() + self.batch_seconds
+        while size < self.batch_size:
+            try:
+                item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+            size += len(item.articles)
+
+        SCRAPE_WRITER_QUEUE.set(self._queue.qsize())
+        return batch, False
+
+    def _write(self, db: Session, batch: list[SiteArticles]) -> None:
+        """Store a batch in one transaction, retrying transient errors."""
+        slugs = ", ".join(item.slug for item in batch)
+        validated = [validate_articles(item.articles) for item in batch]
+        attempt = 0
+        while True:
+            try:
+                staged = [
+                    self._stage(db, item, articles, invalid)
+                    for item, (articles, invalid) in zip(batch, validated)
+                ]
+                with SCRAPE_COMMIT_SECONDS.time():
+                    db.commit()
+                break
+            except Exception as exc:
+                db.rollback()
+                if not _is_transient(exc) or attempt >= self.max_retries:
+                    SCRAPE_WRITER_BATCHES.labels(outcome="failed").inc()
+                    logger.error(
+                        "Failed to store the articles of {slugs}: {exc}",
+                        slugs=slugs,
+                        exc=exc,
+                    )
+                    self._fail(batch, type(exc).__name__)
+                    return
+
+                delay = self.retry_delay * 2**attempt
+                attempt += 1
+                SCRAPE_WRITER_BATCHES.labels(outcome="retried").inc()
+                logger.warning(
+                    "Attempt {attempt} to store the articles of {slugs} failed, "
+                    "retrying in {delay:.2f}s: {exc}",
+                    attempt=attempt,
+                    slugs=slugs,
+                    delay=delay,
+                    exc=exc,
+                )
+                time.sleep(delay)
+
+        SCRAPE_WRITER_BATCHES.labels(outcome="committed").inc()
+        for entry in staged:
+            self._record(entry)
+        SCRAPE_RECENT_URLS.set(len(self.recent_urls))
+
+    def _stage(
+        self,
+        db: Session,
+        item: SiteArticles,
+        articles: list[ArticleRecord],
+        invalid: int,
+    ) -> _Staged:
+        """Add a site's new articles to the session and mark the others seen."""
+        start = time.perf_counter()
+        site_id = item.site_id
+        by_hash: dict[UUID, ArticleRecord] = {}
+        for article in articles:
+            by_hash.setdefault(url_hash(article.url), article)
+
+        unseen = [key for key in by_hash if not self.recent_urls.seen(site_id, key)]
+        known: set[UUID] = set()
+        if unseen:
+            known = {
+                key
+                for (key,) in db.query(NewsKeyModel.url_hash).filter(
+                    NewsKeyModel.site_id == site_id,
+                    NewsKeyModel.url_hash.in_(unseen),
+                )
+            }
+            self.recent_urls.add(site_id, known)
+
+        new_keys = [key for key in unseen if key not in known]
+        for key in new_keys:
+            article = by_hash[key]
+            db.add(NewsKeyModel(site_id=site_id, url_hash=key))
+            db.add(
+                NewsModel(
+                    site_id=site_id,
+                    title=article.title,
+                    url=article.url,
+                    url_hash=key,
+                    scraped_at=item.scraped_at,
+                    last_seen_at=item.scraped_at,
+                    published_at=article.published_at,
+                )
+            )
+
+        if len(new_keys) < len(by_hash):
+            new = set(new_keys)
+            reseen = [key for key in by_hash if key not in new]
+            mark_seen(db, site_id, reseen, item.scraped_at)
+
+        SCRAPE_STAGE_SECONDS.labels(site=item.slug, stage="dedupe").observe(
+            time.perf_counter() - start
+        )
+        return _Staged(item, new_keys, len(by_hash) - len(unseen), len(known), invalid)
+
+    def _record(self, entry: _Staged) -> None:
+        """Account for a committed site."""
+        item = entry.item
+        new_for_site = len(entry.new_keys)
+        self.recent_urls.add(item.site_id, entry.new_keys)
+        self.results.setdefault(item.slug, WriteResult()).new_articles += new_for_site
+
+        SCRAPE_ARTICLES.labels(site=item.slug, outcome="new").inc(new_for_site)
+        SCRAPE_ARTICLES.labels(site=item.slug, outcome="recent").inc(entry.recent)
+        SCRAPE_ARTICLES.labels(site=item.slug, outcome="known").inc(entry.known)
+        SCRAPE_ARTICLES.labels(site=item.slug, outcome="invalid").inc(entry.invalid)
+        SCRAPE_WRITER_LAG_SECONDS.observe(time.perf_counter() - item._submitted)
+
+        if new_for_site:
+            logger.info(
+                "Inserted {count} new articles for site {slug}",
+                count=new_for_site,
+                slug=item.slug,
+            )
@@ -0,0 +1,95 @@
+"""
+In-memory filter of the article URLs the scraper stored recently.
+
+Most articles on a homepage were already there the previous cycle. Keeping
+the keys of recently stored articles in memory lets the scraper drop those
+before any database round trip; only the rest is looked up in `news_keys`.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.models import NewsModel
+
+
+class RecentUrls:
+    """
+    Bounded set of `(site_id, url_hash)` keys, evicting the least recently seen.
+
+    Keys are packed into one integer: the site id above the first 64 bits of
+    the hash. Two URLs of a site would have to share those 64 bits to be
+    confused, which at 100,000 keys has a probability below 1e-9. Memory stays
+    at roughly 150 bytes per key up to `capacity`.
+
+    Only keys known to be stored may be added: a hit is trusted without
+    checking the database, while a miss falls back to it.
+
+    Args:
+        capacity: Maximum number of keys kept. 0 disables the filter.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._keys: OrderedDict[int, None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @staticmethod
+    def _pack(site_id: int, key: UUID) -> int:
+        return site_id << 64 | key.int >> 64
+
+    def seen(self, site_id: int, key: UUID) -> bool:
+        """Whether the key was stored recently; a hit counts as a new sighting."""
+        packed = self._pack(site_id, key)
+        with self._lock:
+            if packed not in self._keys:
+                return False
+            self._keys.move_to_end(packed)
+            return True
+
+    def add(self, site_id: int, keys: Iterable[UUID]) -> None:
+        """Remember stored keys, evicting the oldest beyond the capacity."""
+        if self.capacity <= 0:
+            return
+
+        with self._lock:
+            for key in keys:
+                packed = self._pack(site_id, key)
+                self._keys[packed] = None
+                self._keys.move_to_end(packed)
+            while len(self._keys) > self.capacity:
+                self._keys.popitem(last=False)
+
+    def warm(self, db: Session, days: int, now: datetime | None = None) -> int:
+        """
+        Load the keys of the articles scraped in the last `days` days.
+
+        At most `capacity` keys are loaded, the most recent ones.
+
+        Returns:
+            The number of keys loaded.
+        """
+        if self.capacity <= 0:
+            return 0
+
+        since = (now or datetime.now(timezone.utc)) - timedelta(days=days)
+        rows = (
+            db.query(NewsModel.site_id, NewsModel.url_hash)
+            .filter(NewsModel.scraped_at >= since)
+            .order_by(NewsModel.scraped_at.desc())
+            .limit(self.capacity)
+            .all()
+        )
+        # Oldest first, so the most recent articles are evicted last.
+        for site_id, key in reversed(rows):
+            self.add(site_id, [key])
+        return len(rows)
@@ -0,0 +1,78 @@
+"""
+Deferred retries for failed site fetches within a scraping cycle.
+
+Instead of sleeping through the backoff inside the fetch, a failed site is
+parked here with its backoff deadline and the cycle moves on to other sites.
+"""
+
+from __future__ import annotations
+
+import heapq
+import random
+import time
+
+
+class RetryQueue:
+    """
+    Delay queue of sites waiting to be fetched again.
+
+    Args:
+        max_retries: Retries allowed per site.
+        budget: Retries allowed in total for the cycle, so one flaky host
+            cannot consume the whole interval.
+        base_delay: Delay before the first retry; doubled on each attempt.
+    """
+
+    def __init__(self, *, max_retries: int, budget: int, base_delay: float) -> None:
+        self.max_retries = max_retries
+        self.budget = budget
+        self.base_delay = base_delay
+        self._attempts: dict[str, int] = {}
+        self._heap: list[tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def schedule(self, slug: str, now: float | None = None) -> float | None:
+        """
+        Park a failed site until its backoff deadline.
+
+        Returns:
+            The backoff delay, or None if the site's retries or the cycle's
+            budget are exhausted.
+        """
+        attempt = self._attempts.get(slug, 0)
+        if attempt >= self.max_retries or self.budget <= 0:
+            return None
+
+        now = time.monotonic() if now is None else now
+        delay = self.base_delay * (2**attempt) + random.uniform(0, 1)
+        self._attempts[slug] = attempt + 1
+        self.budget -= 1
+        heapq.heappush(self._heap, (now + delay, slug))
+        return delay
+
+    def attempts(self, slug: str) -> int:
+        """Return how many retries a site has been given this cycle."""
+        return self._attempts.get(slug, 0)
+
+    def pop_ready(self, now: float | None = None) -> str | None:
+        """Return the site whose deadline passed first, if any."""
+        now = time.monotonic() if now is None else now
+        if self._heap and self._heap[0][0] <= now:
+            return heapq.heappop(self._heap)[1]
+        return None
+
+    def seconds_until_next(self, now: float | None = None) -> float:
+        """Return how long until the earliest deadline (0 if already due)."""
+        if not self._heap:
+            return 0.0
+
+        now = time.monotonic() if now is None else now
+        return max(self._heap[0][0] - now, 0.0)
+
+    def drain(self) -> list[str]:
+        """Remove and return every parked site."""
+        slugs = [slug for _, slug in self._heap]
+        self._heap.clear()
+        return slugs
@@ -0,0 +1,123 @@
+"""
+Adaptive per-site polling schedule.
+
+Each site's poll interval follows the rate at which it publishes new articles:
+fast-moving sites are polled more often and quiet ones back off, always within
+the configured bounds and with jitter so sites don't fire in lockstep.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+# Weight of the newest observation in the moving average of the article rate.
+_RATE_SMOOTHING = 0.3
+# Interval growth factor when a site has shown no new articles at all.
+_IDLE_BACKOFF = 1.5
+
+
+@dataclass
+class _SiteSchedule:
+    interval: float
+    next_due: float
+    last_run: float | None = None
+    rate: float | None = None
+
+
+class AdaptiveScheduler:
+    """
+    Tracks when each site is due and adapts its interval to its change rate.
+
+    Args:
+        slugs: Sites to schedule. All of them are due immediately.
+        base_interval: Interval used until a site's rate is known.
+        min_interval: Lower bound for any site's interval.
+        max_interval: Upper bound for any site's interval.
+        jitter: Fraction of the interval randomly added or removed.
+        target_new_per_poll: Number of new articles a poll should find on
+            average; the interval is chosen so the observed rate yields it.
+    """
+
+    def __init__(
+        self,
+        slugs: Iterable[str],
+        *,
+        base_interval: float,
+        min_interval: float,
+        max_interval: float,
+        jitter: float = 0.0,
+        target_new_per_poll: float = 1.0,
+    ) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.jitter = jitter
+        self.target_new_per_poll = target_new_per_poll
+        start = self._clamp(base_interval)
+        self._sites = {
+            slug: _SiteSchedule(interval=start, next_due=0.0) for slug in slugs
+        }
+
+    def due_sites(self, now: float | None = None) -> list[str]:
+        """Return the sites that are due, most overdue first."""
+        now = time.monotonic() if now is None else now
+        due = [
+            (schedule.next_due, slug)
+            for slug, schedule in self._sites.items()
+            if schedule.next_due <= now
+        ]
+        return [slug for _, slug in sorted(due)]
+
+    def seconds_until_next(self, now: float | None = None) -> float:
+        """Return how long until the next site is due (0 if one already is)."""
+        if not self._sites:
+            return self.max_interval
+
+        now = time.monotonic() if now is None else now
+        next_due = min(schedule.next_due for schedule in self._sites.values())
+        return max(next_due - now, 0.0)
+
+    def interval_for(self, slug: str) -> float:
+        """Return the current interval of a site."""
+        return self._sites[slug].interval
+
+    def record(self, slug: str, new_articles: int, now: float | None = None) -> float:
+        """
+        Record a finished poll and schedule the site's next one.
+
+        Args:
+            slug: The site that was polled.
+            new_articles: How many articles the poll found that were not stored.
+            now: Monotonic time of the poll. Defaults to the current time.
+
+        Returns:
+            The delay until the site is due again, jitter included.
+        """
+        now = time.monotonic() if now is None else now
+        schedule = self._sites[slug]
+
+        # The first poll of a site finds its whole backlog, not its rate.
+        if schedule.last_run is not None and (elapsed := now - schedule.last_run) > 0:
+            observed = new_articles / elapsed
+            schedule.rate = (
+                observed
+                if schedule.rate is None
+                else _RATE_SMOOTHING * observed + (1 - _RATE_SMOOTHING) * schedule.rate
+            )
+
+            if schedule.rate > 0:
+                schedule.interval = self._clamp(
+                    self.target_new_per_poll / schedule.rate
+                )
+            else:
+                schedule.interval = self._clamp(schedule.interval * _IDLE_BACKOFF)
+
+        schedule.last_run = now
+        delay = schedule.interval * (1 + random.uniform(-self.jitter, self.jitter))
+        schedule.next_due = now + delay
+        return delay
+
+    def _clamp(self, interval: float) -> float:
+        return min(max(interval, self.min_interval), self.max_interval)
@@ -3,14 +3,38 @@ from __future__ import annotations
 import random
 import time
 from abc import ABC, abstractmethod
-from urllib.parse import urlparse
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Annotated
+from urllib.parse import urljoin, urlparse
 
 import requests
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from loguru import logger
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
+from app import profiling
 from app.config import settings
+from app.metrics import (
+    SCRAPE_ARTICLES,
+    SCRAPE_ELEMENTS,
+    SCRAPE_FETCH_ERRORS,
+    SCRAPE_RESPONSE_BYTES,
+    SCRAPE_SECTION_ARTICLES,
+    SCRAPE_SECTIONS,
+    SCRAPE_STAGE_SECONDS,
+)
+from app.services.cancellation import run_cancellable
+from app.services.scrape.circuit_breaker import HostCircuitBreaker
+from app.services.scrape.hedging import HedgeBudget, LatencyTracker, hedged_call
+from app.services.scrape.host_limits import HostLimiter
+from app.services.scrape_runs import ScrapeRun, current_run
+from app.services.snapshot_archive import SnapshotArchive
+from app.services.url_keys import canonical_url
 
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -31,82 +55,366 @@ def get_random_headers() -> dict[str, str]:
     }
 
 
+host_limiter = HostLimiter(settings.scrape_host_concurrency)
+
+circuit_breaker = HostCircuitBreaker(
+    failure_threshold=settings.circuit_failure_threshold,
+    cooldown_seconds=settings.circuit_cooldown_seconds,
+)
+
+hedge_budget = HedgeBudget(max_ratio=settings.hedge_max_ratio)
+_hedge_executor: ThreadPoolExecutor | None = None
+
+snapshot_archive = (
+    SnapshotArchive(
+        Path(settings.snapshot_archive_dir), settings.snapshot_retention_days
+    )
+    if settings.snapshot_archive_dir
+    else None
+)
+
+# Page bodies by URL served instead of the network, used to re-extract
+# articles from archived snapshots.
+offline_pages: ContextVar[Mapping[str, str] | None] = ContextVar(
+    "offline_pages", default=None
+)
+
+
+# Bounds of the `news` columns the title and URL are stored in.
+ArticleTitle = Annotated[str, Field(min_length=1, max_length=500)]
+ArticleUrl = Annotated[str, Field(min_length=1, max_length=1000)]
+
+
+@dataclass(slots=True)
+class ArticleRecord:
+    """
+    An article as extracted from a page, not validated yet.
+
+    Scrapers build one per candidate element and most are filtered out right
+    away, so it is a plain slotted record; records are validated in bulk with
+    `validate_articles` once they are about to be stored.
+    """
+
+    title: str
+    url: str
+    published_at: datetime | None = None
+
+
 class ScrapedArticle(BaseModel):
-    title: str = Field(..., min_length=1)
-    url: str = Field(..., min_length=1)
+    title: ArticleTitle
+    url: ArticleUrl
+
+
+_ARTICLE_FIELDS = TypeAdapter(list[tuple[ArticleTitle, ArticleUrl]])
+
+
+def validate_articles(
+    records: list[ArticleRecord],
+) -> tuple[list[ArticleRecord], int]:
+    """
+    Validates a batch of extracted articles in a single call.
+
+    Records that fail validation, such as a title longer than the `news`
+    column, are dropped rather than failing the whole batch.
+
+    Returns:
+        The valid records and the number of records dropped.
+    """
+    try:
+        _ARTICLE_FIELDS.validate_python([(r.title, r.url) for r in records])
+        return records, 0
+    except ValidationError as exc:
+        invalid = {error["loc"][0] for error in exc.errors()}
+
+    valid = [record for index, record in enumerate(records) if index not in invalid]
+    return valid, len(invalid)
 
 
 class Scraper(ABC):
     base_url: str
-    default_tag: str = "a"
+    default_tag: str | list[str] = "a"
     min_title_length: int = 20
     deduplicate_urls: bool = True
     allowed_domains: list[str] = []
+    # Pages scraped after the homepage, such as the site's news sections.
+    section_urls: list[str] = []
+
+    def __init__(self, slug: str | None = None) -> None:
+        self.slug = slug or type(self).__name__.removesuffix("Scraper").lower()
+        self.latency = LatencyTracker(min_samples=settings.hedge_min_samples)
 
     def fetch_elements(
         self,
         *,
         url: str | None = None,
-        tag: str | None = None,
-    ) -> list[Tag] | None:
+        tag: str | list[str] | None = None,
+    ) -> list[Tag]:
         """
         Fetches all elements with the given tag from the given URL.
 
         Args:
             url: The URL to fetch elements from. Defaults to None.
-            tag: The tag to fetch elements with. Defaults to None.
+            tag: The tag, or tags, to fetch elements with. Defaults to None.
 
         Returns:
-            A list of Tag objects, or None if the fetch fails.
+            A list of Tag objects.
+
+        Raises:
+            FetchError: If the fetch fails.
         """
         target_url = url or self.base_url
         target_tag = tag or self.default_tag
         return fetch_elements(
-            target_url, tag=target_tag, allowed_domains=self.allowed_domains
+            target_url,
+            tag=target_tag,
+            allowed_domains=self.allowed_domains,
+            latency=self.latency,
+            site=self.slug,
         )
 
-    def scrape(self) -> list[ScrapedArticle]:
+    def scrape(self) -> list[ArticleRecord]:
         """
         Scrapes articles from the site using the template method pattern.
 
         Returns:
-            A list of ScrapedArticle objects.
+            A list of ArticleRecord objects.
+
+        Raises:
+            FetchError: If the page could not be fetched.
         """
-        if (elements := self.get_elements()) is None:
-            return []
+        return list(self.iter_articles())
 
-        articles: list[ScrapedArticle] = []
-        seen_urls: set[str] = set()
+    def iter_articles(self, limit: int | None = None) -> Iterator[ArticleRecord]:
+        """
+        Yields the site's articles as they are extracted from its pages.
 
-        for element in elements:
-            if (article := self.extract_article(element)) is None:
-                continue
+        Pages are fetched on the first `next()`. Their parse trees are released
+        as soon as extraction ends, whether all elements were visited, `limit`
+        articles were yielded or the caller stopped iterating.
 
-            if len(article.title) < self.min_title_length:
-                continue
+        Sites with `section_urls` have all their pages fetched in parallel, and
+        articles found on an earlier page are dropped from the later ones.
 
-            if " " not in article.title:
-                continue
+        Args:
+            limit: Stop after this many articles. Defaults to None, no limit.
 
-            if self.deduplicate_urls and article.url in seen_urls:
-                continue
+        Yields:
+            ArticleRecord objects, with canonical URLs.
 
-            seen_urls.add(article.url)
-            articles.append(article)
+        Raises:
+            FetchError: If the page, or the homepage of a site with sections,
+                could not be fetched.
+        """
+        if (urls := self.page_urls()) != [self.base_url]:
+            yield from self._iter_pages(urls, limit)
+            return
 
-        return articles
+        with profiling.section(self.slug, "fetch"):
+            elements = self.get_elements()
+
+        if elements is None:
+            return
+
+        try:
+            yield from self.accept_articles(map(self.extract_article, elements), limit)
+        finally:
+            SCRAPE_ELEMENTS.labels(site=self.slug).inc(len(elements))
+            if (run := current_run.get()) is not None:
+                run.elements += len(elements)
+            _release_trees(elements)
+
+    def page_urls(self) -> list[str]:
+        """
+        The pages to scrape: the homepage, then the sections.
+
+        When re-extracting archived pages only those in the archive are
+        scraped, so a section can be re-extracted without its homepage.
+        """
+        urls = [self.base_url, *self.section_urls]
+        if (pages := offline_pages.get()) is not None:
+            urls = [url for url in urls if url in pages] or urls[:1]
+        return urls
+
+    def _iter_pages(
+        self, urls: list[str], limit: int | None
+    ) -> Iterator[ArticleRecord]:
+        """
+        Yields the articles of several pages, fetched in parallel.
+
+        Each host gets at most `SCRAPE_HOST_CONCURRENCY` workers, so the threads
+        grow with the hosts, not with the pages. Pages are extracted in order,
+        each as soon as it and the ones before it arrived, and their trees are
+        released one by one. Each page is fetched into a run of its own, added
+        to the site's run in page order, so the run's digest doesn't depend on
+        which fetch finished first. The first page must be fetched; a later one
+        that fails is skipped, and the site's run keeps the first page's
+        outcome.
+        """
+        run = current_run.get()
+        page_runs = [
+            ScrapeRun(site_id=run.site_id) if run is not None else None for _ in urls
+        ]
+        hosts = {urlparse(url).hostname for url in urls}
+        executor = ThreadPoolExecutor(
+            max_workers=min(len(urls), settings.scrape_host_concurrency * len(hosts)),
+            thread_name_prefix=f"pages-{self.slug}",
+        )
+        # Each fetch runs in a copy of this context, so within the same cycle.
+        futures = [
+            executor.submit(copy_context().run, self._fetch_page, url, page_run)
+            for url, page_run in zip(urls, page_runs)
+        ]
+        sections = [urlparse(url).path or "/" for url in urls]
+        current = 0
+
+        def candidates() -> Iterator[ArticleRecord | None]:
+            nonlocal current
+            for current, (url, future) in enumerate(zip(urls, futures)):
+                try:
+                    with profiling.section(self.slug, "fetch"):
+                        elements = future.result()
+                except FetchError as exc:
+                    if not current:
+                        if run is not None and page_runs[0] is not None:
+                            run.add_page(page_runs[0])
+                        raise
+                    SCRAPE_SECTIONS.labels(
+                        site=self.slug, section=sections[current], outcome="failed"
+                    ).inc()
+                    logger.warning(
+                        "Skipping section {url} of {slug}: {exc}",
+                        url=url,
+                        slug=self.slug,
+                        exc=exc,
+                    )
+                    continue
+
+                SCRAPE_SECTIONS.labels(
+                    site=self.slug, section=sections[current], outcome="fetched"
+                ).inc()
+                if run is not None and (page_run := page_runs[current]) is not None:
+                    run.add_page(page_run)
+                    run.elements += len(elements)
+                try:
+                    for article in map(self.extract_article, elements):
+                        # Links are relative to the page they were found on.
+                        if article is not None and url != self.base_url:
+                            article.url = urljoin(url, article.url.strip())
+                        yield article
+                finally:
+                    SCRAPE_ELEMENTS.labels(site=self.slug).inc(len(elements))
+                    _release_trees(elements)
+
+        pages = candidates()
+        try:
+            for article in self.accept_articles(pages, limit):
+                SCRAPE_SECTION_ARTICLES.labels(
+                    site=self.slug, section=sections[current]
+                ).inc()
+                yield article
+        finally:
+            pages.close()
+            executor.shutdown(wait=False, cancel_futures=True)
+            # Pages fetched but never extracted, once the caller stopped early.
+            for future in futures[current + 1 :]:
+                future.add_done_callback(_discard_page)
+
+    def _fetch_page(self, url: str, page_run: ScrapeRun | None) -> list[Tag]:
+        """Fetch one of the site's pages, recording it into `page_run`."""
+        current_run.set(page_run)
+        with profiling.section(self.slug, "fetch"):
+            return self.fetch_elements(url=url)
+
+    def accept_articles(
+        self, candidates: Iterable[ArticleRecord | None], limit: int | None = None
+    ) -> Iterator[ArticleRecord]:
+        """
+        Yields the candidates that pass the site's filters, as they arrive.
+
+        URLs are made canonical; malformed URLs, titles that are too short or a
+        single word and URLs already yielded are dropped. Candidates are
+        consumed lazily, so the time spent producing them counts as extraction
+        time.
+
+        Args:
+            candidates: Extracted articles, None for elements that were not one.
+            limit: Stop after this many articles. Defaults to None, no limit.
+
+        Yields:
+            ArticleRecord objects, with canonical URLs.
+        """
+        seen_urls: set[str] = set()
+        extracted = filtered = duplicates = yielded = 0
+        start = time.perf_counter()
+        suspended = 0.0
+
+        try:
+            with profiling.section(self.slug, "extract"):
+                for article in candidates:
+                    if article is None:
+                        continue
+
+                    extracted += 1
+                    try:
+                        article.url = canonical_url(article.url, self.base_url)
+                    except ValueError as exc:
+                        # A malformed href, such as an unclosed IPv6 host.
+                        logger.debug(
+                            "Dropping {slug} link {url}: {exc}",
+                            slug=self.slug,
+                            url=article.url,
+                            exc=exc,
+                        )
+                        filtered += 1
+                        continue
+
+                    if len(article.title) < self.min_title_length:
+                        filtered += 1
+                        continue
+
+                    if " " not in article.title:
+                        filtered += 1
+                        continue
+
+                    if self.deduplicate_urls and article.url in seen_urls:
+                        duplicates += 1
+                        continue
+
+                    seen_urls.add(article.url)
+                    paused = time.perf_counter()
+                    yield article
+                    suspended += time.perf_counter() - paused
+
+                    yielded += 1
+                    if limit is not None and yielded >= limit:
+                        logger.debug(
+                            "Stopped extracting {slug} at {limit} articles",
+                            slug=self.slug,
+                            limit=limit,
+                        )
+                        break
+        finally:
+            SCRAPE_STAGE_SECONDS.labels(site=self.slug, stage="extract").observe(
+                time.perf_counter() - start - suspended
+            )
+            SCRAPE_ARTICLES.labels(site=self.slug, outcome="extracted").inc(extracted)
+            SCRAPE_ARTICLES.labels(site=self.slug, outcome="filtered").inc(filtered)
+            SCRAPE_ARTICLES.labels(site=self.slug, outcome="duplicate").inc(duplicates)
 
     def get_elements(self) -> list[Tag] | None:
         """
         Gets elements to scrape. Override for custom element fetching.
 
         Returns:
-            A list of Tag objects, or None if the fetch fails.
+            A list of Tag objects, or None if there is nothing to scrape.
+
+        Raises:
+            FetchError: If the fetch fails.
         """
         return self.fetch_elements()
 
     @abstractmethod
-    def extract_article(self, element: Tag) -> ScrapedArticle | None:
+    def extract_article(self, element: Tag) -> ArticleRecord | None:
         """
         Extracts an article from an element.
 
@@ -114,7 +422,7 @@ class Scraper(ABC):
             element: The Tag element to extract the article from.
 
         Returns:
-            A ScrapedArticle if extraction succeeds, None otherwise.
+            An ArticleRecord if extraction succeeds, None otherwise.
         """
         ...
 
@@ -180,9 +488,9 @@ def validate_url(url: str, allowed_domains: list[str] | None = None) -> bool:
             logger.warning("Private IP range: {hostname}", hostname=hostname)
             return False
 
-        domains_to_check = allowed_domains or []
-        if settings.allowed_domains:
-            domains_to_check.extend(settings.allowed_domains)
+        # Build a new list: extending `allowed_domains` would grow the
+        # scraper's class attribute on every call.
+        domains_to_check = [*(allowed_domains or []), *settings.allowed_domains]
 
         if domains_to_check:
             domain_allowed = any(
@@ -200,56 +508,252 @@ def validate_url(url: str, allowed_domains: list[str] | None = None) -> bool:
         return False
 
 
+class FetchError(Exception):
+    """Raised when a page could not be fetched.
+
+    Attributes:
+        url: The URL that failed.
+        retryable: Whether trying again later may succeed (timeouts, connection
+            errors, 5xx and 429 responses).
+    """
+
+    def __init__(self, url: str, message: str, *, retryable: bool) -> None:
+        super().__init__(message)
+        self.url = url
+        self.retryable = retryable
+
+
+def _is_retryable(exc: requests.RequestException) -> bool:
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        status = exc.response.status_code
+        return status >= 500 or status == 429
+
+    return True
+
+
+def _get(url: str) -> requests.Response:
+    response = requests.get(
+        url, headers=get_random_headers(), timeout=settings.request_timeout_seconds
+    )
+    response.raise_for_status()
+    return response
+
+
+def _get_hedge_executor() -> ThreadPoolExecutor:
+    global _hedge_executor
+    if _hedge_executor is None:
+        _hedge_executor = ThreadPoolExecutor(
+            max_workers=settings.hedge_max_workers, thread_name_prefix="hedge"
+        )
+    return _hedge_executor
+
+
+def _fetch(url: str, latency: LatencyTracker | None) -> requests.Response:
+    """GET the URL, hedging it past the scraper's p95 latency when enabled."""
+    if not settings.hedge_requests or latency is None:
+        return _get(url)
+
+    if (hedge_after := latency.percentile(0.95)) is None:
+        return _get(url)
+
+    return hedged_call(
+        lambda: _get(url),
+        hedge_after=hedge_after,
+        budget=hedge_budget,
+        executor=_get_hedge_executor(),
+        on_discard=lambda response: response.close(),
+        label=url,
+    )
+
+
+def _fetch_limited(
+    host: str, url: str, latency: LatencyTracker | None
+) -> requests.Response:
+    # The slot is held by the request itself, so one abandoned by a cancelled
+    # cycle still counts against the host until it finishes.
+    with host_limiter.slot(host):
+        return _fetch(url, latency)
+
+
+def _record_fetch_error(site: str, error: str, status: int | None = None) -> None:
+    SCRAPE_FETCH_ERRORS.labels(site=site, error=error).inc()
+    if (run := current_run.get()) is not None:
+        run.error = error
+        run.http_status = status
+
+
 def fetch_elements(
-    url: str, tag: str = "a", allowed_domains: list[str] | None = None
-) -> list[Tag] | None:
+    url: str,
+    tag: str | list[str] = "a",
+    allowed_domains: list[str] | None = None,
+    latency: LatencyTracker | None = None,
+    site: str = "unknown",
+) -> list[Tag]:
     """
     Fetches all elements with the given tag from the given URL.
 
+    The page is fetched with `fetch_page`.
+
     Args:
         url (str): The URL to fetch elements from.
-        tag (str, optional): The tag to fetch elements with. Defaults to "a".
+        tag (str | list[str], optional): The tag, or tags, to fetch elements
+            with. Only these elements and their contents are parsed. Defaults
+            to "a".
         allowed_domains (list[str] | None): List of allowed domains for this scraper.
+        latency (LatencyTracker | None): The scraper's latency history.
+        site (str): Site label for the fetch metrics.
 
     Returns:
-        list[Tag] | None: A list of Tag objects, or None if the fetch fails.
+        list[Tag]: A list of Tag objects.
+
+    Raises:
+        FetchError: If the URL is not allowed or the request fails.
+        CycleCancelled: If the running cycle stopped before the response arrived.
+    """
+    return _parse_elements(fetch_page(url, allowed_domains, latency, site), tag, site)
+
+
+def fetch_page(
+    url: str,
+    allowed_domains: list[str] | None = None,
+    latency: LatencyTracker | None = None,
+    site: str = "unknown",
+    *,
+    binary: bool = False,
+    track_errors: bool = True,
+) -> str | bytes:
+    """
+    Fetches the body of the page at the given URL.
+
+    A single attempt is made. Retries are scheduled by the caller, so a failing
+    host never blocks the thread with backoff sleeps. Hosts whose circuit is
+    open fail fast without any request being sent, and requests to a host past
+    `SCRAPE_HOST_CONCURRENCY` wait for one in flight to finish. Inside a
+    scraping cycle the request is abandoned as soon as the cycle is cancelled
+    or runs out of time.
+
+    Args:
+        url (str): The URL to fetch.
+        allowed_domains (list[str] | None): List of allowed domains for this scraper.
+        latency (LatencyTracker | None): The scraper's latency history. Successful
+            fetch times are recorded in it and, with hedging enabled, a second
+            request is sent once the fetch exceeds its p95.
+        site (str): Site label for the fetch metrics.
+        binary (bool): Return the raw bytes instead of the decoded text, for
+            parsers that read the encoding from the document itself. Pages
+            served from `offline_pages` are always text.
+        track_errors (bool): Count failures against the host's circuit, the
+            fetch error metrics and the running scrape. Off for optional
+            resources, such as feeds, whose failure must not fail the pages
+            of the same host.
+
+    Returns:
+        str | bytes: The page body.
+
+    Raises:
+        FetchError: If the URL is not allowed or the request fails.
+        CycleCancelled: If the running cycle stopped before the response arrived.
     """
+    if (pages := offline_pages.get()) is not None:
+        if (body := pages.get(url)) is None:
+            raise FetchError(url, "Page not in the snapshot", retryable=False)
+        return body
+
     if not validate_url(url, allowed_domains):
         logger.error("URL validation failed: {url}", url=url)
-        return None
+        if track_errors:
+            _record_fetch_error(site, "InvalidURL")
+        raise FetchError(url, "URL validation failed", retryable=False)
+
+    host = urlparse(url).hostname or url
+    if not circuit_breaker.allow(host):
+        if track_errors:
+            _record_fetch_error(site, "CircuitOpen")
+        raise FetchError(url, f"Circuit open for {host}", retryable=False)
+
+    start = time.perf_counter()
+    try:
+        response = run_cancellable(lambda: _fetch_limited(host, url, latency))
+    except requests.RequestException as exc:
+        retryable = _is_retryable(exc)
+        if track_errors:
+            status = exc.response.status_code if exc.response is not None else None
+            _record_fetch_error(site, type(exc).__name__, status)
+            # Only errors that say the host is unhealthy count against its circuit.
+            if retryable:
+                circuit_breaker.record_failure(host)
+            else:
+                circuit_breaker.record_success(host)
+        raise FetchError(url, str(exc), retryable=retryable) from exc
+
+    fetch_seconds = time.perf_counter() - start
+    if track_errors:
+        circuit_breaker.record_success(host)
+    if latency is not None:
+        latency.record(fetch_seconds)
+
+    # requests reports the time until the headers were parsed, which includes
+    # DNS and connect; the rest of the fetch is the body download.
+    ttfb = response.elapsed.total_seconds()
+    SCRAPE_STAGE_SECONDS.labels(site=site, stage="ttfb").observe(ttfb)
+    SCRAPE_STAGE_SECONDS.labels(site=site, stage="download").observe(
+        max(fetch_seconds - ttfb, 0.0)
+    )
+    SCRAPE_RESPONSE_BYTES.labels(site=site).inc(len(response.content))
+    if (run := current_run.get()) is not None:
+        run.record_response(response.status_code, response.content)
+    if snapshot_archive is not None:
+        _archive(site, url, response)
+
+    return response.content if binary else response.text
+
+
+def _archive(site: str, url: str, response: requests.Response) -> None:
+    # A full disk must not stop the scraping.
+    try:
+        snapshot_archive.store(site, url, response.content, response.encoding)
+    except OSError as exc:
+        logger.error("Failed to archive {url}: {exc}", url=url, exc=exc)
 
-    response = None
-    for attempt in range(settings.max_retries + 1):
-        try:
-            headers = get_random_headers()
-            response = requests.get(
-                url, headers=headers, timeout=settings.request_timeout_seconds
-            )
-            response.raise_for_status()
-            break
-        except requests.RequestException as exc:
-            if attempt == settings.max_retries:
-                logger.error(
-                    "Error fetching {url} after {max_retries} attempts: {exc}",
-                    url=url,
-                    max_retries=settings.max_retries,
-                    exc=exc,
-                )
-                return None
-
-            delay = settings.retry_delay_seconds * (2**attempt) + random.uniform(0, 1)
-            logger.warning(
-                "Attempt {attempt} failed for {url}, retrying in {delay:.2f}s: {exc}",
-                attempt=attempt + 1,
-                url=url,
-                delay=delay,
-                exc=exc,
-            )
-            time.sleep(delay)
 
-    if response is None:
-        return None
+def _parse_elements(html: str | bytes, tag: str | list[str], site: str) -> list[Tag]:
+    start = time.perf_counter()
+    # Elements outside the wanted tags are never built, which saves most of
+    # the tree on pages where they are a small part of the markup.
+    soup = BeautifulSoup(html, "html.parser", parse_only=SoupStrainer(tag))
+    elements = [el for el in soup.find_all(tag) if isinstance(el, Tag)]
+    SCRAPE_STAGE_SECONDS.labels(site=site, stage="parse").observe(
+        time.perf_counter() - start
+    )
+    return elements
 
-    soup = BeautifulSoup(response.text, "html.parser")
-    elements = soup.find_all(tag)
-    return [el for el in elements if isinstance(el, Tag)]
+
+def _discard_page(future: Future[list[Tag]]) -> None:
+    if not future.cancelled() and future.exception() is None:
+        _release_trees(future.result())
+
+
+def _release_trees(elements: list[Tag]) -> None:
+    """
+    Frees the parse trees the elements belong to.
+
+    Parse trees are full of reference cycles (parents, siblings), so dropping
+    the last reference leaves them in memory until the next garbage collection.
+    Decomposing them breaks the cycles and frees the memory right away.
+    Elements must not be used afterwards.
+    """
+    reached: set[int] = set()
+    roots: list[Tag] = []
+    for element in elements:
+        node: Tag = element
+        while id(node) not in reached:
+            reached.add(id(node))
+            if node.parent is None:
+                roots.append(node)
+                break
+            node = node.parent
+
+    for root in roots:
+        # Decomposing a BeautifulSoup object itself leaves its children intact.
+        for child in list(root.contents):
+            child.decompose()
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from enum import StrEnum
+
+from loguru import logger
+
+from app.metrics import SCRAPE_CIRCUIT_STATE
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+_STATE_VALUES = {
+    CircuitState.CLOSED: 0,
+    CircuitState.HALF_OPEN: 1,
+    CircuitState.OPEN: 2,
+}
+
+
+class _Circuit:
+    __slots__ = ("failures", "opened_at", "state")
+
+    def __init__(self) -> None:
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+
+
+class HostCircuitBreaker:
+    """
+    Circuit breaker keyed by host.
+
+    A host's circuit opens after `failure_threshold` consecutive failures and
+    requests to it fail fast for `cooldown_seconds`. After the cooldown the
+    circuit half-opens and lets a single probe through: a success closes it,
+    a failure opens it for another cooldown.
+
+    Args:
+        failure_threshold: Consecutive failures that open the circuit.
+        cooldown_seconds: How long an open circuit rejects requests.
+        clock: Monotonic clock, replaceable in tests.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        cooldown_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, host: str) -> bool:
+        """
+        Check whether a request to the host may be sent.
+
+        Returns:
+            True if the circuit is closed, or if this call is the half-open probe.
+        """
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None or circuit.state is CircuitState.CLOSED:
+                return True
+
+            # A half-open circuit waits for its probe; a probe that never
+            # reported back is replaced after another cooldown.
+            now = self._clock()
+            if now - circuit.opened_at < self.cooldown_seconds:
+                return False
+
+            _set_state(host, circuit, CircuitState.HALF_OPEN)
+            circuit.opened_at = now
+            logger.info("Circuit for {host} half-open, sending probe", host=host)
+            return True
+
+    def record_success(self, host: str) -> None:
+        """Record that the host answered; closes its circuit."""
+        with self._lock:
+            if (circuit := self._circuits.get(host)) is None:
+                return
+
+            if circuit.state is not CircuitState.CLOSED:
+                logger.info("Circuit for {host} closed", host=host)
+
+            _set_state(host, circuit, CircuitState.CLOSED)
+            circuit.failures = 0
+
+    def record_failure(self, host: str) -> None:
+        """Record a failed request; may open the host's circuit."""
+        with self._lock:
+            circuit = self._circuits.setdefault(host, _Circuit())
+            circuit.failures += 1
+
+            if circuit.state is CircuitState.HALF_OPEN:
+                _set_state(host, circuit, CircuitState.OPEN)
+                circuit.opened_at = self._clock()
+                logger.warning(
+                    "Probe to {host} failed, circuit open for {cooldown}s",
+                    host=host,
+                    cooldown=self.cooldown_seconds,
+                )
+            elif (
+                circuit.state is CircuitState.CLOSED
+                and circuit.failures >= self.failure_threshold
+            ):
+                _set_state(host, circuit, CircuitState.OPEN)
+                circuit.opened_at = self._clock()
+                logger.warning(
+                    "Circuit for {host} open after {failures} consecutive failures, "
+                    "skipping it for {cooldown}s",
+                    host=host,
+                    failures=circuit.failures,
+                    cooldown=self.cooldown_seconds,
+                )
+
+    def states(self) -> dict[str, CircuitState]:
+        """Return the current state of every known host."""
+        with self._lock:
+            return {host: circuit.state for host, circuit in self._circuits.items()}
+
+
+def _set_state(host: str, circuit: _Circuit, state: CircuitState) -> None:
+    circuit.state = state
+    SCRAPE_CIRCUIT_STATE.labels(host=host).set(_STATE_VALUES[state])
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TypeVar
+
+from loguru import logger
+
+from app.metrics import SCRAPE_HEDGED_REQUESTS
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """
+    Sliding window of recent successful fetch latencies for one scraper.
+
+    Args:
+        window: Number of recent samples kept.
+        min_samples: Samples required before a percentile is reported.
+    """
+
+    def __init__(self, window: int = 50, min_samples: int = 10) -> None:
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return the given percentile (0-1), or None with too few samples."""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+
+        index = min(int(fraction * len(ordered)), len(ordered) - 1)
+        return ordered[index]
+
+
+class HedgeBudget:
+    """
+    Caps hedged requests to a fraction of all requests.
+
+    Every request earns `max_ratio` tokens, up to `burst`; a hedge spends one.
+
+    Args:
+        max_ratio: Maximum hedges per request over time, e.g. 0.1 for 10%.
+        burst: Maximum tokens that can accumulate.
+    """
+
+    def __init__(self, max_ratio: float, burst: float = 5.0) -> None:
+        self.max_ratio = max_ratio
+        self.burst = burst
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+
+    def on_request(self) -> None:
+        with self._lock:
+            self._tokens = min(self._tokens + self.max_ratio, self.burst)
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+
+def hedged_call(
+    fn: Callable[[], T],
+    *,
+    hedge_after: float,
+    budget: HedgeBudget,
+    executor: ThreadPoolExecutor,
+    on_discard: Callable[[T], None] | None = None,
+    label: str = "",
+) -> T:
+    """
+    Run `fn`, starting a second identical call if the first is slow.
+
+    If `fn` has not finished after `hedge_after` seconds and the budget allows,
+    a hedge is started in parallel. The first successful result wins; the other
+    call is cancelled if it has not started, otherwise its result is passed to
+    `on_discard` when it arrives so resources can be released.
+
+    Raises:
+        Exception: The first error, if every started call fails.
+    """
+    budget.on_request()
+    primary = executor.submit(fn)
+    done, _ = wait([primary], timeout=hedge_after)
+    if done or not budget.try_acquire():
+        return primary.result()
+
+    logger.debug(
+        "Hedging {label} after {delay:.2f}s",
+        label=label or "request",
+        delay=hedge_after,
+    )
+    SCRAPE_HEDGED_REQUESTS.inc()
+    pending: set[Future[T]] = {primary, executor.submit(fn)}
+    errors: list[BaseException] = []
+
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if (error := future.exception()) is not None:
+                errors.append(error)
+                continue
+
+            for loser in pending:
+                _discard(loser, on_discard)
+            return future.result()
+
+    raise errors[0]
+
+
+def _discard(future: Future[T], on_discard: Callable[[T], None] | None) -> None:
+    if future.cancel() or on_discard is None:
+        return
+
+    def _release(finished: Future[T]) -> None:
+        if finished.exception() is None:
+            on_discard(finished.result())
+
+    future.add_done_callback(_release)
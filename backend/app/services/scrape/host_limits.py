@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class HostLimiter:
+    """
+    Caps the requests in flight to each host.
+
+    A site's pages are fetched in parallel, but never more than
+    `max_concurrent` at a time from the same host, however many pages the
+    site lists: requests past the cap wait for a slot.
+
+    Args:
+        max_concurrent: Requests allowed in flight per host.
+    """
+
+    def __init__(self, max_concurrent: int) -> None:
+        self.max_concurrent = max_concurrent
+        self._slots: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if (semaphore := self._slots.get(host)) is None:
+                semaphore = threading.BoundedSemaphore(self.max_concurrent)
+                self._slots[host] = semaphore
+            return semaphore
+
+    @contextmanager
+    def slot(self, host: str) -> Iterator[None]:
+        """Hold one of the host's slots inside the block, waiting for one if needed."""
+        with self._semaphore(host):
+            yield
@@ -0,0 +1,412 @@
+"""
+Declarative definitions of how the articles of each site are extracted.
+
+Each site is described in `sites.toml` (see the comments there): the elements
+to look at, the classes and selectors they must match, the way to their link
+and title, the rules their URL must pass and how titles are cleaned up. A site
+may also list section pages, scraped along with its homepage, and feeds,
+read instead of its pages while they are fresh. Specs are validated and
+compiled once per process: patterns and selectors are compiled, class lists
+become sets and selector steps that only name tags run as BeautifulSoup's own
+`find`. Pages are parsed keeping only the spec's tags, so fixing a site, or
+adding one, is a change to the file alone.
+"""
+
+from __future__ import annotations
+
+import re
+import tomllib
+import xml.etree.ElementTree as ET
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import cache
+from pathlib import Path
+from typing import Literal
+from urllib.parse import urlparse
+
+import soupsieve
+from bs4 import Tag
+from loguru import logger
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from app import profiling
+from app.config import settings
+from app.metrics import SCRAPE_ELEMENTS, SCRAPE_FEEDS
+from app.services.scrape.base import (
+    ArticleRecord,
+    FetchError,
+    Scraper,
+    offline_pages,
+    validate_url,
+)
+from app.services.scrape.feeds import read_feed
+from app.services.scrape_runs import current_run
+from app.services.site_registry import DEFAULT_SPEC_FILE
+
+# Selectors such as "h2, h3", which `Tag.find` matches without soupsieve.
+_TAG_NAMES = re.compile(r"[a-z][a-z0-9]*(?:\s*,\s*[a-z][a-z0-9]*)*")
+
+TitleText = Literal["joined", "stripped", "last_line"]
+Step = Callable[[Tag], Tag | None]
+
+
+class UrlRules(BaseModel):
+    """Rules the article URL must pass, as written in the page."""
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    pattern: str | None = None
+    host: str | None = None
+    min_path_segments: int = Field(default=0, ge=0)
+    year_in_path: bool = False
+    hyphen_in_slug: bool = False
+
+
+class TitleSource(BaseModel):
+    """Where the title is read from, relative to the candidate element."""
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    select: list[str] = Field(default_factory=list)
+    classes: list[str] = Field(default_factory=list)
+    attribute: str | None = None
+    text: TitleText = "joined"
+
+
+class SiteSpec(BaseModel):
+    """A site's entry in the spec file."""
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    name: str | None = Field(default=None, min_length=1)
+    base_url: str = Field(..., min_length=1)
+    allowed_domains: list[str] = Field(default_factory=list)
+    tags: list[str] = Field(default_factory=lambda: ["a"], min_length=1)
+    required_classes: list[str] = Field(default_factory=list)
+    match: str | None = None
+    link: list[str] = Field(default_factory=list)
+    url: UrlRules = Field(default_factory=UrlRules)
+    title: list[TitleSource] = Field(
+        default_factory=lambda: [TitleSource()], min_length=1
+    )
+    title_cleanup: str | None = None
+    min_title_length: int = Field(default=20, ge=1)
+    sections: list[str] = Field(default_factory=list)
+    feeds: list[str] = Field(default_factory=list)
+    feed_max_age_minutes: int = Field(default=360, ge=1)
+
+
+def _compile_step(selector: str) -> Step:
+    if _TAG_NAMES.fullmatch(selector):
+        names = [name.strip() for name in selector.split(",")]
+        return lambda node: node.find(names)  # type: ignore[return-value]
+    return soupsieve.compile(selector).select_one
+
+
+def _follow(node: Tag, path: tuple[Step, ...]) -> Tag | None:
+    """Takes the first match of each step inside the previous one."""
+    for step in path:
+        if (found := step(node)) is None:
+            return None
+        node = found
+    return node
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledTitle:
+    path: tuple[Step, ...]
+    classes: frozenset[str]
+    attribute: str | None
+    text: TitleText
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledSpec:
+    """A site spec ready to be evaluated against each candidate element."""
+
+    base_url: str
+    allowed_domains: list[str]
+    tags: list[str]
+    min_title_length: int
+    required_classes: frozenset[str]
+    match: soupsieve.SoupSieve | None
+    link: tuple[Step, ...]
+    url_pattern: re.Pattern[str] | None
+    url_host: str | None
+    min_path_segments: int
+    year_in_path: bool
+    hyphen_in_slug: bool
+    titles: tuple[_CompiledTitle, ...]
+    title_cleanup: re.Pattern[str] | None
+    sections: list[str]
+    feeds: list[str]
+    feed_max_age: timedelta
+
+    def extract(self, element: Tag) -> ArticleRecord | None:
+        """
+        Extracts an article from an element, if it passes the spec's rules.
+
+        Args:
+            element: The Tag element to extract the article from.
+
+        Returns:
+            An ArticleRecord if extraction succeeds, None otherwise.
+        """
+        if self.required_classes and not self.required_classes.issubset(
+            element.get("class") or ()
+        ):
+            return None
+
+        if self.match is not None and not self.match.match(element):
+            return None
+
+        if (link := _follow(element, self.link)) is None or not isinstance(
+            url := link.get("href"), str
+        ):
+            return None
+
+        if not self.accepts_url(url):
+            return None
+
+        if (title := self._title(element)) is None:
+            return None
+
+        return ArticleRecord(title=title, url=url)
+
+    def accepts_url(self, url: str) -> bool:
+        """
+        Whether a URL passes the spec's URL rules, for links of any source.
+
+        Args:
+            url: The article URL, from a page or a feed.
+
+        Returns:
+            True if it matches `url.pattern` and the host and path rules.
+        """
+        if self.url_pattern is not None and self.url_pattern.search(url) is None:
+            return False
+
+        if not (
+            self.url_host
+            or self.min_path_segments
+            or self.year_in_path
+            or self.hyphen_in_slug
+        ):
+            return True
+
+        try:
+            parsed = urlparse(url)
+        except ValueError:
+            return False
+
+        if self.url_host is not None and self.url_host not in parsed.netloc:
+            return False
+
+        segments = [part for part in parsed.path.split("/") if part]
+        if len(segments) < self.min_path_segments:
+            return False
+
+        if self.year_in_path and not any(
+            len(part) == 4 and part.isdigit() for part in segments
+        ):
+            return False
+
+        return not self.hyphen_in_slug or (bool(segments) and "-" in segments[-1])
+
+    def _title(self, element: Tag) -> str | None:
+        """Reads the title from the first source that yields one."""
+        for source in self.titles:
+            if (node := _follow(element, source.path)) is None:
+                continue
+
+            if source.classes and source.classes.isdisjoint(node.get("class") or ()):
+                continue
+
+            if (title := self._read_title(node, source)) is None:
+                continue
+
+            if self.title_cleanup is not None:
+                title = self.title_cleanup.sub("", title).strip()
+            return title
+
+        return None
+
+    def _read_title(self, node: Tag, source: _CompiledTitle) -> str | None:
+        if source.attribute is not None:
+            value = node.get(source.attribute)
+            return value.strip() if isinstance(value, str) else None
+
+        if source.text == "stripped":
+            return node.get_text(strip=True)
+
+        if source.text == "last_line":
+            lines = (
+                line.strip() for line in node.get_text(separator="\n").splitlines()
+            )
+            long_lines = [line for line in lines if len(line) >= self.min_title_length]
+            return long_lines[-1] if long_lines else None
+
+        return node.get_text().strip()
+
+
+def compile_spec(spec: SiteSpec) -> CompiledSpec:
+    """
+    Compiles a site spec into the matcher evaluated against each element.
+
+    Raises:
+        re.error: If a pattern is not a valid regular expression.
+        soupsieve.SelectorSyntaxError: If a selector is not valid CSS.
+    """
+    url = spec.url
+    return CompiledSpec(
+        base_url=spec.base_url,
+        allowed_domains=list(spec.allowed_domains),
+        tags=list(spec.tags),
+        min_title_length=spec.min_title_length,
+        required_classes=frozenset(spec.required_classes),
+        match=soupsieve.compile(spec.match) if spec.match else None,
+        link=tuple(_compile_step(selector) for selector in spec.link),
+        url_pattern=re.compile(url.pattern) if url.pattern else None,
+        url_host=url.host,
+        min_path_segments=url.min_path_segments,
+        year_in_path=url.year_in_path,
+        hyphen_in_slug=url.hyphen_in_slug,
+        titles=tuple(
+            _CompiledTitle(
+                path=tuple(_compile_step(selector) for selector in source.select),
+                classes=frozenset(source.classes),
+                attribute=source.attribute,
+                text=source.text,
+            )
+            for source in spec.title
+        ),
+        title_cleanup=re.compile(spec.title_cleanup) if spec.title_cleanup else None,
+        sections=list(spec.sections),
+        feeds=list(spec.feeds),
+        feed_max_age=timedelta(minutes=spec.feed_max_age_minutes),
+    )
+
+
+def load_specs(path: Path) -> dict[str, CompiledSpec]:
+    """
+    Loads and compiles the site specs of a TOML file.
+
+    Args:
+        path: The spec file, with one table per site slug.
+
+    Returns:
+        The compiled specs, by site slug.
+
+    Raises:
+        ValueError: If a site's spec is invalid.
+    """
+    with path.open("rb") as file:
+        tables = tomllib.load(file)
+
+    specs: dict[str, CompiledSpec] = {}
+    for slug, table in tables.items():
+        try:
+            specs[slug] = compile_spec(SiteSpec.model_validate(table))
+        except (ValidationError, re.error, soupsieve.SelectorSyntaxError) as exc:
+            raise ValueError(f"Invalid spec for site {slug} in {path}: {exc}") from exc
+    return specs
+
+
+@cache
+def site_specs() -> dict[str, CompiledSpec]:
+    """The compiled specs of `SCRAPER_SPECS_FILE`, loaded on first use."""
+    return load_specs(Path(settings.scraper_specs_file or DEFAULT_SPEC_FILE))
+
+
+class SpecScraper(Scraper):
+    """
+    Scrapes a site as described by its spec.
+
+    A site with feeds is read from them, and its pages, the homepage and its
+    sections, are only scraped when a feed fails or none has an article
+    published within the spec's `feed_max_age_minutes`.
+    """
+
+    def __init__(self, slug: str | None = None) -> None:
+        super().__init__(slug)
+        if (spec := site_specs().get(self.slug)) is None:
+            raise ValueError(f"No scraper spec for site {self.slug}")
+
+        self.spec = spec
+        self.base_url = spec.base_url
+        self.allowed_domains = spec.allowed_domains
+        self.default_tag = spec.tags
+        self.section_urls = spec.sections
+        self.min_title_length = spec.min_title_length
+
+    def iter_articles(self, limit: int | None = None) -> Iterator[ArticleRecord]:
+        if self.spec.feeds:
+            with profiling.section(self.slug, "fetch"):
+                articles = self._read_feeds()
+
+            if articles is not None:
+                SCRAPE_ELEMENTS.labels(site=self.slug).inc(len(articles))
+                if (run := current_run.get()) is not None:
+                    run.elements += len(articles)
+                yield from self.accept_articles(articles, limit)
+                return
+
+        yield from super().iter_articles(limit)
+
+    def _read_feeds(self) -> list[ArticleRecord] | None:
+        """
+        Reads the articles of the site's feeds.
+
+        Returns:
+            The articles, or None if the site's pages must be scraped instead.
+        """
+        feeds = self.spec.feeds
+        stale_before: datetime | None = (
+            datetime.now(timezone.utc) - self.spec.feed_max_age
+        )
+        if (pages := offline_pages.get()) is not None:
+            # An archived feed is replayed as it was, however old it is now.
+            feeds = [url for url in feeds if url in pages]
+            stale_before = None
+            if not feeds:
+                return None
+
+        articles: list[ArticleRecord] = []
+        for url in feeds:
+            try:
+                articles.extend(read_feed(url, self.allowed_domains, self.slug))
+            except (FetchError, ET.ParseError) as exc:
+                SCRAPE_FEEDS.labels(site=self.slug, outcome="failed").inc()
+                logger.warning(
+                    "Failed to read feed {url}, scraping the pages of {slug}: {exc}",
+                    url=url,
+                    slug=self.slug,
+                    exc=exc,
+                )
+                return None
+
+        # Feeds list whatever the site publishes, so their links go through
+        # the same rules as those of the pages.
+        articles = [
+            article
+            for article in articles
+            if validate_url(article.url, self.allowed_domains)
+            and self.spec.accepts_url(article.url)
+        ]
+        dates = [a.published_at for a in articles if a.published_at is not None]
+        if not articles or (
+            stale_before is not None and dates and max(dates) < stale_before
+        ):
+            SCRAPE_FEEDS.labels(site=self.slug, outcome="stale").inc()
+            logger.info(
+                "Feeds of {slug} have no recent articles, scraping its pages",
+                slug=self.slug,
+            )
+            return None
+
+        SCRAPE_FEEDS.labels(site=self.slug, outcome="used").inc()
+        return articles
+
+    def extract_article(self, element: Tag) -> ArticleRecord | None:
+        return self.spec.extract(element)
@@ -0,0 +1,201 @@
+"""
+Per-site leases that coordinate several scraper processes through the database.
+
+Each site has a row in `scrape_jobs`. A worker claims due, unleased rows with
+`SELECT ... FOR UPDATE SKIP LOCKED`, so concurrent workers never claim the same
+site, keeps the lease alive while it works and releases it with the next due
+time. A worker that dies simply lets its leases expire.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import threading
+import uuid
+from collections.abc import Collection
+from datetime import datetime, timedelta
+
+from loguru import logger
+from sqlalchemy import func, or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models import ScrapeJobModel
+
+
+def make_worker_id() -> str:
+    """Build an identifier unique to this scraper process."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def ensure_jobs_exist(db: Session, site_ids: Collection[int]) -> None:
+    """Create a due `scrape_jobs` row for every site that does not have one."""
+    if not site_ids:
+        return
+
+    statement = (
+        insert(ScrapeJobModel)
+        .values([{"site_id": site_id} for site_id in site_ids])
+        .on_conflict_do_nothing(index_elements=[ScrapeJobModel.site_id])
+    )
+    db.execute(statement)
+    db.commit()
+
+
+def claim_due_sites(
+    db: Session,
+    owner: str,
+    site_ids: Collection[int],
+    lease_seconds: int,
+    limit: int | None = None,
+) -> list[int]:
+    """
+    Claim the sites that are due and not leased by a live worker.
+
+    Args:
+        db: Database session.
+        owner: Identifier of the claiming worker.
+        site_ids: Sites this worker knows how to scrape.
+        lease_seconds: How long the lease is valid without renewal.
+        limit: Maximum number of sites to claim. None claims every due site.
+
+    Returns:
+        The ids of the claimed sites, most overdue first.
+    """
+    query = (
+        db.query(ScrapeJobModel)
+        .filter(ScrapeJobModel.site_id.in_(site_ids))
+        .filter(ScrapeJobModel.next_run_at <= func.now())
+        .filter(
+            or_(
+                ScrapeJobModel.lease_expires_at.is_(None),
+                ScrapeJobModel.lease_expires_at < func.now(),
+            )
+        )
+        .order_by(ScrapeJobModel.next_run_at)
+        .with_for_update(skip_locked=True)
+    )
+    if limit:
+        query = query.limit(limit)
+
+    jobs = query.all()
+    site_ids = [job.site_id for job in jobs]
+
+    for job in jobs:
+        job.lease_owner = owner
+        job.lease_expires_at = func.now() + timedelta(seconds=lease_seconds)
+
+    db.commit()
+    return site_ids
+
+
+def renew_leases(
+    db: Session,
+    owner: str,
+    site_ids: Collection[int],
+    lease_seconds: int,
+) -> int:
+    """
+    Extend the leases this worker still holds.
+
+    Returns:
+        The number of leases renewed. Fewer than requested means a lease was
+        lost, e.g. after it expired and another worker claimed the site.
+    """
+    if not site_ids:
+        return 0
+
+    renewed = (
+        db.query(ScrapeJobModel)
+        .filter(ScrapeJobModel.site_id.in_(site_ids))
+        .filter(ScrapeJobModel.lease_owner == owner)
+        .update(
+            {
+                ScrapeJobModel.lease_expires_at: func.now()
+                + timedelta(seconds=lease_seconds)
+            },
+            synchronize_session=False,
+        )
+    )
+    db.commit()
+    return renewed
+
+
+def release_lease(
+    db: Session,
+    owner: str,
+    site_id: int,
+    next_run_at: datetime,
+) -> None:
+    """Release a lease held by this worker and schedule the site's next run."""
+    db.query(ScrapeJobModel).filter(ScrapeJobModel.site_id == site_id).filter(
+        ScrapeJobModel.lease_owner == owner
+    ).update(
+        {
+            ScrapeJobModel.lease_owner: None,
+            ScrapeJobModel.lease_expires_at: None,
+            ScrapeJobModel.next_run_at: next_run_at,
+            ScrapeJobModel.last_run_at: func.now(),
+        },
+        synchronize_session=False,
+    )
+    db.commit()
+
+
+class LeaseHeartbeat:
+    """
+    Background thread that renews a worker's leases while it scrapes.
+
+    Uses its own session so renewals never commit the scraper's pending work.
+    """
+
+    def __init__(self, owner: str, lease_seconds: int) -> None:
+        self.owner = owner
+        self.lease_seconds = lease_seconds
+        self._site_ids: set[int] = set()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def hold(self, site_ids: Collection[int]) -> None:
+        with self._lock:
+            self._site_ids.update(site_ids)
+
+    def __enter__(self) -> LeaseHeartbeat:
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="lease-heartbeat", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+
+    def _run(self) -> None:
+        interval = max(self.lease_seconds / 3, 1.0)
+        while not self._stop_event.wait(timeout=interval):
+            with self._lock:
+                site_ids = set(self._site_ids)
+
+            if not site_ids:
+                continue
+
+            try:
+                with SessionLocal() as db:
+                    renewed = renew_leases(db, self.owner, site_ids, self.lease_seconds)
+            except Exception as exc:
+                logger.error("Failed to renew scrape leases: {exc}", exc=exc)
+                continue
+
+            if renewed < len(site_ids):
+                logger.warning(
+                    "Lost {lost} of {held} scrape leases",
+                    lost=len(site_ids) - renewed,
+                    held=len(site_ids),
+                )
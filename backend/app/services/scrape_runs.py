@@ -0,0 +1,168 @@
+"""
+Per-site history of scraping runs.
+
+While a site is scraped, its `ScrapeRun` is the active one and the fetch and
+extraction code fill it in through `current_run`. Once its articles are
+stored, the cycle writes the runs of all its sites in a single statement, so
+the history adds a single round trip.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import case, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.models import ScrapeRunModel, SiteModel
+
+
+@dataclass
+class ScrapeRun:
+    """
+    Outcome of scraping one site in one cycle.
+
+    Pages fetched for the site (some scrapers fetch more than one) add up into
+    `response_bytes` and `elements`; `http_status` is that of the last one.
+    A site that was retried keeps one run whose duration spans the retries and
+    whose outcome is that of the last attempt.
+    """
+
+    site_id: int
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    http_status: int | None = None
+    response_bytes: int = 0
+    elements: int = 0
+    extracted: int = 0
+    new_articles: int = 0
+    error: str | None = None
+    unchanged: bool = False
+    _started: float = field(default_factory=time.perf_counter, repr=False)
+    _finished: float | None = field(default=None, repr=False)
+    _digest: Any = field(default_factory=hashlib.blake2b, repr=False)
+
+    def record_response(self, status: int, content: bytes) -> None:
+        """Add a fetched page to the run."""
+        self.http_status = status
+        self.response_bytes += len(content)
+        self._digest.update(content)
+
+    def add_page(self, page: ScrapeRun) -> None:
+        """
+        Add a page fetched into a run of its own, for pages fetched in parallel.
+
+        Pages must be added in the same order every time: the digest covers
+        each page's digest, in the order they were added.
+        """
+        self.http_status = page.http_status
+        self.error = page.error
+        if page.response_bytes:
+            self.response_bytes += page.response_bytes
+            self._digest.update(page._digest.digest())
+
+    def page_digest(self) -> bytes | None:
+        """Return a digest of the fetched pages, or None if none was fetched."""
+        return self._digest.digest() if self.response_bytes else None
+
+    def finish(self) -> None:
+        self._finished = time.perf_counter()
+
+    def to_row(self) -> dict[str, Any]:
+        finished = self._finished if self._finished is not None else time.perf_counter()
+        return {
+            "site_id": self.site_id,
+            "started_at": self.started_at,
+            "duration_ms": round((finished - self._started) * 1000),
+            "http_status": self.http_status,
+            "response_bytes": self.response_bytes,
+            "elements": self.elements,
+            "extracted": self.extracted,
+            "new_articles": self.new_articles,
+            "error": self.error,
+            "unchanged": self.unchanged,
+        }
+
+
+current_run: ContextVar[ScrapeRun | None] = ContextVar("current_run", default=None)
+
+
+def record_runs(db: Session, runs: list[ScrapeRun]) -> None:
+    """Stage the runs in `db` as a single multi-row insert."""
+    if runs:
+        db.execute(insert(ScrapeRunModel), [run.to_row() for run in runs])
+
+
+def summarize_runs(db: Session, since: datetime) -> list[dict[str, Any]]:
+    """
+    Summarize the runs of each site since the given time.
+
+    Returns:
+        One dict per site that ran, ordered by slug, with aggregate counts and
+        the outcome of its latest run.
+    """
+    run = ScrapeRunModel
+    totals = (
+        select(
+            run.site_id,
+            func.count().label("runs"),
+            func.sum(case((run.error.is_not(None), 1), else_=0)).label("failures"),
+            func.sum(case((run.unchanged, 1), else_=0)).label("unchanged_runs"),
+            func.avg(run.duration_ms).label("avg_duration_ms"),
+            func.max(run.duration_ms).label("max_duration_ms"),
+            func.avg(run.extracted).label("avg_extracted"),
+            func.sum(run.new_articles).label("new_articles"),
+        )
+        .where(run.started_at >= since)
+        .group_by(run.site_id)
+        .subquery()
+    )
+    ranked = (
+        select(
+            run,
+            func.row_number()
+            .over(partition_by=run.site_id, order_by=run.started_at.desc())
+            .label("position"),
+        )
+        .where(run.started_at >= since)
+        .subquery()
+    )
+
+    rows = db.execute(
+        select(
+            SiteModel.slug,
+            totals,
+            ranked.c.started_at,
+            ranked.c.http_status,
+            ranked.c.error,
+            ranked.c.extracted,
+            ranked.c.new_articles.label("last_new_articles"),
+        )
+        .join(totals, totals.c.site_id == SiteModel.id)
+        .join(ranked, ranked.c.site_id == SiteModel.id)
+        .where(ranked.c.position == 1)
+        .order_by(SiteModel.slug)
+    ).all()
+
+    return [
+        {
+            "site_slug": row.slug,
+            "runs": row.runs,
+            "failures": row.failures,
+            "unchanged_runs": row.unchanged_runs,
+            "avg_duration_ms": float(row.avg_duration_ms),
+            "max_duration_ms": row.max_duration_ms,
+            "avg_extracted": float(row.avg_extracted),
+            "new_articles": row.new_articles,
+            "last_run_at": row.started_at,
+            "last_http_status": row.http_status,
+            "last_error": row.error,
+            "last_extracted": row.extracted,
+            "last_new_articles": row.last_new_articles,
+        }
+        for row in rows
+    ]
@@ -2,28 +2,75 @@ from __future__ import annotations
 
 import threading
 import time
-from datetime import datetime, timezone
+from collections import deque
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta, timezone
+from itertools import islice
 from typing import Optional
 
 from loguru import logger
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from app import profiling
+from app.config import settings
 from app.database import SessionLocal
-from app.models import NewsModel, SiteModel
-from app.services.scraping_core import (
-    SITE_DISPLAY_NAMES,
-    SUPPORTED_SITE_SLUGS,
-    scrape_site,
+from app.metrics import SCRAPE_CYCLE_SECONDS, SCRAPE_RECENT_URLS
+from app.models import SiteModel
+from app.services.cancellation import CycleCancelled, CycleContext, current_cycle
+from app.services.news_partitions import ensure_partitions
+from app.services.news_writer import NewsWriter, SiteArticles
+from app.services.recent_urls import RecentUrls
+from app.services.retry_queue import RetryQueue
+from app.services.scheduler import AdaptiveScheduler
+from app.services.scrape.base import ArticleRecord, FetchError
+from app.services.scrape_leases import (
+    LeaseHeartbeat,
+    claim_due_sites,
+    ensure_jobs_exist,
+    make_worker_id,
+    release_lease,
 )
+from app.services.scrape_runs import ScrapeRun, current_run, record_runs
+from app.services.scraping_core import scrape_site
+from app.services.site_registry import SITE_DISPLAY_NAMES, SUPPORTED_SITE_SLUGS
 
 
 class Scraping:
-    def __init__(self, interval_seconds: int) -> None:
+    def __init__(self, interval_seconds: int, distributed: bool = False) -> None:
         self.interval_seconds = interval_seconds if interval_seconds > 0 else 60
-        self._last_run_per_site: dict[str, float] = {}
+        self.distributed = distributed
+        self.worker_id = make_worker_id()
+        self.scheduler = self._build_scheduler()
         self._shutdown_event = threading.Event()
         self._current_thread: Optional[threading.Thread] = None
         self._db_session: Optional[Session] = None
+        self._cycle: Optional[CycleContext] = None
+        # Digest of each site's last fetched pages, to flag unchanged ones.
+        self._page_digests: dict[str, bytes] = {}
+        self._partitions_checked_on: date | None = None
+        # Keys of recently stored articles, to skip them without a query.
+        self.recent_urls = RecentUrls(settings.scrape_recent_urls)
+        self._recent_urls_warmed = False
+
+    def _build_scheduler(self) -> AdaptiveScheduler:
+        """Build the per-site schedule; fixed at the base interval if not adaptive."""
+        if not settings.scrape_adaptive:
+            return AdaptiveScheduler(
+                SUPPORTED_SITE_SLUGS,
+                base_interval=self.interval_seconds,
+                min_interval=self.interval_seconds,
+                max_interval=self.interval_seconds,
+            )
+
+        return AdaptiveScheduler(
+            SUPPORTED_SITE_SLUGS,
+            base_interval=self.interval_seconds,
+            min_interval=settings.scrape_min_interval_seconds,
+            max_interval=settings.scrape_max_interval_seconds,
+            jitter=settings.scrape_interval_jitter,
+            target_new_per_poll=settings.scrape_target_new_per_poll,
+        )
 
     def ensure_sites_exist(self, db: Session) -> dict[str, int]:
         existing_sites = (
@@ -56,83 +103,339 @@ class Scraping:
             slug: site.id for slug, site in slug_to_site.items() if site.id is not None
         }
 
-    def scrape_all_sites_once(self, db: Session) -> None:
+    def scrape_all_sites_once(
+        self, db: Session, slugs: list[str] | None = None
+    ) -> None:
         self._db_session = db
 
         try:
             slug_to_id = self.ensure_sites_exist(db)
+            self._ensure_partitions(db)
+            self._warm_recent_urls(db)
+
+            if self.distributed:
+                self._scrape_claimed_sites(db, slug_to_id)
+            else:
+                self._scrape_sites(db, slug_to_id, slugs or SUPPORTED_SITE_SLUGS)
+
+        finally:
+            self._db_session = None
+
+    def _ensure_partitions(self, db: Session) -> None:
+        """Create the news partitions of the coming months, once a day."""
+        today = datetime.now(timezone.utc).date()
+        if self._partitions_checked_on == today:
+            return
+
+        try:
+            created = ensure_partitions(
+                db, months_ahead=settings.news_partition_months_ahead
+            )
+            db.commit()
+        except SQLAlchemyError as exc:
+            db.rollback()
+            logger.error("Failed to create news partitions: {exc}", exc=exc)
+            return
+
+        self._partitions_checked_on = today
+        if created:
+            logger.info("Created news partitions: {names}", names=", ".join(created))
+
+    def _warm_recent_urls(self, db: Session) -> None:
+        """Fill the recent URL filter from the database on the first cycle."""
+        if self._recent_urls_warmed:
+            return
+
+        self._recent_urls_warmed = True
+        loaded = self.recent_urls.warm(db, settings.scrape_recent_urls_warm_days)
+        SCRAPE_RECENT_URLS.set(len(self.recent_urls))
+        if loaded:
+            logger.info(
+                "Loaded {count} recently stored URLs from the last {days} days",
+                count=loaded,
+                days=settings.scrape_recent_urls_warm_days,
+            )
+
+    def _scrape_claimed_sites(self, db: Session, slug_to_id: dict[str, int]) -> None:
+        """Scrape only the sites this worker manages to lease."""
+        site_ids = list(slug_to_id.values())
+        ensure_jobs_exist(db, site_ids)
+        claimed_ids = claim_due_sites(
+            db,
+            self.worker_id,
+            site_ids,
+            settings.scrape_lease_seconds,
+            limit=settings.scrape_claim_batch_size or None,
+        )
+        if not claimed_ids:
+            logger.debug("No sites due for worker {worker}", worker=self.worker_id)
+            return
+
+        id_to_slug = {site_id: slug for slug, site_id in slug_to_id.items()}
+        slugs = [id_to_slug[site_id] for site_id in claimed_ids]
+        logger.info(
+            "Worker {worker} claimed sites: {slugs}",
+            worker=self.worker_id,
+            slugs=", ".join(slugs),
+        )
 
-            total_new = 0
-            for slug in SUPPORTED_SITE_SLUGS:
-                if self._shutdown_event.is_set():
-                    logger.info("Shutdown signal received, stopping scraping")
-                    break
-
-                site_id = slug_to_id.get(slug)
-                if site_id is None:
-                    continue
-
-                articles = scrape_site(slug)
-                if not articles:
-                    continue
-
-                existing_urls: set[str] = {
-                    url
-                    for (url,) in db.query(NewsModel.url)
-                    .filter(NewsModel.site_id == site_id)
-                    .all()
-                }
-
-                new_for_site = 0
-                for article in articles:
-                    if self._shutdown_event.is_set():
-                        logger.info(
-                            "Shutdown signal received during article processing"
-                        )
-                        break
-
-                    if not article.url or not article.title:
-                        continue
-
-                    if article.url in existing_urls:
-                        continue
-
-                    news = NewsModel(
-                        site_id=site_id,
-                        title=article.title,
-                        url=article.url,
-                        scraped_at=datetime.now(timezone.utc),
+        processed: dict[str, int] = {}
+        with LeaseHeartbeat(self.worker_id, settings.scrape_lease_seconds) as heartbeat:
+            heartbeat.hold(claimed_ids)
+            try:
+                processed = self._scrape_sites(db, slug_to_id, slugs)
+            finally:
+                db.rollback()
+                now = datetime.now(timezone.utc)
+                for slug in slugs:
+                    delay = (
+                        self.scheduler.interval_for(slug) if slug in processed else 0
                     )
-                    db.add(news)
-                    existing_urls.add(article.url)
-                    new_for_site += 1
-
-                if new_for_site:
-                    logger.info(
-                        "Inserted {count} new articles for site {slug}",
-                        count=new_for_site,
-                        slug=slug,
+                    release_lease(
+                        db,
+                        self.worker_id,
+                        slug_to_id[slug],
+                        next_run_at=now + timedelta(seconds=delay),
                     )
-                    total_new += new_for_site
 
-                if self._shutdown_event.is_set():
-                    break
+    def _scrape_sites(
+        self, db: Session, slug_to_id: dict[str, int], slugs: list[str]
+    ) -> dict[str, int]:
+        """Scrape the given sites, store their new articles and reschedule them.
+
+        Each site's articles are handed to a `NewsWriter`, which commits them in
+        batches while the following sites are fetched. The cycle stops early on
+        shutdown or when its deadline passes; articles already extracted are
+        still committed.
+
+        Returns:
+            The number of new articles per site, for the sites that were fully
+            processed before the cycle stopped. Sites that failed for good, to
+            fetch or to store, count as processed with no new articles.
+        """
+        processed: dict[str, int] = {}
+        runs: dict[str, ScrapeRun] = {}
+        pending = deque(slugs)
+        retries = RetryQueue(
+            max_retries=settings.max_retries,
+            budget=settings.scrape_retry_budget,
+            base_delay=settings.retry_delay_seconds,
+        )
 
-            if total_new:
+        cycle = CycleContext(
+            settings.scrape_cycle_deadline_seconds or self.interval_seconds
+        )
+        self._cycle = cycle
+        if self._shutdown_event.is_set():
+            cycle.cancel()
+        token = current_cycle.set(cycle)
+        cycle_start = time.perf_counter()
+
+        writer = self._build_writer(db)
+        writer.start()
+        try:
+            self._scrape_pending(
+                slug_to_id, pending, retries, cycle, processed, runs, writer
+            )
+        finally:
+            with profiling.section("cycle", "store"):
+                results = writer.close()
+            current_cycle.reset(token)
+            self._cycle = None
+
+        total_new = 0
+        for slug, result in results.items():
+            run = runs[slug]
+            run.new_articles = result.new_articles
+            if result.error is not None:
+                # Backed off like a site that failed to fetch, so a failing
+                # database doesn't make the site due again right away.
+                run.error = result.error
+                processed[slug] = 0
+                continue
+            processed[slug] = result.new_articles
+            total_new += result.new_articles
+
+        if not total_new:
+            logger.info("No new articles found in this scraping cycle")
+
+        record_runs(db, list(runs.values()))
+        if runs:
+            with profiling.section("cycle", "commit"):
                 db.commit()
-            else:
-                logger.info("No new articles found in this scraping cycle")
 
-        finally:
-            self._db_session = None
+        SCRAPE_CYCLE_SECONDS.observe(time.perf_counter() - cycle_start)
+
+        for slug, new_for_site in processed.items():
+            delay = self.scheduler.record(slug, new_for_site)
+            logger.debug(
+                "Next poll of {slug} in {delay:.0f}s",
+                slug=slug,
+                delay=delay,
+            )
+
+        return processed
+
+    def _build_writer(self, db: Session) -> NewsWriter:
+        """Create the cycle's writer, with its own session on `db`'s engine."""
+        bind = db.get_bind()
+        return NewsWriter(
+            lambda: Session(bind=bind, autoflush=False),
+            self.recent_urls,
+            queue_size=settings.scrape_writer_queue_size,
+            batch_size=settings.scrape_writer_batch_size,
+            batch_seconds=settings.scrape_writer_batch_seconds,
+            max_retries=settings.scrape_writer_max_retries,
+            retry_delay=settings.scrape_writer_retry_delay_seconds,
+        )
+
+    def _scrape_pending(
+        self,
+        slug_to_id: dict[str, int],
+        pending: deque[str],
+        retries: RetryQueue,
+        cycle: CycleContext,
+        processed: dict[str, int],
+        runs: dict[str, ScrapeRun],
+        writer: NewsWriter,
+    ) -> None:
+        """Work through pending sites and retries, submitting articles to `writer`.
+
+        The outcome of each site that was attempted is left in `runs`; sites
+        without articles are marked processed here, the others once stored.
+        """
+        while (slug := self._next_site(pending, retries, cycle)) is not None:
+            site_id = slug_to_id.get(slug)
+            if site_id is None:
+                continue
+
+            run = runs.setdefault(slug, ScrapeRun(site_id=site_id))
+            # A retry's outcome replaces that of the attempt that failed.
+            run.error = None
+            token = current_run.set(run)
+            try:
+                extracted = self._submit_articles(
+                    writer, slug, site_id, scrape_site(slug)
+                )
+            except CycleCancelled as exc:
+                logger.warning(
+                    "Stopped scraping {slug}: {exc}",
+                    slug=slug,
+                    exc=exc,
+                )
+                run.error = type(exc).__name__
+                break
+            except FetchError as exc:
+                run.error = run.error or type(exc).__name__
+                if exc.retryable and (delay := retries.schedule(slug)) is not None:
+                    logger.warning(
+                        "Attempt {attempt} failed for {slug}, retrying in {delay:.2f}s: {exc}",
+                        attempt=retries.attempts(slug),
+                        slug=slug,
+                        delay=delay,
+                        exc=exc,
+                    )
+                else:
+                    logger.error(
+                        "Error fetching {slug} after {attempts} retries: {exc}",
+                        slug=slug,
+                        attempts=retries.attempts(slug),
+                        exc=exc,
+                    )
+                    processed[slug] = 0
+                continue
+            finally:
+                current_run.reset(token)
+                run.finish()
+
+            run.extracted = extracted
+            if (digest := run.page_digest()) is not None:
+                run.unchanged = self._page_digests.get(slug) == digest
+                self._page_digests[slug] = digest
+
+            if not extracted:
+                processed[slug] = 0
+
+    @staticmethod
+    def _submit_articles(
+        writer: NewsWriter,
+        slug: str,
+        site_id: int,
+        articles: Iterator[ArticleRecord],
+    ) -> int:
+        """Hand articles to `writer` as they are extracted, a batch at a time.
+
+        Returns:
+            The number of articles submitted.
+        """
+        submitted = 0
+        while chunk := list(islice(articles, settings.scrape_writer_batch_size)):
+            writer.submit(
+                SiteArticles(
+                    slug=slug,
+                    site_id=site_id,
+                    articles=chunk,
+                    scraped_at=datetime.now(timezone.utc),
+                )
+            )
+            submitted += len(chunk)
+        return submitted
+
+    def _next_site(
+        self, pending: deque[str], retries: RetryQueue, cycle: CycleContext
+    ) -> str | None:
+        """Pick the next site: a retry whose backoff elapsed, else a new site.
+
+        Only waits when nothing but parked retries is left.
+        """
+        while True:
+            if cycle.cancelled or self._shutdown_event.is_set():
+                logger.info("Shutdown signal received, stopping scraping")
+                return None
+
+            if cycle.expired():
+                logger.warning(
+                    "Scraping cycle deadline reached with {count} sites left",
+                    count=len(pending) + len(retries),
+                )
+                return None
+
+            if (slug := retries.pop_ready()) is not None:
+                return slug
+
+            if pending:
+                return pending.popleft()
+
+            if not retries:
+                return None
+
+            cycle.wait(retries.seconds_until_next())
 
     def run_once(self) -> None:
         with SessionLocal() as db:
             self.scrape_all_sites_once(db)
 
+    def run_due(self) -> float:
+        """
+        Scrape the sites that are due.
+
+        Returns:
+            Seconds to wait before calling again.
+        """
+        if self.distributed:
+            # Due times live in scrape_jobs and may be advanced by other workers.
+            self.run_once()
+            return self.scheduler.min_interval
+
+        if due := self.scheduler.due_sites():
+            with SessionLocal() as db:
+                self.scrape_all_sites_once(db, slugs=due)
+
+        return self.scheduler.seconds_until_next()
+
     def loop(self) -> None:
         logger.info(
-            "Starting scraping loop with interval {interval}s",
+            "Starting scraping loop with base interval {interval}s",
             interval=self.interval_seconds,
         )
 
@@ -141,8 +444,9 @@ class Scraping:
         try:
             while not self._shutdown_event.is_set():
                 start = time.time()
+                wait = float(self.interval_seconds)
                 try:
-                    self.run_once()
+                    wait = self.run_due()
                 except Exception as exc:
                     logger.exception(
                         "Unexpected error in scraping loop: {exc}", exc=exc
@@ -153,7 +457,7 @@ class Scraping:
                     "Scraping cycle finished in {duration:.2f}s", duration=duration
                 )
 
-                self._shutdown_event.wait(timeout=self.interval_seconds)
+                self._shutdown_event.wait(timeout=wait)
 
         except Exception as exc:
             logger.exception("Fatal error in scraping loop: {exc}", exc=exc)
@@ -161,26 +465,40 @@ class Scraping:
             logger.info("Scraping loop terminated")
             self._current_thread = None
 
+    def wait(self, seconds: float) -> bool:
+        """Sleep between cycles; returns True early if shutdown was requested."""
+        return self._shutdown_event.wait(timeout=seconds)
+
     def shutdown(self, timeout: float = 10.0) -> None:
-        """Initiate graceful shutdown of the scraping loop."""
+        """Initiate graceful shutdown of the scraping loop.
+
+        The running cycle is cancelled: in-flight fetches and retry backoffs
+        return immediately and articles already extracted are committed. Safe
+        to call from a signal handler running on the scraping thread itself, in
+        which case it only signals and returns.
+        """
         logger.info(
             "Initiating scraping shutdown with {timeout}s timeout", timeout=timeout
         )
 
         self._shutdown_event.set()
+        if (cycle := self._cycle) is not None:
+            cycle.cancel()
 
-        if self._current_thread and self._current_thread.is_alive():
-            pass
+        thread = self._current_thread
+        if thread is None or thread is threading.current_thread():
+            return
 
-        if self._current_thread and self._current_thread.is_alive():
-            self._current_thread.join(timeout=timeout)
+        if thread.is_alive():
+            thread.join(timeout=timeout)
 
-            if self._current_thread.is_alive():
+            if thread.is_alive():
                 logger.warning(
                     "Scraping thread did not terminate gracefully within timeout"
                 )
             else:
                 logger.info("Scraping thread terminated gracefully")
+                return
 
         if self._db_session:
             try:
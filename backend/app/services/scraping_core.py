@@ -1,66 +1,61 @@
 from __future__ import annotations
 
-from typing import Callable
+from collections.abc import Iterator
 
 from loguru import logger
 
-from app.services.scrape.base import ScrapedArticle
-from app.services.scrape.cnn import CNNScraper
-from app.services.scrape.globo import GloboScraper
-from app.services.scrape.livecoins import LivecoinsScraper
-from app.services.scrape.metropoles import MetropolesScraper
-from app.services.scrape.poder360 import Poder360Scraper
-from app.services.scrape.uol import UOLScraper
-from app.services.scrape.veja import VejaScraper
-
-SUPPORTED_SITE_SLUGS = [
-    "veja",
-    "globo",
-    "cnn",
-    "livecoins",
-    "poder360",
-    "uol",
-    "metropoles",
-]
-
-SITE_DISPLAY_NAMES: dict[str, str] = {
-    "veja": "VEJA",
-    "globo": "Globo",
-    "cnn": "CNN Brasil",
-    "livecoins": "Livecoins",
-    "poder360": "Poder360",
-    "uol": "UOL",
-    "metropoles": "Metrópoles",
-}
-
-SCRAPER_MAP: dict[str, Callable[[], list[ScrapedArticle]]] = {
-    "globo": GloboScraper().scrape,
-    "cnn": CNNScraper().scrape,
-    "veja": VejaScraper().scrape,
-    "livecoins": LivecoinsScraper().scrape,
-    "poder360": Poder360Scraper().scrape,
-    "uol": UOLScraper().scrape,
-    "metropoles": MetropolesScraper().scrape,
-}
-
-
-def scrape_site(slug: str) -> list[ScrapedArticle]:
+from app.config import settings
+from app.services.scrape.base import ArticleRecord, Scraper
+from app.services.scrape.spec import SpecScraper, site_specs
+
+_scrapers: dict[str, Scraper] = {}
+
+
+def get_scraper(slug: str) -> Scraper | None:
+    """
+    Get the scraper instance for a site, built from its spec on first use.
+
+    Args:
+        slug: The slug of the site.
+
+    Returns:
+        The scraper instance, or None if `SCRAPER_SPECS_FILE` has no spec for
+        the site.
+    """
+    if (scraper := _scrapers.get(slug)) is not None:
+        return scraper
+
+    if slug not in site_specs():
+        return None
+
+    scraper = _scrapers[slug] = SpecScraper(slug)
+    return scraper
+
+
+def scrape_site(slug: str) -> Iterator[ArticleRecord]:
     """
     Scrape a site based on its slug.
 
+    Articles are yielded as they are extracted, at most
+    `SCRAPE_MAX_ARTICLES_PER_SITE` of them when set; the page is fetched once
+    iteration starts.
+
     Args:
         slug: The slug of the site to scrape.
 
     Returns:
-        A list of scraped articles.
+        An iterator over the scraped articles.
+
+    Raises:
+        FetchError: If the site's page could not be fetched, on the first
+            `next()`.
 
     Notes:
-        If no scraper is configured for the site, an empty list is returned.
+        If no scraper is configured for the site, nothing is yielded.
     """
-    scraper = SCRAPER_MAP.get(slug)
-    if scraper is None:
+    if (scraper := get_scraper(slug)) is None:
         logger.warning("No scraper configured for site slug: {slug}", slug=slug)
-        return []
+        return iter(())
 
     logger.info("Scraping site {slug}", slug=slug)
-    return scraper()
+    return scraper.iter_articles(limit=settings.scrape_max_articles_per_site or None)
@@ -0,0 +1,41 @@
+"""
+Lightweight registry of the supported news sites.
+
+Shared by the API and the scraper process. The sites are those of the spec
+file (`SCRAPER_SPECS_FILE`), so adding one there is enough. It must not import
+any scraper module, so API workers never pay for the scraping stack
+(requests, bs4): the file is only read, not compiled.
+"""
+
+from __future__ import annotations
+
+import tomllib
+from pathlib import Path
+
+from app.config import settings
+
+# Where the sites are described; the scraper compiles the full specs.
+DEFAULT_SPEC_FILE = Path(__file__).parent / "scrape" / "sites.toml"
+
+
+def load_sites(path: Path) -> dict[str, str]:
+    """
+    Reads the sites of a spec file, without compiling their specs.
+
+    Args:
+        path: The spec file, with one table per site slug.
+
+    Returns:
+        The display name of each site, by slug, in file order. Sites without
+        a `name` are shown by their slug in capitals.
+    """
+    with path.open("rb") as file:
+        tables = tomllib.load(file)
+    return {slug: table.get("name", slug.upper()) for slug, table in tables.items()}
+
+
+SITE_DISPLAY_NAMES: dict[str, str] = load_sites(
+    Path(settings.scraper_specs_file or DEFAULT_SPEC_FILE)
+)
+
+SUPPORTED_SITE_SLUGS = list(SITE_DISPLAY_NAMES)
@@ -0,0 +1,169 @@
+"""
+Content-addressed archive of fetched pages.
+
+Every page body is stored once, gzip-compressed, under its SHA-256 in
+`objects/`; each capture is a line in the day's `index/YYYY-MM-DD.jsonl` that
+points at it. Pages that didn't change between polls therefore cost one index
+line. Index files older than the retention are deleted once a day, together
+with the objects no remaining capture refers to.
+
+The archive lets articles be re-extracted from old pages after a scraper is
+fixed, see `app.services.backfill`.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+from loguru import logger
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """One capture of a page."""
+
+    captured_at: datetime
+    site: str
+    url: str
+    sha256: str
+    encoding: str | None
+
+
+class SnapshotArchive:
+    """
+    Page bodies on disk, deduplicated by content hash.
+
+    Args:
+        root: Directory holding `objects/` and `index/`.
+        retention_days: Days of captures to keep.
+    """
+
+    def __init__(self, root: Path, retention_days: int) -> None:
+        self.root = root
+        self.retention_days = retention_days
+        self._objects = root / "objects"
+        self._index = root / "index"
+        self._index_day: date | None = None
+        self._lock = threading.Lock()
+
+    def store(
+        self,
+        site: str,
+        url: str,
+        content: bytes,
+        encoding: str | None,
+        captured_at: datetime | None = None,
+    ) -> str:
+        """
+        Archive a fetched page.
+
+        Returns:
+            The SHA-256 of the body, which addresses it in the archive.
+        """
+        captured_at = captured_at or datetime.now(timezone.utc)
+        sha256 = hashlib.sha256(content).hexdigest()
+
+        path = self._object_path(sha256)
+        if path.exists():
+            # Mark it as in use again, see `prune`.
+            os.utime(path)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so readers never see a partial object.
+            with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as tmp:
+                tmp.write(gzip.compress(content))
+            os.replace(tmp.name, path)
+
+        snapshot = Snapshot(captured_at, site, url, sha256, encoding)
+        line = json.dumps(asdict(snapshot), default=datetime.isoformat) + "\n"
+        day = captured_at.date()
+        with self._lock:
+            self._index.mkdir(parents=True, exist_ok=True)
+            with open(self._index / f"{day.isoformat()}.jsonl", "a") as index:
+                index.write(line)
+            new_day, self._index_day = self._index_day != day, day
+
+        if new_day:
+            self.prune(captured_at)
+        return sha256
+
+    def load(self, sha256: str) -> bytes:
+        return gzip.decompress(self._object_path(sha256).read_bytes())
+
+    def snapshots(
+        self,
+        since: date | None = None,
+        until: date | None = None,
+        sites: Iterable[str] | None = None,
+    ) -> Iterator[Snapshot]:
+        """Yield the captures between `since` and `until` (inclusive), oldest first."""
+        wanted = set(sites) if sites is not None else None
+        for day, path in self._index_files():
+            if (since and day < since) or (until and day > until):
+                continue
+
+            with open(path) as index:
+                for line in index:
+                    fields = json.loads(line)
+                    if wanted is not None and fields["site"] not in wanted:
+                        continue
+                    fields["captured_at"] = datetime.fromisoformat(
+                        fields["captured_at"]
+                    )
+                    yield Snapshot(**fields)
+
+    def prune(self, now: datetime | None = None) -> int:
+        """
+        Delete captures past the retention and the objects left unreferenced.
+
+        Returns:
+            The number of objects deleted.
+        """
+        now = now or datetime.now(timezone.utc)
+        cutoff = now.date() - timedelta(days=self.retention_days)
+
+        for day, path in self._index_files():
+            if day < cutoff:
+                path.unlink(missing_ok=True)
+
+        # Objects are written just before their index line; skipping recent
+        # ones keeps a concurrent writer's page from being deleted in between.
+        referenced = {snapshot.sha256 for snapshot in self.snapshots()}
+        settled = now.timestamp() - 3600
+        removed = 0
+        for path in self._objects.glob("*/*.html.gz"):
+            if (
+                path.name.removesuffix(".html.gz") not in referenced
+                and path.stat().st_mtime < settled
+            ):
+                path.unlink(missing_ok=True)
+                removed += 1
+
+        if removed:
+            logger.info(
+                "Pruned {count} archived pages older than {days} days",
+                count=removed,
+                days=self.retention_days,
+            )
+        return removed
+
+    def _object_path(self, sha256: str) -> Path:
+        return self._objects / sha256[:2] / f"{sha256}.html.gz"
+
+    def _index_files(self) -> list[tuple[date, Path]]:
+        files = []
+        for path in self._index.glob("*.jsonl"):
+            try:
+                files.append((date.fromisoformat(path.stem), path))
+            except ValueError:
+                continue
+        return sorted(files)
@@ -0,0 +1,78 @@
+"""
+Canonical form and deduplication key of article URLs.
+
+The same article is often linked with different URLs: relative hrefs,
+tracking parameters, fragments, a capitalized host. Articles are stored
+under their canonical URL and deduplicated by `url_hash`, a fixed-width key
+that is much cheaper to index than the URL itself.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import uuid
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+# Parameters that only identify where a click came from, not the content.
+_TRACKING_PARAMS = frozenset(
+    {
+        "fbclid",
+        "gclid",
+        "gclsrc",
+        "dclid",
+        "msclkid",
+        "mc_cid",
+        "mc_eid",
+        "igshid",
+        "_ga",
+        "_gl",
+    }
+)
+
+_DEFAULT_PORTS = {"http": ":80", "https": ":443"}
+
+
+def _is_tracking(param: str) -> bool:
+    name = param.split("=", 1)[0].lower()
+    return name.startswith("utm_") or name in _TRACKING_PARAMS
+
+
+def canonical_url(url: str, base_url: str | None = None) -> str:
+    """
+    Normalize a URL so that variants of the same link compare equal.
+
+    Relative links are resolved against `base_url`; scheme and host are
+    lowercased and the default port, the fragment and tracking parameters
+    (`utm_*`, `fbclid`, `gclid`...) removed. The path and other parameters
+    are kept as they are, in order.
+
+    Args:
+        url: URL or href extracted from a page.
+        base_url: URL of the page the link was found on.
+
+    Returns:
+        The canonical URL.
+    """
+    url = url.strip()
+    if base_url:
+        url = urljoin(base_url, url)
+
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if (default_port := _DEFAULT_PORTS.get(scheme)) is not None:
+        netloc = netloc.removesuffix(default_port)
+    query = "&".join(
+        param for param in parts.query.split("&") if param and not _is_tracking(param)
+    )
+    return urlunsplit((scheme, netloc, parts.path or "/", query, ""))
+
+
+def url_hash(url: str) -> uuid.UUID:
+    """
+    The 16-byte deduplication key of a canonical URL.
+
+    It is the MD5 of the URL as a UUID, the same value as `md5(url)::uuid`
+    in PostgreSQL, so it can be computed in SQL as well.
+    """
+    return uuid.UUID(hashlib.md5(url.encode()).hexdigest())
@@ -1,5 +1,6 @@
 """Utilitários auxiliares do aplicativo."""
 
+from app.utils.single_flight import SingleFlight
 from app.utils.time_range import parse_time_range
 
-__all__ = ["parse_time_range"]
+__all__ = ["SingleFlight", "parse_time_range"]
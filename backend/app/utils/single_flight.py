@@ -0,0 +1,103 @@
+"""Coalescência de chamadas concorrentes idênticas (single-flight)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    __slots__ = ("done", "error", "result", "started_at")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.error: BaseException | None = None
+        self.result: T | None = None
+        self.started_at = time.monotonic()
+
+
+class SingleFlight(Generic[T]):
+    """Compartilha uma única execução entre chamadas concorrentes com a mesma chave.
+
+    A primeira chamada para uma chave executa a função; as chamadas que chegam
+    enquanto ela está em andamento aguardam e recebem o mesmo resultado (ou a
+    mesma exceção).
+
+    Args:
+        max_keys: Número máximo de chaves em andamento. Acima disso, novas
+            chamadas executam diretamente, sem coalescência.
+        timeout_seconds: Tempo máximo que uma chamada espera pela execução
+            em andamento. Depois disso ela executa por conta própria e novas
+            chamadas deixam de se juntar à execução travada.
+    """
+
+    def __init__(self, max_keys: int, timeout_seconds: float) -> None:
+        self.max_keys = max_keys
+        self.timeout_seconds = timeout_seconds
+        self._calls: dict[Hashable, _Call[T]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Executa `fn` ou aguarda a execução em andamento para `key`.
+
+        Args:
+            key: Chave que identifica chamadas equivalentes.
+            fn: Função que calcula o resultado.
+
+        Returns:
+            O resultado de `fn`, possivelmente calculado por outra chamada.
+        """
+        call, is_leader = self._join_or_lead(key)
+
+        if call is None:
+            return fn()
+
+        if is_leader:
+            return self._run(key, call, fn)
+
+        remaining = self.timeout_seconds - (time.monotonic() - call.started_at)
+        if not call.done.wait(timeout=max(remaining, 0.0)):
+            return fn()
+
+        if call.error is not None:
+            raise call.error
+
+        return call.result  # type: ignore[return-value]
+
+    def in_flight(self) -> int:
+        """Retorna o número de chaves em andamento."""
+        with self._lock:
+            return len(self._calls)
+
+    def _join_or_lead(self, key: Hashable) -> tuple[_Call[T] | None, bool]:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None and not self._expired(call):
+                return call, False
+
+            if call is None and len(self._calls) >= self.max_keys:
+                return None, False
+
+            call = _Call[T]()
+            self._calls[key] = call
+            return call, True
+
+    def _run(self, key: Hashable, call: _Call[T], fn: Callable[[], T]) -> T:
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+
+    def _expired(self, call: _Call[T]) -> bool:
+        return time.monotonic() - call.started_at >= self.timeout_seconds
@@ -0,0 +1,51 @@
+#!/usr/bin/env -S uv run --script
+"""
+Archive old news partitions.
+
+Detaches the monthly partitions of `news` older than NEWS_RETENTION_MONTHS,
+exports each to a gzip-compressed CSV in NEWS_ARCHIVE_DIR and drops it. Meant
+to run daily from cron; a run that fails midway is finished by the next one.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from loguru import logger
+
+from app.config import settings
+from app.database import SessionLocal
+from app.services.news_partitions import archive_expired_partitions
+
+
+def main():
+    """Main entry point for the news archival command."""
+    parser = argparse.ArgumentParser(description="Archive old news partitions")
+    parser.add_argument(
+        "--retention-months",
+        type=int,
+        default=settings.news_retention_months,
+        help="Full months of news to keep (default: NEWS_RETENTION_MONTHS)",
+    )
+    parser.add_argument(
+        "--archive-dir",
+        type=Path,
+        default=Path(settings.news_archive_dir),
+        help="Directory for the exported partitions (default: NEWS_ARCHIVE_DIR)",
+    )
+    args = parser.parse_args()
+
+    if args.retention_months <= 0:
+        logger.error("Set NEWS_RETENTION_MONTHS or pass --retention-months")
+        sys.exit(1)
+
+    with SessionLocal() as db:
+        written = archive_expired_partitions(
+            db, args.retention_months, args.archive_dir
+        )
+
+    logger.info(f"Archived {len(written)} partitions to {args.archive_dir}")
+
+
+if __name__ == "__main__":
+    main()
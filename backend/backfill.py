@@ -0,0 +1,78 @@
+#!/usr/bin/env -S uv run --script
+"""
+Re-extract articles from the page snapshot archive.
+
+Runs the current scrapers over the pages archived in SNAPSHOT_ARCHIVE_DIR and
+inserts the articles that are missing from the database, dated when their
+page was captured. Use it after fixing a scraper to recover what it missed.
+"""
+
+import argparse
+import sys
+from datetime import date
+from pathlib import Path
+
+from loguru import logger
+
+from app.config import settings
+from app.database import SessionLocal
+from app.services.backfill import backfill
+from app.services.snapshot_archive import SnapshotArchive
+
+
+def main():
+    """Main entry point for the backfill command."""
+    parser = argparse.ArgumentParser(
+        description="Re-extract missing articles from archived pages"
+    )
+    parser.add_argument(
+        "--archive-dir",
+        default=settings.snapshot_archive_dir,
+        help="Snapshot archive directory (default: SNAPSHOT_ARCHIVE_DIR)",
+    )
+    parser.add_argument(
+        "--since", type=date.fromisoformat, help="First capture day (YYYY-MM-DD)"
+    )
+    parser.add_argument(
+        "--until", type=date.fromisoformat, help="Last capture day (YYYY-MM-DD)"
+    )
+    parser.add_argument(
+        "--sites", help="Comma-separated site slugs (default: every archived site)"
+    )
+    parser.add_argument(
+        "--workers", type=int, help="Worker processes (default: number of CPUs)"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only count the missing articles",
+    )
+    args = parser.parse_args()
+
+    if not args.archive_dir:
+        logger.error("Set SNAPSHOT_ARCHIVE_DIR or pass --archive-dir")
+        sys.exit(1)
+
+    archive = SnapshotArchive(Path(args.archive_dir), settings.snapshot_retention_days)
+    sites = [slug.strip() for slug in args.sites.split(",")] if args.sites else None
+
+    with SessionLocal() as db:
+        result = backfill(
+            db,
+            archive,
+            since=args.since,
+            until=args.until,
+            sites=sites,
+            workers=args.workers,
+            dry_run=args.dry_run,
+        )
+
+    action = "would insert" if args.dry_run else "inserted"
+    logger.info(
+        f"Parsed {result.snapshots} pages, found {result.articles} articles, "
+        f"{action} {result.missing} missing ones"
+    )
+
+
+if __name__ == "__main__":
+    main()
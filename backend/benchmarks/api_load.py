@@ -0,0 +1,275 @@
+"""
+Latency benchmark of the read API over a seeded corpus.
+
+Requests are sent in-process straight to the ASGI app, one at a time, so the
+numbers measure routing, validation, the queries and serialization without
+network or server noise. Each scenario is a typical mix of `/news` filters
+(deep pages, search terms, time ranges, several sites) or `/sites`; for each
+the report has p50/p95/p99 latency and the SQL statements per request.
+
+Seed the database with `benchmarks.corpus` first, then run from the backend
+directory:
+
+    uv run python -m benchmarks.api_load --requests 200 --output before.json
+    uv run python -m benchmarks.api_load --requests 200 --compare before.json
+
+The database comes from `--database-url` or `BENCH_DATABASE_URL`. Request
+parameters are drawn from a fixed seed, so runs on different commits send
+the same requests and their results are comparable.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable, Generator
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode
+
+from sqlalchemy import Engine, create_engine, event, func, select, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models import NewsModel
+from app.services.site_registry import SUPPORTED_SITE_SLUGS
+
+_COMMON_TERMS = ["governo", "reforma", "juros", "inflação", "congresso"]
+_RARE_TERMS = ["anvisa suspende", "concurso público", "criptomoedas"]
+_TIME_RANGES = ["1h", "6h", "24h", "7d", "30d"]
+
+Scenario = Callable[[random.Random], str]
+ASGIApp = Callable[..., Awaitable[None]]
+
+SCENARIOS: dict[str, Scenario] = {
+    "sites": lambda rng: "/sites",
+    "first_page": lambda rng: "/news",
+    "homepage": lambda rng: "/news?sort=homepage",
+    "deep_page": lambda rng: "/news?" + urlencode({"page": rng.randint(500, 5000)}),
+    "search_common": lambda rng: (
+        "/news?" + urlencode({"search": rng.choice(_COMMON_TERMS)})
+    ),
+    "search_rare": lambda rng: (
+        "/news?" + urlencode({"search": rng.choice(_RARE_TERMS)})
+    ),
+    "time_range": lambda rng: (
+        "/news?" + urlencode({"time_range": rng.choice(_TIME_RANGES)})
+    ),
+    "multi_site": lambda rng: (
+        "/news?" + urlencode({"sites": ",".join(rng.sample(SUPPORTED_SITE_SLUGS, 3))})
+    ),
+    "combined": lambda rng: (
+        "/news?"
+        + urlencode(
+            {
+                "sites": ",".join(rng.sample(SUPPORTED_SITE_SLUGS, 2)),
+                "search": rng.choice(_COMMON_TERMS),
+                "time_range": rng.choice(_TIME_RANGES),
+                "page": rng.randint(1, 20),
+            }
+        )
+    ),
+}
+
+
+class StatementCounter:
+    """Counts the SQL statements executed through an engine."""
+
+    def __init__(self, engine: Engine) -> None:
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args: Any) -> None:
+        self.count += 1
+
+
+async def _call(app: ASGIApp, path: str) -> int:
+    """Send a GET request through the ASGI app and return its status code."""
+    url_path, _, query = path.partition("?")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": url_path,
+        "raw_path": url_path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(b"host", b"benchmark")],
+        "client": ("127.0.0.1", 0),
+        "server": ("benchmark", 80),
+    }
+    status = 0
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+async def run_scenario(
+    app: ASGIApp,
+    scenario: Scenario,
+    requests: int,
+    warmup: int,
+    counter: StatementCounter,
+    rng: random.Random,
+) -> dict[str, float]:
+    """Send `warmup` unmeasured and `requests` measured requests."""
+    for _ in range(warmup):
+        await _call(app, scenario(rng))
+
+    latencies: list[float] = []
+    statements = 0
+    for _ in range(requests):
+        path = scenario(rng)
+        before = counter.count
+        start = time.perf_counter()
+        if (status := await _call(app, path)) != 200:
+            raise RuntimeError(f"GET {path} answered {status}")
+        latencies.append((time.perf_counter() - start) * 1000)
+        statements += counter.count - before
+
+    ordered = sorted(latencies)
+    return {
+        "p50_ms": statistics.median(ordered),
+        "p95_ms": _percentile(ordered, 0.95),
+        "p99_ms": _percentile(ordered, 0.99),
+        "max_ms": ordered[-1],
+        "queries_per_request": statements / requests,
+    }
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _print_table(
+    results: dict[str, dict[str, float]],
+    previous: dict[str, dict[str, float]] | None,
+) -> None:
+    print(f"{'scenario':<16}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'queries':>9}")
+    for name, result in results.items():
+        line = (
+            f"{name:<16}{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}"
+            f"{result['p99_ms']:>10.2f}{result['queries_per_request']:>9.1f}"
+        )
+        if previous and (before := previous.get(name)) and before["p95_ms"]:
+            change = result["p95_ms"] / before["p95_ms"] - 1
+            line += f"   p95 {change:+.0%}"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the read API")
+    parser.add_argument("--database-url", default=os.getenv("BENCH_DATABASE_URL"))
+    parser.add_argument("--requests", type=int, default=100, help="Per scenario")
+    parser.add_argument("--warmup", type=int, default=10, help="Per scenario")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="Run only these scenarios (repeatable)",
+    )
+    parser.add_argument("--output", type=Path, help="Write the results as JSON")
+    parser.add_argument("--compare", type=Path, help="Results JSON to compare with")
+    args = parser.parse_args()
+
+    if not args.database_url:
+        print("Set --database-url or BENCH_DATABASE_URL to a seeded database")
+        sys.exit(1)
+
+    # The app's settings require a DATABASE_URL even though every request is
+    # routed to the benchmark database below.
+    os.environ.setdefault("DATABASE_URL", args.database_url)
+    from app.database import get_db
+    from app.main import app
+
+    engine = create_engine(args.database_url, future=True)
+    factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    counter = StatementCounter(engine)
+
+    def get_bench_db() -> Generator[Session, None, None]:
+        with factory() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = get_bench_db
+
+    with factory() as db:
+        rows = db.scalar(select(func.count()).select_from(NewsModel)) or 0
+        server = db.execute(text("SHOW server_version")).scalar()
+
+    names = args.scenario or list(SCENARIOS)
+    # One generator per scenario, so running a subset sends the same requests.
+    results = {
+        name: asyncio.run(
+            run_scenario(
+                app,
+                SCENARIOS[name],
+                args.requests,
+                args.warmup,
+                counter,
+                random.Random(f"{args.seed}:{name}"),
+            )
+        )
+        for name in names
+    }
+
+    previous = None
+    if args.compare:
+        previous = json.loads(args.compare.read_text())["results"]
+
+    print(f"{rows:,} news rows, PostgreSQL {server}")
+    _print_table(results, previous)
+
+    if args.output:
+        args.output.write_text(
+            json.dumps(
+                {
+                    "recorded_at": datetime.now(timezone.utc).isoformat(),
+                    "revision": _git_revision(),
+                    "python": platform.python_version(),
+                    "postgres": server,
+                    "rows": rows,
+                    "requests": args.requests,
+                    "seed": args.seed,
+                    "results": results,
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""
+Synthetic news corpus for load-testing the API at production-like scale.
+
+Seeds `sites` and `news` in a disposable Postgres database with a skewed
+distribution of articles per site, Portuguese headlines and timestamps that
+thin out with age and follow the daily publishing rhythm. Rows are streamed
+with COPY, so millions of them load in minutes. Run from the backend
+directory:
+
+    uv run python -m benchmarks.corpus --rows 10000000 --reset
+
+The target database comes from `--database-url` or `BENCH_DATABASE_URL`; the
+app's own `DATABASE_URL` is never used, so a development database can't be
+filled by accident.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import math
+import os
+import random
+import sys
+import time
+import unicodedata
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import Engine, create_engine, text
+
+from app.models import Base
+from app.services.news_partitions import add_months, create_partitions, month_start
+from app.services.site_registry import SITE_DISPLAY_NAMES, SUPPORTED_SITE_SLUGS
+from app.services.url_keys import url_hash
+
+# Share of the corpus per site, roughly following how much each portal publishes.
+SITE_WEIGHTS = {
+    "globo": 0.24,
+    "uol": 0.20,
+    "metropoles": 0.16,
+    "cnn": 0.15,
+    "veja": 0.10,
+    "poder360": 0.10,
+    "livecoins": 0.05,
+}
+
+SITE_BASE_URLS = {
+    "cnn": "https://www.cnnbrasil.com.br",
+    "globo": "https://g1.globo.com",
+    "livecoins": "https://livecoins.com.br",
+    "metropoles": "https://www.metropoles.com",
+    "poder360": "https://www.poder360.com.br",
+    "uol": "https://noticias.uol.com.br",
+    "veja": "https://veja.abril.com.br",
+}
+
+SECTIONS = ["politica", "economia", "mundo", "brasil", "esportes", "tecnologia"]
+
+_SUBJECTS = [
+    "Governo",
+    "Congresso",
+    "STF",
+    "Banco Central",
+    "Prefeitura de São Paulo",
+    "Ministério da Saúde",
+    "Petrobras",
+    "Senado",
+    "Câmara dos Deputados",
+    "Polícia Federal",
+    "Seleção brasileira",
+    "Bitcoin",
+    "Ibovespa",
+    "Inflação",
+    "Dólar",
+    "Lula",
+    "Oposição",
+    "Anvisa",
+]
+_VERBS = [
+    "anuncia",
+    "aprova",
+    "rejeita",
+    "investiga",
+    "adia",
+    "confirma",
+    "critica",
+    "defende",
+    "suspende",
+    "amplia",
+    "discute",
+    "revisa",
+]
+_OBJECTS = [
+    "reforma tributária",
+    "novo pacote de medidas",
+    "mudanças na previdência",
+    "taxa de juros",
+    "plano de investimentos",
+    "proposta de orçamento",
+    "programa social",
+    "acordo comercial",
+    "regras para o mercado de criptomoedas",
+    "concurso público",
+    "operação contra fraudes",
+    "metas de inflação",
+]
+_COMPLEMENTS = [
+    "após pressão do mercado",
+    "em votação apertada",
+    "nesta segunda-feira",
+    "antes do fim do ano",
+    "e gera reação da oposição",
+    "segundo fontes do governo",
+    "em meio à crise",
+    "para conter gastos",
+    "",
+    "",
+]
+
+# Share of articles published at each hour of the day, peaking mid-morning.
+_HOUR_WEIGHTS = [
+    1 + 4 * math.exp(-(((hour - 11) / 4) ** 2)) + (hour >= 7) for hour in range(24)
+]
+
+
+def _slugify(title: str) -> str:
+    ascii_title = (
+        unicodedata.normalize("NFKD", title).encode("ascii", "ignore").decode()
+    )
+    return "-".join(ascii_title.lower().replace(",", "").split())
+
+
+def make_title(rng: random.Random) -> str:
+    parts = [
+        rng.choice(_SUBJECTS),
+        rng.choice(_VERBS),
+        rng.choice(_OBJECTS),
+        rng.choice(_COMPLEMENTS),
+    ]
+    return " ".join(part for part in parts if part)
+
+
+def generate_rows(
+    site_ids: dict[str, int],
+    count: int,
+    *,
+    days: int,
+    now: datetime,
+    seed: int = 0,
+) -> Iterator[tuple[int, str, str, datetime]]:
+    """
+    Yield `count` synthetic `(site_id, title, url, scraped_at)` rows.
+
+    Ages follow an exponential distribution with a mean of a fifth of `days`,
+    capped at `days`, so recent articles dominate as they do in production.
+    URLs are unique per site.
+    """
+    rng = random.Random(seed)
+    slugs = [slug for slug in SITE_WEIGHTS if slug in site_ids]
+    weights = [SITE_WEIGHTS[slug] for slug in slugs]
+    mean_age_days = days / 5
+
+    for index in range(count):
+        slug = rng.choices(slugs, weights)[0]
+        title = make_title(rng)
+        age_days = min(rng.expovariate(1 / mean_age_days), days)
+        day = (now - timedelta(days=age_days)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        scraped_at = day + timedelta(
+            hours=rng.choices(range(24), _HOUR_WEIGHTS)[0],
+            seconds=rng.randrange(3600),
+        )
+        if scraped_at > now:
+            scraped_at -= timedelta(days=1)
+
+        url = (
+            f"{SITE_BASE_URLS[slug]}/{rng.choice(SECTIONS)}/"
+            f"{scraped_at:%Y/%m/%d}/{_slugify(title)}-{index}.html"
+        )
+        yield site_ids[slug], title, url, scraped_at
+
+
+def ensure_sites(engine: Engine) -> dict[str, int]:
+    """Create the schema if needed and return the id of every supported site."""
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        for slug in SUPPORTED_SITE_SLUGS:
+            conn.execute(
+                text(
+                    "INSERT INTO sites (slug, name) VALUES (:slug, :name) "
+                    "ON CONFLICT (slug) DO NOTHING"
+                ),
+                {"slug": slug, "name": SITE_DISPLAY_NAMES.get(slug, slug.upper())},
+            )
+        rows = conn.execute(text("SELECT slug, id FROM sites")).all()
+    return {slug: site_id for slug, site_id in rows}
+
+
+def seed(
+    engine: Engine,
+    rows: int,
+    *,
+    days: int,
+    seed_value: int,
+    batch_size: int = 100_000,
+) -> None:
+    """COPY `rows` synthetic articles into `news` in batches, then ANALYZE."""
+    site_ids = ensure_sites(engine)
+    now = datetime.now(timezone.utc)
+    with engine.begin() as conn:
+        create_partitions(
+            conn,
+            month_start(now - timedelta(days=days)),
+            add_months(month_start(now), 1),
+        )
+    generated = generate_rows(site_ids, rows, days=days, now=now, seed=seed_value)
+    start = time.perf_counter()
+    loaded = 0
+
+    connection = engine.raw_connection()
+    try:
+        while True:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            batch = 0
+            for site_id, title, url, scraped_at in generated:
+                scraped = scraped_at.isoformat()
+                writer.writerow((site_id, title, url, url_hash(url), scraped, scraped))
+                batch += 1
+                if batch == batch_size:
+                    break
+            if batch == 0:
+                break
+
+            buffer.seek(0)
+            with connection.cursor() as cursor:
+                cursor.copy_expert(
+                    "COPY news (site_id, title, url, url_hash, scraped_at, last_seen_at) "
+                    "FROM STDIN WITH (FORMAT csv)",
+                    buffer,
+                )
+            connection.commit()
+            loaded += batch
+            elapsed = time.perf_counter() - start
+            print(
+                f"\r{loaded:,}/{rows:,} rows ({loaded / elapsed:,.0f} rows/s)",
+                end="",
+                flush=True,
+            )
+    finally:
+        connection.close()
+
+    print()
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO news_keys (site_id, url_hash) "
+                "SELECT DISTINCT site_id, url_hash FROM news "
+                "ON CONFLICT DO NOTHING"
+            )
+        )
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("ANALYZE sites"))
+        conn.execute(text("ANALYZE news"))
+        conn.execute(text("ANALYZE news_keys"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Seed a synthetic news corpus")
+    parser.add_argument("--database-url", default=os.getenv("BENCH_DATABASE_URL"))
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--days", type=int, default=365, help="Age of the oldest row")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--reset", action="store_true", help="Delete existing news before seeding"
+    )
+    args = parser.parse_args()
+
+    if not args.database_url:
+        print("Set --database-url or BENCH_DATABASE_URL to a disposable database")
+        sys.exit(1)
+
+    engine = create_engine(args.database_url, future=True)
+    ensure_sites(engine)
+    with engine.begin() as conn:
+        if args.reset:
+            conn.execute(text("TRUNCATE news, news_keys RESTART IDENTITY"))
+        elif conn.execute(text("SELECT EXISTS (SELECT 1 FROM news)")).scalar():
+            print("The news table is not empty; pass --reset to replace it")
+            sys.exit(1)
+
+    seed(engine, args.rows, days=args.days, seed_value=args.seed)
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
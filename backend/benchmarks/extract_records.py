@@ -0,0 +1,159 @@
+"""
+Benchmark of the article objects built while extracting recorded homepages.
+
+Every scraper runs over the elements of its pages from `benchmarks/fixtures`
+(see `benchmarks.replay`), parsed once up front so only extraction is timed,
+in two variants:
+
+- `pydantic`: each candidate element becomes a validated `ScrapedArticle`, as
+  scrapers used to do.
+- `records`: each candidate becomes a slotted `ArticleRecord`, and the
+  articles that survive the scraper's filters are validated in bulk with
+  `validate_articles`, as the writer does before storing them.
+
+Besides the extraction time, `held_kb` is the memory taken by the extracted
+articles before validation, which is what waits in the writer's queue.
+
+Run from the backend directory:
+
+    uv run python -m benchmarks.extract_records
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from bs4 import Tag
+from loguru import logger
+
+from app.services.scrape import base, spec
+from app.services.scrape.base import ArticleRecord, ScrapedArticle, Scraper
+from app.services.scraping_core import get_scraper
+from app.services.site_registry import SUPPORTED_SITE_SLUGS
+from benchmarks.replay import (
+    DEFAULT_FIXTURE_DIR,
+    FixtureStore,
+    ReplayTransport,
+    installed,
+)
+
+VARIANTS = ("pydantic", "records")
+
+
+def load_elements(store: FixtureStore) -> dict[str, tuple[Scraper, list[Tag]]]:
+    """Parse the recorded pages of every site, keeping their elements."""
+    pages: dict[str, tuple[Scraper, list[Tag]]] = {}
+    with installed(ReplayTransport(store)):
+        for slug in SUPPORTED_SITE_SLUGS:
+            if (scraper := get_scraper(slug)) is None:
+                continue
+            try:
+                elements = scraper.get_elements()
+            except base.FetchError as exc:
+                print(f"Skipping {slug}: {exc}")
+                continue
+            if elements:
+                pages[slug] = (scraper, elements)
+    return pages
+
+
+@contextmanager
+def variant(name: str, pages: dict[str, tuple[Scraper, list[Tag]]]) -> Iterator[None]:
+    """Make the scrapers build the variant's objects from the parsed elements."""
+    release = base._release_trees
+    # The elements are reused by every run, so their trees must outlive it.
+    base._release_trees = lambda elements: None
+    spec.ArticleRecord = ScrapedArticle if name == "pydantic" else ArticleRecord
+    for scraper, elements in pages.values():
+        scraper.get_elements = lambda elements=elements: elements
+    try:
+        yield
+    finally:
+        base._release_trees = release
+        spec.ArticleRecord = ArticleRecord
+        for scraper, _ in pages.values():
+            del scraper.get_elements
+
+
+def extract(name: str, pages: dict[str, tuple[Scraper, list[Tag]]]) -> list:
+    """Extract every site's articles, validating them as the variant does."""
+    articles: list = []
+    for scraper, _ in pages.values():
+        extracted = list(scraper.iter_articles())
+        if name == "records":
+            extracted, _ = base.validate_articles(extracted)
+        articles.extend(extracted)
+    return articles
+
+
+def run_variant(
+    name: str, pages: dict[str, tuple[Scraper, list[Tag]]], runs: int
+) -> dict[str, float]:
+    with variant(name, pages):
+        extract(name, pages)
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            extract(name, pages)
+            timings.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        held = [list(scraper.iter_articles()) for scraper, _ in pages.values()]
+        held_bytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "median_ms": statistics.median(timings) * 1000,
+        "min_ms": min(timings) * 1000,
+        "held_kb": held_bytes / 1024,
+        "articles": sum(len(articles) for articles in held),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare article objects built during extraction"
+    )
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURE_DIR)
+    parser.add_argument("--runs", type=int, default=20, help="Timed runs per variant")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    store = FixtureStore(args.fixtures)
+    if not store.urls():
+        print(
+            f"No fixtures in {store.directory}; record them with scrape_cycle --capture"
+        )
+        sys.exit(1)
+
+    pages = load_elements(store)
+    candidates = sum(len(elements) for _, elements in pages.values())
+    print(f"{len(pages)} sites, {candidates} candidate elements, {args.runs} runs\n")
+
+    results = {name: run_variant(name, pages, args.runs) for name in VARIANTS}
+    print(
+        f"{'variant':<10}{'median_ms':>12}{'min_ms':>12}{'held_kb':>12}{'articles':>10}"
+    )
+    for name, result in results.items():
+        print(
+            f"{name:<10}{result['median_ms']:>12.2f}{result['min_ms']:>12.2f}"
+            f"{result['held_kb']:>12.1f}{result['articles']:>10}"
+        )
+
+    before, after = results["pydantic"], results["records"]
+    print(
+        f"\nrecords: {1 - after['min_ms'] / before['min_ms']:.0%} less time, "
+        f"{1 - after['held_kb'] / before['held_kb']:.0%} less memory held"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Import-time and memory benchmark for API and scraper cold starts.
+
+Each module is imported in a fresh interpreter so results are not skewed by
+modules cached in this process. Run from the backend directory:
+
+    uv run python -m benchmarks.import_startup --runs 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+TARGETS = {
+    "api": "app.main",
+    "scraper": "app.services.scraping",
+}
+
+_PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "modules": len(sys.modules),
+    "loads_scraping_stack": "requests" in sys.modules or "bs4" in sys.modules,
+}}))
+"""
+
+
+def measure(module: str, runs: int) -> dict[str, float | int | bool]:
+    """Import `module` in `runs` fresh interpreters and aggregate the results."""
+    samples: list[dict[str, float | int | bool]] = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+
+    seconds = [float(sample["seconds"]) for sample in samples]
+    return {
+        "median_ms": statistics.median(seconds) * 1000,
+        "min_ms": min(seconds) * 1000,
+        "max_rss_kb": int(statistics.median(int(s["max_rss_kb"]) for s in samples)),
+        "modules": int(samples[-1]["modules"]),
+        "loads_scraping_stack": bool(samples[-1]["loads_scraping_stack"]),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark cold-start imports")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per target")
+    args = parser.parse_args()
+
+    print(
+        f"{'target':<10}{'median ms':>12}{'min ms':>10}{'RSS KB':>10}"
+        f"{'modules':>10}  scraping stack"
+    )
+    for name, module in TARGETS.items():
+        result = measure(module, args.runs)
+        print(
+            f"{name:<10}{result['median_ms']:>12.1f}{result['min_ms']:>10.1f}"
+            f"{result['max_rss_kb']:>10}{result['modules']:>10}  "
+            f"{'yes' if result['loads_scraping_stack'] else 'no'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Record and replay of real page responses for offline scraping runs.
+
+In record mode the scrapers fetch pages as usual and every response is stored
+gzip-compressed in a fixture directory, indexed by URL in `manifest.json`. In
+replay mode the same URLs are served from those files, optionally with added
+latency and injected failures, so a full scraping cycle runs without network.
+
+Both modes swap `app.services.scrape.base._get`, the single function through
+which scrapers issue requests, for the duration of an `installed()` block.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import random
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import requests
+
+from app.services.scrape import base
+
+DEFAULT_FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+Transport = Callable[[str], requests.Response]
+
+
+class FixtureStore:
+    """Compressed page responses on disk, indexed by URL."""
+
+    def __init__(self, directory: Path = DEFAULT_FIXTURE_DIR) -> None:
+        self.directory = directory
+        self._manifest_path = directory / "manifest.json"
+        self.manifest: dict[str, dict[str, Any]] = (
+            json.loads(self._manifest_path.read_text())
+            if self._manifest_path.exists()
+            else {}
+        )
+
+    def __contains__(self, url: str) -> bool:
+        return url in self.manifest
+
+    def urls(self) -> list[str]:
+        return sorted(self.manifest)
+
+    def total_bytes(self) -> int:
+        return sum(entry["bytes"] for entry in self.manifest.values())
+
+    def save(self, url: str, response: requests.Response) -> None:
+        name = hashlib.sha256(url.encode()).hexdigest()[:16] + ".html.gz"
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / name).write_bytes(gzip.compress(response.content))
+        self.manifest[url] = {
+            "file": name,
+            "status": response.status_code,
+            "content_type": response.headers.get("Content-Type", "text/html"),
+            "encoding": response.encoding,
+            "bytes": len(response.content),
+            "captured_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self._manifest_path.write_text(
+            json.dumps(self.manifest, indent=2, sort_keys=True) + "\n"
+        )
+
+    def load(self, url: str) -> tuple[dict[str, Any], bytes]:
+        entry = self.manifest[url]
+        return entry, gzip.decompress((self.directory / entry["file"]).read_bytes())
+
+
+class RecordingTransport:
+    """Fetches pages for real and stores each successful response."""
+
+    def __init__(self, store: FixtureStore, fetch: Transport | None = None) -> None:
+        self.store = store
+        self._fetch = fetch or base._get
+
+    def __call__(self, url: str) -> requests.Response:
+        response = self._fetch(url)
+        self.store.save(url, response)
+        return response
+
+
+@dataclass
+class ReplayTransport:
+    """
+    Serves stored responses, with optional latency and failures.
+
+    Args:
+        store: Where the responses are read from.
+        latency: Seconds each response takes, before jitter.
+        jitter: Fraction of `latency` randomly added or removed.
+        error_rate: Probability that a request fails with a connection error.
+        seed: Seed for the latency jitter and error injection.
+    """
+
+    store: FixtureStore
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        self._random = random.Random(self.seed)
+        self._bodies: dict[str, tuple[dict[str, Any], bytes]] = {}
+
+    def __call__(self, url: str) -> requests.Response:
+        delay = self.latency * (1 + self._random.uniform(-self.jitter, self.jitter))
+        if delay > 0:
+            time.sleep(delay)
+
+        if self._random.random() < self.error_rate:
+            raise requests.ConnectionError(f"Injected failure for {url}")
+
+        response = requests.Response()
+        response.url = url
+        response.elapsed = timedelta(seconds=delay)
+        if url not in self.store:
+            response.status_code = 404
+            response._content = b""
+        else:
+            # Decompressing is part of setup, not of what is being measured.
+            if url not in self._bodies:
+                self._bodies[url] = self.store.load(url)
+            entry, body = self._bodies[url]
+            response.status_code = entry["status"]
+            response.headers["Content-Type"] = entry["content_type"]
+            response.encoding = entry["encoding"]
+            response._content = body
+
+        response.raise_for_status()
+        return response
+
+
+@contextmanager
+def installed(transport: Transport) -> Iterator[Transport]:
+    """Route every scraper request through `transport` inside the block."""
+    original = base._get
+    base._get = transport
+    try:
+        yield transport
+    finally:
+        base._get = original
@@ -0,0 +1,218 @@
+"""
+End-to-end benchmark of a full scraping cycle against recorded pages.
+
+Every supported site is scraped from the fixtures in `benchmarks/fixtures`
+(see `benchmarks.replay`) into an in-memory SQLite database, so the numbers
+cover fetching, parsing, extraction, deduplication and the commit, without
+network or Postgres noise. Run from the backend directory:
+
+    uv run python -m benchmarks.scrape_cycle --capture        # record pages
+    uv run python -m benchmarks.scrape_cycle --save-baseline  # store results
+    uv run python -m benchmarks.scrape_cycle                  # compare
+
+Compared with the stored baseline, a slower median cycle or a higher memory
+peak beyond `--threshold`, or fewer articles, is reported as a regression and
+the process exits with status 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models import NewsModel, ScrapeRunModel
+from app.services.scrape import base
+from app.services.scrape.circuit_breaker import HostCircuitBreaker
+from app.services.scraping import Scraping
+from benchmarks.replay import (
+    DEFAULT_FIXTURE_DIR,
+    FixtureStore,
+    RecordingTransport,
+    ReplayTransport,
+    installed,
+)
+from benchmarks.sqlite import memory_engine
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "scrape_cycle.json"
+
+# Results where a higher value is worse, checked against the threshold.
+_LOWER_IS_BETTER = ("median_seconds", "peak_memory_mb")
+
+
+def _run_cycle(measure_memory: bool = False) -> dict[str, float | int]:
+    """Scrape every site once into a fresh in-memory database."""
+    # Each cycle starts with every circuit closed, whatever earlier ones saw.
+    base.circuit_breaker = HostCircuitBreaker(
+        failure_threshold=settings.circuit_failure_threshold,
+        cooldown_seconds=settings.circuit_cooldown_seconds,
+    )
+
+    scraping = Scraping(settings.scrape_interval_seconds)
+    with memory_engine() as engine, Session(engine) as db:
+        if measure_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        scraping.scrape_all_sites_once(db)
+        seconds = time.perf_counter() - start
+        peak = 0
+        if measure_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        articles = db.query(func.count(NewsModel.id)).scalar() or 0
+        fetched = db.query(func.sum(ScrapeRunModel.response_bytes)).scalar() or 0
+
+    return {
+        "seconds": seconds,
+        "articles": articles,
+        "bytes": fetched,
+        "peak_memory_mb": peak / 2**20,
+    }
+
+
+def run_benchmark(transport: ReplayTransport, runs: int) -> dict[str, float | int]:
+    """Run one warm-up cycle, `runs` timed cycles and one traced cycle."""
+    with installed(transport):
+        _run_cycle()
+        timed = [_run_cycle() for _ in range(runs)]
+        traced = _run_cycle(measure_memory=True)
+
+    median = statistics.median(float(result["seconds"]) for result in timed)
+    articles = int(timed[-1]["articles"])
+    fetched = int(timed[-1]["bytes"])
+    return {
+        "median_seconds": median,
+        "min_seconds": min(float(result["seconds"]) for result in timed),
+        "articles": articles,
+        "articles_per_second": articles / median if median else 0.0,
+        "mb_per_second": fetched / 2**20 / median if median else 0.0,
+        "peak_memory_mb": float(traced["peak_memory_mb"]),
+    }
+
+
+def capture(store: FixtureStore) -> None:
+    """Scrape every site from the network, recording each page fetched."""
+    with installed(RecordingTransport(store)):
+        _run_cycle()
+
+    print(
+        f"Recorded {len(store.urls())} pages "
+        f"({store.total_bytes() / 2**20:.1f} MB) in {store.directory}"
+    )
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Return a description of every regression against the baseline."""
+    regressions = [
+        f"{name}: {results[name]:.3f} vs baseline {baseline[name]:.3f}"
+        for name in _LOWER_IS_BETTER
+        if results[name] > baseline[name] * (1 + threshold)
+    ]
+    if results["articles"] < baseline["articles"]:
+        regressions.append(
+            f"articles: {results['articles']} vs baseline {baseline['articles']}"
+        )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark a full scraping cycle")
+    parser.add_argument("--capture", action="store_true", help="Record live pages")
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURE_DIR)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--runs", type=int, default=5, help="Timed cycles")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed slowdown or memory growth over the baseline (default: 0.2)",
+    )
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    store = FixtureStore(args.fixtures)
+
+    if args.capture:
+        capture(store)
+        return
+
+    if not store.urls():
+        print(f"No fixtures in {store.directory}; record them with --capture")
+        sys.exit(1)
+
+    config = {
+        "pages": len(store.urls()),
+        "fixture_bytes": store.total_bytes(),
+        "latency_ms": args.latency_ms,
+        "jitter": args.jitter,
+        "error_rate": args.error_rate,
+    }
+    transport = ReplayTransport(
+        store,
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    results = run_benchmark(transport, args.runs)
+
+    for name, value in results.items():
+        print(f"{name:<22}{value:>12.3f}")
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(
+            json.dumps(
+                {
+                    "recorded_at": datetime.now(timezone.utc).isoformat(),
+                    "python": platform.python_version(),
+                    "config": config,
+                    "results": results,
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+        print(f"Baseline saved to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; store one with --save-baseline")
+        return
+
+    baseline = json.loads(args.baseline.read_text())
+    if baseline["config"] != config:
+        print("Warning: fixtures or replay settings differ from the baseline's")
+
+    if regressions := compare(results, baseline["results"], args.threshold):
+        print("Regressions beyond the threshold:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+
+    print(f"No regressions beyond {args.threshold:.0%} of the baseline")
+
+
+if __name__ == "__main__":
+    main()
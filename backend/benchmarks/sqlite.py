@@ -0,0 +1,48 @@
+"""
+In-memory SQLite databases for the benchmarks and the tests.
+
+The schema is PostgreSQL's, so a couple of things SQLite can't do are filled
+in here rather than in each caller.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.pool import StaticPool
+
+from app.models import Base, NewsModel
+
+
+@contextmanager
+def memory_engine() -> Iterator[Engine]:
+    """
+    An empty in-memory database with every table created, for the block.
+
+    The database is shared by all threads, as the scraper's writer needs.
+    SQLite can't generate `news.id`, which is only part of the primary key
+    (`scraped_at` is the other part, for partitioning on PostgreSQL), so news
+    rows inserted on this engine without an id are numbered in insertion
+    order.
+    """
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(engine)
+    ids = itertools.count(1)
+
+    def number_news(mapper, connection, news: NewsModel) -> None:
+        if news.id is None and connection.engine is engine:
+            news.id = next(ids)
+
+    event.listen(NewsModel, "before_insert", number_news)
+    try:
+        yield engine
+    finally:
+        event.remove(NewsModel, "before_insert", number_news)
+        engine.dispose()
@@ -0,0 +1,38 @@
+"""create scrape jobs
+
+Revision ID: 8a1f3c2d9b47
+Revises: 5675c65a68f1
+Create Date: 2026-10-18 09:12:41.118203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a1f3c2d9b47'
+down_revision: Union[str, Sequence[str], None] = '5675c65a68f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('scrape_jobs',
+    sa.Column('site_id', sa.Integer(), nullable=False),
+    sa.Column('next_run_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('lease_owner', sa.String(length=200), nullable=True),
+    sa.Column('lease_expires_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_run_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['site_id'], ['sites.id'], ),
+    sa.PrimaryKeyConstraint('site_id')
+    )
+    op.create_index(op.f('ix_scrape_jobs_next_run_at'), 'scrape_jobs', ['next_run_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_scrape_jobs_next_run_at'), table_name='scrape_jobs')
+    op.drop_table('scrape_jobs')
@@ -0,0 +1,34 @@
+"""add news last seen
+
+Revision ID: a85e1d3f6c29
+Revises: f7a3c9e15b62
+Create Date: 2026-10-19 18:27:49.116052
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a85e1d3f6c29'
+down_revision: Union[str, Sequence[str], None] = 'f7a3c9e15b62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('news', sa.Column('last_seen_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False))
+    op.add_column('news', sa.Column('seen_count', sa.Integer(), server_default='1', nullable=False))
+    # Earlier sightings weren't recorded; the first one is all that is known.
+    op.execute('UPDATE news SET last_seen_at = scraped_at')
+    op.create_index(op.f('ix_news_last_seen_at'), 'news', ['last_seen_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_news_last_seen_at'), table_name='news')
+    op.drop_column('news', 'seen_count')
+    op.drop_column('news', 'last_seen_at')
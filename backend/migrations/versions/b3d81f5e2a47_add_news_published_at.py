@@ -0,0 +1,29 @@
+"""add news published at
+
+Revision ID: b3d81f5e2a47
+Revises: a85e1d3f6c29
+Create Date: 2026-10-19 19:42:17.305518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d81f5e2a47'
+down_revision: Union[str, Sequence[str], None] = 'a85e1d3f6c29'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Only articles read from feeds have it; stored ones stay unknown.
+    op.add_column('news', sa.Column('published_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('news', 'published_at')
@@ -0,0 +1,46 @@
+"""create scrape runs
+
+Revision ID: c4e7b2a95d10
+Revises: 8a1f3c2d9b47
+Create Date: 2026-10-19 10:21:07.542816
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e7b2a95d10'
+down_revision: Union[str, Sequence[str], None] = '8a1f3c2d9b47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('scrape_runs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('site_id', sa.Integer(), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('duration_ms', sa.Integer(), nullable=False),
+    sa.Column('http_status', sa.SmallInteger(), nullable=True),
+    sa.Column('response_bytes', sa.Integer(), nullable=False),
+    sa.Column('elements', sa.Integer(), nullable=False),
+    sa.Column('extracted', sa.Integer(), nullable=False),
+    sa.Column('new_articles', sa.Integer(), nullable=False),
+    sa.Column('error', sa.String(length=100), nullable=True),
+    sa.Column('unchanged', sa.Boolean(), nullable=False),
+    sa.ForeignKeyConstraint(['site_id'], ['sites.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_scrape_runs_started_at'), 'scrape_runs', ['started_at'], unique=False)
+    op.create_index('ix_scrape_runs_site_started', 'scrape_runs', ['site_id', 'started_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_scrape_runs_site_started', table_name='scrape_runs')
+    op.drop_index(op.f('ix_scrape_runs_started_at'), table_name='scrape_runs')
+    op.drop_table('scrape_runs')
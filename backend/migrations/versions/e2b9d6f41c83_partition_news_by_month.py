@@ -0,0 +1,102 @@
+"""partition news by month
+
+Revision ID: e2b9d6f41c83
+Revises: c4e7b2a95d10
+Create Date: 2026-10-19 15:42:18.306511
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b9d6f41c83'
+down_revision: Union[str, Sequence[str], None] = 'c4e7b2a95d10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Month boundaries are UTC midnights whatever the server's time zone.
+    op.execute("SET LOCAL TIME ZONE 'UTC'")
+    op.create_table('news_partitioned',
+    sa.Column('id', sa.Integer(), sa.Identity(always=False), nullable=False),
+    sa.Column('site_id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=500), nullable=False),
+    sa.Column('url', sa.String(length=1000), nullable=False),
+    sa.Column('scraped_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['site_id'], ['sites.id'], name='news_site_id_fkey'),
+    sa.PrimaryKeyConstraint('id', 'scraped_at', name='news_partitioned_pkey'),
+    postgresql_partition_by='RANGE (scraped_at)'
+    )
+    # One partition per month from the oldest article to three months ahead;
+    # later months are created by the scraper.
+    op.execute("""
+    DO $$
+    DECLARE
+        month timestamptz;
+    BEGIN
+        FOR month IN
+            SELECT generate_series(
+                date_trunc('month', coalesce(min(scraped_at), now())),
+                date_trunc('month', now()) + interval '3 months',
+                interval '1 month'
+            )
+            FROM news
+        LOOP
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF news_partitioned FOR VALUES FROM (%L) TO (%L)',
+                to_char(month, '"news_y"YYYY"m"MM'),
+                month,
+                month + interval '1 month'
+            );
+        END LOOP;
+    END $$
+    """)
+    op.execute(
+        'INSERT INTO news_partitioned (id, site_id, title, url, scraped_at) '
+        'SELECT id, site_id, title, url, scraped_at FROM news'
+    )
+    op.drop_index(op.f('ix_news_site_id'), table_name='news')
+    op.drop_index(op.f('ix_news_scraped_at'), table_name='news')
+    op.drop_index(op.f('ix_news_id'), table_name='news')
+    op.drop_table('news')
+    op.rename_table('news_partitioned', 'news')
+    op.execute('ALTER TABLE news RENAME CONSTRAINT news_partitioned_pkey TO news_pkey')
+    op.execute('ALTER SEQUENCE news_partitioned_id_seq RENAME TO news_id_seq')
+    op.execute("SELECT setval('news_id_seq', coalesce(max(id), 0) + 1, false) FROM news")
+    op.create_index(op.f('ix_news_scraped_at'), 'news', ['scraped_at'], unique=False)
+    op.create_index(op.f('ix_news_site_id'), 'news', ['site_id'], unique=False)
+    op.create_index('ix_news_site_url', 'news', ['site_id', 'url'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_table('news_unpartitioned',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('site_id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=500), nullable=False),
+    sa.Column('url', sa.String(length=1000), nullable=False),
+    sa.Column('scraped_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['site_id'], ['sites.id'], name='news_site_id_fkey'),
+    sa.PrimaryKeyConstraint('id', name='news_unpartitioned_pkey'),
+    sa.UniqueConstraint('site_id', 'url', name='uq_news_site_url')
+    )
+    # Keeps the first row of a URL stored twice while it wasn't unique.
+    op.execute(
+        'INSERT INTO news_unpartitioned (id, site_id, title, url, scraped_at) '
+        'SELECT id, site_id, title, url, scraped_at FROM news ORDER BY id '
+        'ON CONFLICT ON CONSTRAINT uq_news_site_url DO NOTHING'
+    )
+    op.drop_table('news')
+    op.rename_table('news_unpartitioned', 'news')
+    op.execute('ALTER TABLE news RENAME CONSTRAINT news_unpartitioned_pkey TO news_pkey')
+    op.execute('CREATE SEQUENCE news_id_seq OWNED BY news.id')
+    op.execute("ALTER TABLE news ALTER COLUMN id SET DEFAULT nextval('news_id_seq')")
+    op.execute("SELECT setval('news_id_seq', coalesce(max(id), 0) + 1, false) FROM news")
+    op.create_index(op.f('ix_news_id'), 'news', ['id'], unique=False)
+    op.create_index(op.f('ix_news_scraped_at'), 'news', ['scraped_at'], unique=False)
+    op.create_index(op.f('ix_news_site_id'), 'news', ['site_id'], unique=False)
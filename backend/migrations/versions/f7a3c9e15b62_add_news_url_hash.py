@@ -0,0 +1,134 @@
+"""add news url hash
+
+Revision ID: f7a3c9e15b62
+Revises: e2b9d6f41c83
+Create Date: 2026-10-19 17:05:33.871240
+
+"""
+from typing import Sequence, Union
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7a3c9e15b62'
+down_revision: Union[str, Sequence[str], None] = 'e2b9d6f41c83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Pages the stored links were scraped from, to resolve relative ones.
+_BASE_URLS = {
+    'cnn': 'https://www.cnnbrasil.com.br/',
+    'globo': 'https://www.globo.com/',
+    'livecoins': 'https://livecoins.com.br/',
+    'metropoles': 'https://www.metropoles.com/',
+    'poder360': 'https://www.poder360.com.br/',
+    'uol': 'https://www.uol.com.br/',
+    'veja': 'https://veja.abril.com.br/',
+}
+
+# Frozen copy of app.services.url_keys.canonical_url as of this revision, so
+# later changes to canonicalization don't change what this migration does.
+_TRACKING_PARAMS = frozenset({
+    'fbclid', 'gclid', 'gclsrc', 'dclid', 'msclkid', 'mc_cid', 'mc_eid',
+    'igshid', '_ga', '_gl',
+})
+_DEFAULT_PORTS = {'http': ':80', 'https': ':443'}
+
+
+def _is_tracking(param: str) -> bool:
+    name = param.split('=', 1)[0].lower()
+    return name.startswith('utm_') or name in _TRACKING_PARAMS
+
+
+def canonical_url(url: str, base_url: str | None = None) -> str:
+    url = url.strip()
+    if base_url:
+        url = urljoin(base_url, url)
+
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if (default_port := _DEFAULT_PORTS.get(scheme)) is not None:
+        netloc = netloc.removesuffix(default_port)
+    query = '&'.join(
+        param for param in parts.query.split('&') if param and not _is_tracking(param)
+    )
+    return urlunsplit((scheme, netloc, parts.path or '/', query, ''))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('news', sa.Column('url_hash', sa.Uuid(), nullable=True))
+    op.create_table('news_keys',
+    sa.Column('site_id', sa.Integer(), nullable=False),
+    sa.Column('url_hash', sa.Uuid(), nullable=False),
+    sa.ForeignKeyConstraint(['site_id'], ['sites.id'], ),
+    sa.PrimaryKeyConstraint('site_id', 'url_hash')
+    )
+
+    # Rewrite the URLs that aren't canonical yet.
+    conn = op.get_bind()
+    op.execute(
+        'CREATE TEMPORARY TABLE news_canonical '
+        '(id integer, scraped_at timestamptz, url varchar(1000)) ON COMMIT DROP'
+    )
+    base_urls = {
+        site_id: _BASE_URLS.get(slug)
+        for site_id, slug in conn.execute(sa.text('SELECT id, slug FROM sites'))
+    }
+    result = conn.execute(
+        sa.text('SELECT id, scraped_at, site_id, url FROM news')
+        .execution_options(yield_per=10000)
+    )
+    for rows in result.partitions():
+        changed = []
+        for id_, scraped_at, site_id, url in rows:
+            try:
+                canonical = canonical_url(url, base_urls.get(site_id))[:1000]
+            except ValueError:
+                # A malformed URL is kept, and hashed, as it was stored.
+                continue
+            if canonical != url:
+                changed.append({'id': id_, 'scraped_at': scraped_at, 'url': canonical})
+        if changed:
+            conn.execute(
+                sa.text('INSERT INTO news_canonical VALUES (:id, :scraped_at, :url)'),
+                changed,
+            )
+    op.execute(
+        'UPDATE news SET url = c.url FROM news_canonical c '
+        'WHERE news.id = c.id AND news.scraped_at = c.scraped_at'
+    )
+    # Same value as app.services.url_keys.url_hash.
+    op.execute('UPDATE news SET url_hash = md5(url)::uuid')
+
+    # Links that only differed by tracking parameters and the like now
+    # collide; keep the first time each was seen.
+    op.execute(
+        'DELETE FROM news USING ('
+        'SELECT id, scraped_at, row_number() OVER ('
+        'PARTITION BY site_id, url_hash ORDER BY scraped_at, id) AS position '
+        'FROM news) ranked '
+        'WHERE news.id = ranked.id AND news.scraped_at = ranked.scraped_at '
+        'AND ranked.position > 1'
+    )
+    op.execute(
+        'INSERT INTO news_keys (site_id, url_hash) '
+        'SELECT DISTINCT site_id, url_hash FROM news'
+    )
+
+    op.alter_column('news', 'url_hash', existing_type=sa.Uuid(), nullable=False)
+    op.drop_index('ix_news_site_url', table_name='news')
+    op.create_index('ix_news_site_url_hash', 'news', ['site_id', 'url_hash'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Canonicalized URLs and merged duplicates are not restored.
+    op.drop_index('ix_news_site_url_hash', table_name='news')
+    op.create_index('ix_news_site_url', 'news', ['site_id', 'url'], unique=False)
+    op.drop_table('news_keys')
+    op.drop_column('news', 'url_hash')
@@ -7,13 +7,19 @@ It can be run manually, via cron job, or by a process manager.
 """
 
 import argparse
+import os
 import signal
 import sys
+import threading
 import time
 from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
 
 from loguru import logger
+from prometheus_client import REGISTRY, start_http_server, write_to_textfile
 
+from app import profiling
 from app.config import settings
 from app.services.scraping import Scraping
 
@@ -21,23 +27,48 @@ from app.services.scraping import Scraping
 class ScraperProcess:
     """Manages the scraper process lifecycle."""
 
-    def __init__(self):
-        self.scraping = Scraping(settings.scrape_interval_seconds)
+    def __init__(self, profile_cycles: int = 0):
+        self.profile_cycles = profile_cycles
+        self.scraping = Scraping(
+            settings.scrape_interval_seconds,
+            distributed=settings.scrape_distributed,
+        )
         self._running = False
+        self._stopping = False
         self._setup_signal_handlers()
 
     def _setup_signal_handlers(self):
-        """Setup signal handlers for graceful shutdown."""
+        """Setup signal handlers for graceful shutdown.
+
+        The first signal cancels the running cycle, which flushes what it has
+        and returns; a watchdog kills the process if that takes longer than
+        the shutdown timeout. A second signal exits immediately.
+        """
 
         def signal_handler(signum, frame):
-            logger.info(f"Received signal {signum}, initiating graceful shutdown")
+            if self._stopping:
+                logger.warning(f"Received signal {signum} again, exiting now")
+                os._exit(1)
+
+            self._stopping = True
             self._running = False
-            self.scraping.shutdown(timeout=10.0)
-            sys.exit(0)
+            timeout = settings.scraper_shutdown_timeout_seconds
+            # Armed first, so it fires even if the handler itself gets stuck.
+            watchdog = threading.Timer(timeout, self._force_exit, args=(timeout,))
+            watchdog.daemon = True
+            watchdog.start()
+
+            logger.info(f"Received signal {signum}, initiating graceful shutdown")
+            self.scraping.shutdown(timeout=timeout)
 
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
 
+    @staticmethod
+    def _force_exit(timeout: float):
+        logger.error(f"Scraper did not stop within {timeout}s, forcing exit")
+        os._exit(1)
+
     @contextmanager
     def managed_session(self):
         """Context manager for scraping session with error handling."""
@@ -54,15 +85,18 @@ class ScraperProcess:
         """Run a single scraping cycle."""
         logger.info("Starting single scraping cycle")
         try:
-            self.scraping.run_once()
+            with self.profiled_cycle():
+                self.scraping.run_once()
             logger.info("Single scraping cycle completed")
         except Exception as exc:
             logger.exception("Error during scraping cycle: {exc}", exc=exc)
+        finally:
+            self._export_metrics()
 
     def run_continuous(self):
-        """Run scraping continuously with the configured interval."""
+        """Run scraping continuously, polling each site when it is due."""
         logger.info(
-            f"Starting continuous scraping with {self.scraping.interval_seconds}s interval"
+            f"Starting continuous scraping with {self.scraping.interval_seconds}s base interval"
         )
 
         self._running = True
@@ -70,27 +104,89 @@ class ScraperProcess:
         with self.managed_session():
             while self._running:
                 start_time = time.time()
+                sleep_time = float(self.scraping.interval_seconds)
 
                 try:
-                    self.scraping.run_once()
+                    with self.profiled_cycle():
+                        sleep_time = self.scraping.run_due()
                 except Exception as exc:
                     logger.exception("Error during scraping cycle: {exc}", exc=exc)
 
-                cycle_duration = time.time() - start_time
-                sleep_time = max(0, self.scraping.interval_seconds - cycle_duration)
+                self._export_metrics()
 
-                if sleep_time > 0:
-                    logger.debug(f"Sleeping for {sleep_time:.2f}s until next cycle")
-                    time.sleep(sleep_time)
-                else:
+                cycle_duration = time.time() - start_time
+                if cycle_duration > self.scraping.interval_seconds:
                     logger.warning(
                         f"Scraping cycle took {cycle_duration:.2f}s, "
                         f"longer than interval {self.scraping.interval_seconds}s"
                     )
 
+                if sleep_time > 0:
+                    logger.debug(
+                        f"Sleeping for {sleep_time:.2f}s until next site is due"
+                    )
+                    self.scraping.wait(sleep_time)
+
+    @contextmanager
+    def profiled_cycle(self):
+        """Sample the cycle run inside the block while profiled cycles remain.
+
+        Each profiled cycle is written to PROFILE_DIR as folded stacks rooted
+        at the site and stage being scraped, ready for flamegraph.pl or
+        speedscope. Cycles in which nothing was scraped are not counted.
+        """
+        if self.profile_cycles <= 0:
+            yield
+            return
+
+        sampler = profiling.StackSampler(settings.profile_sample_interval_ms / 1000)
+        with profiling.activate(sampler):
+            yield
+
+        if not sampler.samples:
+            return
+
+        self.profile_cycles -= 1
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        path = Path(settings.profile_dir) / f"scrape-{stamp}.folded"
+        try:
+            sampler.write_folded(path)
+        except OSError as exc:
+            logger.error("Failed to write profile: {exc}", exc=exc)
+            return
+
+        totals = sampler.section_totals()
+        breakdown = ", ".join(
+            f"{'/'.join(labels) or 'other'}={count}"
+            for labels, count in totals.most_common()
+        )
+        logger.info(
+            f"Wrote cycle profile to {path} ({self.profile_cycles} left); "
+            f"samples per site/stage: {breakdown}"
+        )
+
+    def _start_metrics_server(self):
+        """Serve metrics over HTTP when a port is configured."""
+        if settings.scraper_metrics_port:
+            start_http_server(settings.scraper_metrics_port)
+            logger.info(
+                f"Serving metrics on port {settings.scraper_metrics_port} at /metrics"
+            )
+
+    def _export_metrics(self):
+        """Write metrics to the textfile collector path, if configured."""
+        if not settings.scraper_metrics_textfile:
+            return
+
+        try:
+            write_to_textfile(settings.scraper_metrics_textfile, REGISTRY)
+        except OSError as exc:
+            logger.error("Failed to write metrics textfile: {exc}", exc=exc)
+
     def run(self, mode: str = "continuous"):
         """Run the scraper in the specified mode."""
         logger.info(f"Starting scraper process in '{mode}' mode")
+        self._start_metrics_server()
 
         if mode == "single":
             self.run_single_cycle()
@@ -115,6 +211,28 @@ def main():
         type=int,
         help=f"Scraping interval in seconds (default: {settings.scrape_interval_seconds})",
     )
+    parser.add_argument(
+        "--distributed",
+        action="store_true",
+        help="Coordinate with other scraper processes through per-site leases",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        help="Serve Prometheus metrics on this port (default: SCRAPER_METRICS_PORT)",
+    )
+
+    parser.add_argument(
+        "--profile",
+        type=int,
+        default=0,
+        metavar="CYCLES",
+        help="Profile the next CYCLES cycles, writing folded stacks to PROFILE_DIR",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        help=f"Directory for cycle profiles (default: {settings.profile_dir})",
+    )
 
     args = parser.parse_args()
     if args.interval:
@@ -123,6 +241,19 @@ def main():
             sys.exit(1)
         settings.scrape_interval_seconds = args.interval
 
+    if args.distributed:
+        settings.scrape_distributed = True
+
+    if args.metrics_port is not None:
+        settings.scraper_metrics_port = args.metrics_port
+
+    if args.profile < 0:
+        logger.error("Profiled cycles must be 0 or more")
+        sys.exit(1)
+
+    if args.profile_dir:
+        settings.profile_dir = args.profile_dir
+
     if not settings.database_url:
         logger.error("DATABASE_URL environment variable is required")
         sys.exit(1)
@@ -131,8 +262,12 @@ def main():
         f"Database URL configured: {settings.database_url.split('@')[1] if '@' in settings.database_url else 'localhost'}"
     )
     logger.info(f"Scraping interval: {settings.scrape_interval_seconds} seconds")
+    if settings.scrape_distributed:
+        logger.info(
+            f"Distributed mode: leases of {settings.scrape_lease_seconds} seconds"
+        )
 
-    scraper = ScraperProcess()
+    scraper = ScraperProcess(profile_cycles=args.profile)
     scraper.run(mode=args.mode)
 
 
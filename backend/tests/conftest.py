@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy import Engine
+
+from benchmarks.sqlite import memory_engine
+
+
+@pytest.fixture
+def sqlite_engine() -> Iterator[Engine]:
+    with memory_engine() as engine:
+        yield engine
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from app.services.cancellation import (
+    CycleCancelled,
+    CycleContext,
+    CycleDeadlineExceeded,
+    current_cycle,
+    run_cancellable,
+)
+
+
+def test_run_returns_result_of_finished_call() -> None:
+    cycle = CycleContext(deadline_seconds=None)
+
+    assert cycle.run(lambda: "done") == "done"
+
+
+def test_cancel_interrupts_blocked_call_immediately() -> None:
+    cycle = CycleContext(deadline_seconds=None)
+    release = threading.Event()
+    threading.Timer(0.05, cycle.cancel).start()
+
+    start = time.monotonic()
+    with pytest.raises(CycleCancelled):
+        cycle.run(lambda: release.wait(timeout=5.0))
+    release.set()
+
+    assert time.monotonic() - start < 1.0
+
+
+def test_cancel_landing_while_run_registers_its_waiter() -> None:
+    # As a signal handler would, on the thread that is inside run().
+    cycle = CycleContext(deadline_seconds=None)
+
+    class CancellingSet(set):
+        def add(self, waiter: threading.Event) -> None:
+            cycle.cancel()
+            super().add(waiter)
+
+    cycle._waiters = CancellingSet()
+    outcome: list[BaseException] = []
+
+    def call() -> None:
+        try:
+            cycle.run(lambda: time.sleep(5.0))
+        except CycleCancelled as exc:
+            outcome.append(exc)
+
+    thread = threading.Thread(target=call, daemon=True)
+    thread.start()
+    thread.join(timeout=1.0)
+
+    assert not thread.is_alive()
+    assert outcome
+
+
+def test_deadline_interrupts_blocked_call() -> None:
+    cycle = CycleContext(deadline_seconds=0.05)
+    release = threading.Event()
+
+    with pytest.raises(CycleDeadlineExceeded):
+        cycle.run(lambda: release.wait(timeout=5.0))
+    release.set()
+
+
+def test_wait_returns_early_on_cancel() -> None:
+    cycle = CycleContext(deadline_seconds=None)
+    threading.Timer(0.05, cycle.cancel).start()
+
+    start = time.monotonic()
+    assert cycle.wait(5.0)
+    assert time.monotonic() - start < 1.0
+
+
+def test_run_cancellable_uses_active_cycle() -> None:
+    cycle = CycleContext(deadline_seconds=None)
+    cycle.cancel()
+
+    assert run_cancellable(lambda: "direct") == "direct"
+
+    token = current_cycle.set(cycle)
+    try:
+        with pytest.raises(CycleCancelled):
+            run_cancellable(lambda: "never")
+    finally:
+        current_cycle.reset(token)
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+import requests
+
+from app.services.scrape import base as base_module
+from app.services.scrape.base import FetchError, fetch_elements
+from app.services.scrape.circuit_breaker import CircuitState, HostCircuitBreaker
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breaker(clock: _Clock) -> HostCircuitBreaker:
+    return HostCircuitBreaker(failure_threshold=3, cooldown_seconds=60, clock=clock)
+
+
+def test_circuit_opens_after_consecutive_failures() -> None:
+    breaker = _breaker(_Clock())
+
+    for _ in range(3):
+        assert breaker.allow("r7.com")
+        breaker.record_failure("r7.com")
+
+    assert not breaker.allow("r7.com")
+    assert breaker.states() == {"r7.com": CircuitState.OPEN}
+    assert breaker.allow("uol.com.br")
+
+
+def test_success_resets_failure_count() -> None:
+    breaker = _breaker(_Clock())
+
+    breaker.record_failure("r7.com")
+    breaker.record_failure("r7.com")
+    breaker.record_success("r7.com")
+    breaker.record_failure("r7.com")
+
+    assert breaker.allow("r7.com")
+
+
+def test_half_open_allows_single_probe() -> None:
+    clock = _Clock()
+    breaker = _breaker(clock)
+    for _ in range(3):
+        breaker.record_failure("r7.com")
+
+    clock.now = 60.0
+
+    assert breaker.allow("r7.com")
+    assert not breaker.allow("r7.com")
+    assert breaker.states()["r7.com"] is CircuitState.HALF_OPEN
+
+    breaker.record_success("r7.com")
+
+    assert breaker.allow("r7.com")
+    assert breaker.states()["r7.com"] is CircuitState.CLOSED
+
+
+def test_failed_probe_reopens_circuit() -> None:
+    clock = _Clock()
+    breaker = _breaker(clock)
+    for _ in range(3):
+        breaker.record_failure("r7.com")
+
+    clock.now = 60.0
+    assert breaker.allow("r7.com")
+    breaker.record_failure("r7.com")
+
+    assert breaker.states()["r7.com"] is CircuitState.OPEN
+    clock.now = 90.0
+    assert not breaker.allow("r7.com")
+
+
+def test_fetch_elements_fails_fast_when_circuit_open(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = 0
+
+    def fake_get(url: str, headers: dict[str, str], timeout: int) -> Any:
+        nonlocal calls
+        calls += 1
+        raise requests.ConnectionError("down")
+
+    breaker = HostCircuitBreaker(failure_threshold=2, cooldown_seconds=60)
+    monkeypatch.setattr(base_module, "circuit_breaker", breaker)
+    monkeypatch.setattr(requests, "get", fake_get)
+
+    for _ in range(3):
+        with pytest.raises(FetchError):
+            fetch_elements("https://example.com", tag="a")
+
+    assert calls == 2
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.corpus import SITE_WEIGHTS, generate_rows
+
+_NOW = datetime(2026, 1, 15, 12, tzinfo=timezone.utc)
+_SITE_IDS = {slug: index for index, slug in enumerate(SITE_WEIGHTS, start=1)}
+
+
+def test_generated_rows_are_unique_recent_and_reproducible() -> None:
+    rows = list(generate_rows(_SITE_IDS, 5000, days=30, now=_NOW, seed=7))
+
+    assert rows == list(generate_rows(_SITE_IDS, 5000, days=30, now=_NOW, seed=7))
+    assert len({url for _, _, url, _ in rows}) == len(rows)
+    assert all(
+        _NOW - timedelta(days=31) <= scraped_at <= _NOW for *_, scraped_at in rows
+    )
+    assert all(0 < len(title) <= 500 for _, title, _, _ in rows)
+
+
+def test_generated_rows_follow_site_weights() -> None:
+    rows = generate_rows(_SITE_IDS, 20000, days=30, now=_NOW, seed=1)
+    per_site = Counter(site_id for site_id, *_ in rows)
+
+    assert per_site[_SITE_IDS["globo"]] > per_site[_SITE_IDS["livecoins"]] * 3
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.services.scrape.hedging import HedgeBudget, LatencyTracker, hedged_call
+
+
+@pytest.fixture
+def executor() -> Iterator[ThreadPoolExecutor]:
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        yield pool
+
+
+def test_latency_tracker_needs_min_samples() -> None:
+    tracker = LatencyTracker(window=10, min_samples=3)
+    tracker.record(1.0)
+    tracker.record(2.0)
+
+    assert tracker.percentile(0.95) is None
+
+    tracker.record(3.0)
+
+    assert tracker.percentile(0.95) == 3.0
+    assert tracker.percentile(0.0) == 1.0
+
+
+def test_hedge_budget_caps_extra_requests() -> None:
+    budget = HedgeBudget(max_ratio=0.25, burst=1.0)
+    granted = 0
+    for _ in range(20):
+        budget.on_request()
+        granted += budget.try_acquire()
+
+    assert granted == 5
+
+
+def test_hedged_call_returns_first_result_when_primary_stalls(
+    executor: ThreadPoolExecutor,
+) -> None:
+    release = threading.Event()
+    calls = 0
+    lock = threading.Lock()
+    discarded: list[str] = []
+
+    def fetch() -> str:
+        nonlocal calls
+        with lock:
+            calls += 1
+            attempt = calls
+        if attempt == 1:
+            release.wait(timeout=5.0)
+            return "slow"
+        return "hedge"
+
+    budget = HedgeBudget(max_ratio=1.0)
+    result = hedged_call(
+        fetch,
+        hedge_after=0.01,
+        budget=budget,
+        executor=executor,
+        on_discard=discarded.append,
+    )
+    release.set()
+    executor.shutdown(wait=True)
+
+    assert result == "hedge"
+    assert discarded == ["slow"]
+
+
+def test_hedged_call_without_budget_waits_for_primary(
+    executor: ThreadPoolExecutor,
+) -> None:
+    calls = 0
+
+    def fetch() -> str:
+        nonlocal calls
+        calls += 1
+        threading.Event().wait(timeout=0.05)
+        return "primary"
+
+    result = hedged_call(
+        fetch,
+        hedge_after=0.01,
+        budget=HedgeBudget(max_ratio=0.0),
+        executor=executor,
+    )
+
+    assert result == "primary"
+    assert calls == 1
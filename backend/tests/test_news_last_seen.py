@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+
+from app.models import NewsModel, SiteModel
+from app.routers.news import _query_news
+from app.services.news_writer import mark_seen
+from app.services.url_keys import url_hash
+
+_NOW = datetime(2026, 3, 10, 12, tzinfo=timezone.utc)
+
+
+def _seed(db: Session) -> list[NewsModel]:
+    db.add(SiteModel(id=1, slug="veja", name="Veja"))
+    rows = []
+    for n in range(3):
+        url = f"https://veja.abril.com.br/politica/noticia-{n}/"
+        scraped_at = _NOW - timedelta(hours=3 - n)
+        rows.append(
+            NewsModel(
+                site_id=1,
+                title=f"Notícia {n}",
+                url=url,
+                url_hash=url_hash(url),
+                scraped_at=scraped_at,
+                last_seen_at=scraped_at,
+            )
+        )
+    db.add_all(rows)
+    db.commit()
+    return rows
+
+
+def test_mark_seen_updates_only_the_given_articles(sqlite_engine) -> None:
+    with Session(sqlite_engine) as db:
+        oldest, _, newest = _seed(db)
+
+        mark_seen(db, 1, [oldest.url_hash], _NOW)
+        db.commit()
+
+        seen = {
+            row.id: (row.last_seen_at.replace(tzinfo=timezone.utc), row.seen_count)
+            for row in db.query(NewsModel)
+        }
+        assert seen[oldest.id] == (_NOW, 2)
+        assert seen[newest.id] == (_NOW - timedelta(hours=1), 1)
+
+
+def test_homepage_sort_puts_articles_still_listed_first(sqlite_engine) -> None:
+    with Session(sqlite_engine) as db:
+        oldest, _, _ = _seed(db)
+        mark_seen(db, 1, [oldest.url_hash], _NOW)
+        db.commit()
+
+        recent = _query_news(db, (("veja",), None, None, "recent", 1, 20))
+        homepage = _query_news(db, (("veja",), None, None, "homepage", 1, 20))
+
+    assert [item.id for item in recent.items] == [3, 2, 1]
+    assert [item.id for item in homepage.items] == [1, 3, 2]
+    assert homepage.items[0].seen_count == 2
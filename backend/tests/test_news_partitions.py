@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import csv
+import gzip
+import io
+import os
+from collections.abc import Iterator
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models import Base, NewsModel, SiteModel
+from app.services.news_partitions import (
+    add_months,
+    archive_expired_partitions,
+    attached_partitions,
+    ensure_partitions,
+    month_start,
+    partition_name,
+)
+from app.services.url_keys import url_hash
+
+_TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+_needs_postgres = pytest.mark.skipif(
+    not _TEST_DATABASE_URL,
+    reason="TEST_DATABASE_URL not set; partition tests need a disposable Postgres",
+)
+
+
+def test_months_are_counted_in_utc() -> None:
+    late_evening = datetime(2026, 1, 31, 23, 30, tzinfo=timezone.utc)
+
+    assert month_start(late_evening) == date(2026, 1, 1)
+    assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+    assert partition_name(date(2026, 3, 1)) == "news_y2026m03"
+
+
+def test_ensure_partitions_is_a_noop_outside_postgres() -> None:
+    engine = create_engine("sqlite://", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        assert ensure_partitions(db) == []
+    engine.dispose()
+
+
+@pytest.fixture
+def db() -> Iterator[Session]:
+    assert _TEST_DATABASE_URL is not None
+    engine = create_engine(_TEST_DATABASE_URL, future=True)
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    try:
+        with factory() as session:
+            yield session
+    finally:
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+
+
+@_needs_postgres
+def test_expired_partitions_are_exported_and_dropped(
+    db: Session, tmp_path: Path
+) -> None:
+    now = datetime(2026, 6, 15, tzinfo=timezone.utc)
+    created = ensure_partitions(db, datetime(2026, 1, 1, tzinfo=timezone.utc), 6)
+    db.commit()
+    assert created[0] == "news_y2026m01"
+    assert ensure_partitions(db, now, 1) == []
+
+    site = SiteModel(slug="veja", name="Veja")
+    db.add(site)
+    db.flush()
+    db.add_all(
+        [
+            NewsModel(
+                site_id=site.id,
+                title="Antiga",
+                url="https://veja.abril.com.br/antiga",
+                url_hash=url_hash("https://veja.abril.com.br/antiga"),
+                scraped_at=datetime(2026, 1, 20, tzinfo=timezone.utc),
+            ),
+            NewsModel(
+                site_id=site.id,
+                title="Recente",
+                url="https://veja.abril.com.br/recente",
+                url_hash=url_hash("https://veja.abril.com.br/recente"),
+                scraped_at=datetime(2026, 6, 1, tzinfo=timezone.utc),
+            ),
+        ]
+    )
+    db.commit()
+
+    written = archive_expired_partitions(db, 3, tmp_path, now=now)
+
+    assert written == [
+        tmp_path / "news_y2026m01.csv.gz",
+        tmp_path / "news_y2026m02.csv.gz",
+    ]
+    rows = list(
+        csv.DictReader(io.StringIO(gzip.decompress(written[0].read_bytes()).decode()))
+    )
+    assert [row["title"] for row in rows] == ["Antiga"]
+    assert min(attached_partitions(db)) == date(2026, 3, 1)
+    assert db.execute(text("SELECT count(*) FROM news")).scalar() == 1
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import func
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.orm import Session
+
+from app.models import NewsKeyModel, NewsModel, SiteModel
+from app.services import news_writer
+from app.services.news_writer import NewsWriter, SiteArticles, WriteResult
+from app.services.recent_urls import RecentUrls
+from app.services.scrape.base import ArticleRecord
+
+_NOW = datetime(2026, 3, 10, 12, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def engine(sqlite_engine):
+    with Session(sqlite_engine) as db:
+        db.add_all(
+            [
+                SiteModel(id=1, slug="veja", name="Veja"),
+                SiteModel(id=2, slug="cnn", name="CNN Brasil"),
+            ]
+        )
+        db.commit()
+    return sqlite_engine
+
+
+def _articles(site: str, count: int) -> list[ArticleRecord]:
+    return [
+        ArticleRecord(
+            title=f"Notícia {n} do site {site}", url=f"https://{site}.com/n/{n}"
+        )
+        for n in range(count)
+    ]
+
+
+def _writer(engine, session_factory=None, **options) -> NewsWriter:
+    options = {
+        "queue_size": 2,
+        "batch_size": 100,
+        "batch_seconds": 0.05,
+        "max_retries": 2,
+        "retry_delay": 0.01,
+        **options,
+    }
+    return NewsWriter(
+        session_factory or (lambda: Session(engine, autoflush=False)),
+        RecentUrls(1000),
+        **options,
+    )
+
+
+def test_writer_stores_new_articles_and_marks_the_rest_seen(engine) -> None:
+    writer = _writer(engine)
+    writer.start()
+    writer.submit(SiteArticles("veja", 1, _articles("veja", 3), _NOW))
+    writer.submit(SiteArticles("cnn", 2, _articles("cnn", 2), _NOW))
+    assert writer.close() == {
+        "veja": WriteResult(new_articles=3),
+        "cnn": WriteResult(new_articles=2),
+    }
+
+    writer = _writer(engine)
+    writer.start()
+    writer.submit(SiteArticles("veja", 1, _articles("veja", 4), _NOW))
+    assert writer.close() == {"veja": WriteResult(new_articles=1)}
+
+    with Session(engine) as db:
+        assert db.query(func.count(NewsKeyModel.url_hash)).scalar() == 6
+        seen = dict(
+            db.query(NewsModel.url, NewsModel.seen_count).filter(NewsModel.site_id == 1)
+        )
+    assert seen == {
+        "https://veja.com/n/0": 2,
+        "https://veja.com/n/1": 2,
+        "https://veja.com/n/2": 2,
+        "https://veja.com/n/3": 1,
+    }
+
+
+def test_writer_stores_the_publication_time_of_feed_articles(engine) -> None:
+    published = datetime(2026, 3, 10, 9, 30, tzinfo=timezone.utc)
+    article = ArticleRecord(
+        title="Notícia lida do feed",
+        url="https://veja.com/feed/1",
+        published_at=published,
+    )
+
+    writer = _writer(engine)
+    writer.start()
+    writer.submit(SiteArticles("veja", 1, [article, *_articles("veja", 1)], _NOW))
+    writer.close()
+
+    with Session(engine) as db:
+        stored = dict(db.query(NewsModel.url, NewsModel.published_at))
+    assert stored["https://veja.com/n/0"] is None
+    # SQLite drops the time zone.
+    assert stored["https://veja.com/feed/1"].replace(tzinfo=timezone.utc) == published
+
+
+def test_writer_retries_transient_errors(engine) -> None:
+    failures = iter([OperationalError("COMMIT", {}, Exception("server closed"))])
+
+    class FlakySession(Session):
+        def commit(self) -> None:
+            if (exc := next(failures, None)) is not None:
+                raise exc
+            super().commit()
+
+    writer = _writer(engine, lambda: FlakySession(engine, autoflush=False))
+    writer.start()
+    writer.submit(SiteArticles("veja", 1, _articles("veja", 2), _NOW))
+
+    assert writer.close() == {"veja": WriteResult(new_articles=2)}
+    with Session(engine) as db:
+        assert db.query(func.count(NewsModel.id)).scalar() == 2
+
+
+def test_writer_reports_sites_of_a_failed_batch(engine) -> None:
+    class BrokenSession(Session):
+        def commit(self) -> None:
+            raise ProgrammingError("INSERT", {}, Exception("no such column"))
+
+    writer = _writer(engine, lambda: BrokenSession(engine, autoflush=False))
+    writer.start()
+    writer.submit(SiteArticles("veja", 1, _articles("veja", 2), _NOW))
+
+    assert writer.close() == {"veja": WriteResult(error="ProgrammingError")}
+    assert len(writer.recent_urls) == 0
+    with Session(engine) as db:
+        assert db.query(func.count(NewsModel.id)).scalar() == 0
+
+
+def test_submit_blocks_while_the_queue_is_full(engine) -> None:
+    release = threading.Event()
+
+    class SlowSession(Session):
+        def commit(self) -> None:
+            release.wait(timeout=5)
+            super().commit()
+
+    writer = _writer(
+        engine, lambda: SlowSession(engine, autoflush=False), queue_size=1, batch_size=1
+    )
+    writer.start()
+    writer.submit(SiteArticles("veja", 1, _articles("veja", 1), _NOW))
+    writer.submit(SiteArticles("cnn", 2, _articles("cnn", 1), _NOW))
+    blocked = threading.Thread(
+        target=writer.submit,
+        args=(SiteArticles("cnn-2", 2, _articles("cnn-2", 1), _NOW),),
+    )
+    blocked.start()
+    blocked.join(timeout=0.2)
+    assert blocked.is_alive()
+
+    release.set()
+    blocked.join(timeout=5)
+    assert not blocked.is_alive()
+    assert set(writer.close()) == {"veja", "cnn", "cnn-2"}
+
+
+def test_writer_that_died_fails_its_sites_without_blocking(
+    engine, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def broken_validation(records: list[ArticleRecord]):
+        raise RuntimeError("validation crashed")
+
+    monkeypatch.setattr(news_writer, "validate_articles", broken_validation)
+    writer = _writer(engine, queue_size=1)
+    writer.start()
+    # More sites than the queue holds: none of the submissions may block.
+    for slug in ("veja", "cnn", "uol", "globo"):
+        writer.submit(SiteArticles(slug, 1, _articles(slug, 1), _NOW))
+
+    results = writer.close()
+
+    assert set(results) == {"veja", "cnn", "uol", "globo"}
+    assert {result.error for result in results.values()} <= {
+        "RuntimeError",
+        "WriterStopped",
+    }
+    assert results["veja"].error == "RuntimeError"
+
+
+def test_writer_whose_session_cannot_open_fails_its_sites(engine) -> None:
+    def no_session() -> Session:
+        raise OperationalError("connect", {}, Exception("connection refused"))
+
+    writer = _writer(engine, no_session)
+    writer.start()
+    writer.submit(SiteArticles("veja", 1, _articles("veja", 1), _NOW))
+
+    assert writer.close()["veja"].error is not None
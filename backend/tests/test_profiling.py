@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from app import profiling
+from app.profiling import RequestProfiler, StackSampler
+
+
+def _busy(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def test_section_is_a_shared_no_op_without_active_sampler() -> None:
+    assert profiling.section("veja", "fetch") is profiling.section("uol", "extract")
+
+
+def test_samples_are_rooted_at_the_active_section() -> None:
+    sampler = StackSampler(interval=0.001)
+
+    with profiling.activate(sampler):
+        with profiling.section("veja", "extract"):
+            _busy(0.1)
+
+    totals = sampler.section_totals()
+    assert totals[("veja", "extract")] > 0
+    assert all(
+        line.rsplit(" ", 1)[1].isdigit() for line in sampler.folded().splitlines()
+    )
+    assert any("_busy" in stack for stack in sampler.samples)
+
+
+def test_sections_of_concurrent_threads_keep_their_own_labels() -> None:
+    sampler = StackSampler(interval=0.001)
+    started = threading.Barrier(2, timeout=5.0)
+
+    def scrape_veja() -> None:
+        with profiling.section("veja", "extract"):
+            started.wait()
+            _busy(0.1)
+
+    def scrape_uol() -> None:
+        with profiling.section("uol", "extract"):
+            started.wait()
+            _busy(0.1)
+
+    with profiling.activate(sampler):
+        threads = [
+            threading.Thread(target=scrape_veja),
+            threading.Thread(target=scrape_uol),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5.0)
+
+    stacks = [stack for stack in sampler.samples if "_busy" in stack]
+    assert any(stack.startswith("[veja]") for stack in stacks)
+    assert any(stack.startswith("[uol]") for stack in stacks)
+    assert all(
+        stack.startswith("[veja]") == ("scrape_veja" in stack) for stack in stacks
+    )
+
+
+def test_request_profiler_profiles_only_the_armed_path_and_count() -> None:
+    profiler = RequestProfiler(interval=0.001)
+    profiler.arm("/news", requests=2)
+
+    assert profiler.claim("/sites") is None
+
+    first = profiler.claim("/news")
+    assert first is not None
+    # Only one request is sampled at a time.
+    assert profiler.claim("/news") is None
+    profiler.collect(first)
+
+    second = profiler.claim("/news")
+    assert second is not None
+    profiler.collect(second)
+
+    assert profiler.claim("/news") is None
+    assert profiler.profiled == 2
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+
+from app.models import NewsModel, SiteModel
+from app.services.recent_urls import RecentUrls
+from app.services.url_keys import url_hash
+
+
+def test_least_recently_seen_keys_are_evicted_first() -> None:
+    first, second, third = (uuid.uuid4() for _ in range(3))
+    recent = RecentUrls(capacity=2)
+
+    recent.add(1, [first, second])
+    assert recent.seen(1, first)
+    recent.add(1, [third])
+
+    assert len(recent) == 2
+    assert recent.seen(1, first)
+    assert not recent.seen(1, second)
+    assert recent.seen(1, third)
+    assert not recent.seen(2, first)
+
+
+def test_disabled_filter_never_reports_a_hit() -> None:
+    recent = RecentUrls(capacity=0)
+    key = uuid.uuid4()
+
+    recent.add(1, [key])
+
+    assert not recent.seen(1, key)
+
+
+def test_warm_loads_the_most_recent_articles_within_the_window(sqlite_engine) -> None:
+    now = datetime(2026, 3, 10, tzinfo=timezone.utc)
+    urls = [f"https://www.metropoles.com/brasil/noticia-{n}" for n in range(4)]
+
+    with Session(sqlite_engine) as db:
+        db.add(SiteModel(id=1, slug="metropoles", name="Metrópoles"))
+        db.add_all(
+            NewsModel(
+                site_id=1,
+                title=f"Notícia {n}",
+                url=url,
+                url_hash=url_hash(url),
+                scraped_at=now - timedelta(days=n * 3),
+            )
+            for n, url in enumerate(urls)
+        )
+        db.commit()
+
+        recent = RecentUrls(capacity=2)
+        assert recent.warm(db, days=7, now=now) == 2
+
+    assert recent.seen(1, url_hash(urls[0]))
+    assert recent.seen(1, url_hash(urls[1]))
+    assert not recent.seen(1, url_hash(urls[2]))
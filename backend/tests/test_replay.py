@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import requests
+
+from app.services.scrape.base import FetchError, fetch_elements
+from benchmarks.replay import FixtureStore, ReplayTransport, installed
+
+_URL = "https://replay.example.com/"
+_HTML = "<html><body><a href='/1'>Um</a><a href='/2'>Dois</a></body></html>"
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> FixtureStore:
+    store = FixtureStore(tmp_path)
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response._content = _HTML.encode()
+    store.save(_URL, response)
+    # Read back from disk, as a benchmark run would.
+    return FixtureStore(tmp_path)
+
+
+def test_replay_serves_recorded_pages(store: FixtureStore) -> None:
+    with installed(ReplayTransport(store)):
+        elements = fetch_elements(_URL, tag="a")
+
+    assert [element.get_text() for element in elements] == ["Um", "Dois"]
+
+
+def test_replay_answers_unknown_urls_with_404(store: FixtureStore) -> None:
+    with installed(ReplayTransport(store)):
+        with pytest.raises(FetchError) as error:
+            fetch_elements(_URL + "missing", tag="a")
+
+    assert error.value.retryable is False
+
+
+def test_replay_injects_connection_errors(store: FixtureStore) -> None:
+    with installed(ReplayTransport(store, error_rate=1.0)):
+        with pytest.raises(FetchError) as error:
+            fetch_elements(_URL, tag="a")
+
+    assert error.value.retryable is True
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from app.services.retry_queue import RetryQueue
+
+
+def test_retry_is_ready_only_after_backoff() -> None:
+    queue = RetryQueue(max_retries=3, budget=10, base_delay=2.0)
+
+    delay = queue.schedule("uol", now=0.0)
+
+    assert delay is not None and 2.0 <= delay <= 3.0
+    assert queue.pop_ready(now=1.0) is None
+    assert queue.seconds_until_next(now=1.0) == delay - 1.0
+    assert queue.pop_ready(now=delay) == "uol"
+    assert len(queue) == 0
+
+
+def test_retry_backoff_doubles_per_attempt() -> None:
+    queue = RetryQueue(max_retries=3, budget=10, base_delay=2.0)
+
+    first = queue.schedule("uol", now=0.0)
+    second = queue.schedule("uol", now=0.0)
+
+    assert first is not None and second is not None
+    assert 4.0 <= second <= 5.0 and first < second
+
+
+def test_retries_stop_at_site_limit_and_cycle_budget() -> None:
+    queue = RetryQueue(max_retries=2, budget=3, base_delay=1.0)
+
+    assert queue.schedule("r7", now=0.0) is not None
+    assert queue.schedule("r7", now=0.0) is not None
+    assert queue.schedule("r7", now=0.0) is None
+    assert queue.schedule("uol", now=0.0) is not None
+    assert queue.schedule("cnn", now=0.0) is None
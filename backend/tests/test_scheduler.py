@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from app.services.scheduler import AdaptiveScheduler
+
+
+def _scheduler() -> AdaptiveScheduler:
+    return AdaptiveScheduler(
+        ["fast", "slow"],
+        base_interval=60,
+        min_interval=30,
+        max_interval=900,
+        target_new_per_poll=2.0,
+    )
+
+
+def test_all_sites_are_due_at_start() -> None:
+    scheduler = _scheduler()
+
+    assert set(scheduler.due_sites(now=0.0)) == {"fast", "slow"}
+    assert scheduler.seconds_until_next(now=0.0) == 0.0
+
+
+def test_interval_follows_observed_rate_within_bounds() -> None:
+    scheduler = _scheduler()
+    scheduler.record("fast", 40, now=0.0)
+    scheduler.record("slow", 40, now=0.0)
+
+    scheduler.record("fast", 10, now=60.0)
+    scheduler.record("slow", 0, now=60.0)
+
+    assert scheduler.interval_for("fast") == 30
+    assert scheduler.interval_for("slow") == 90
+
+
+def test_quiet_site_backs_off_to_max_interval() -> None:
+    scheduler = _scheduler()
+    now = 0.0
+    for _ in range(20):
+        now += scheduler.record("slow", 0, now=now)
+
+    assert scheduler.interval_for("slow") == 900
+
+
+def test_site_is_due_only_after_its_interval() -> None:
+    scheduler = _scheduler()
+    scheduler.record("fast", 5, now=0.0)
+    scheduler.record("slow", 5, now=0.0)
+
+    assert scheduler.due_sites(now=59.0) == []
+    assert scheduler.seconds_until_next(now=59.0) == 1.0
+    assert set(scheduler.due_sites(now=60.0)) == {"fast", "slow"}
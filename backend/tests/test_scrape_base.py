@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+from datetime import timedelta
 from typing import Any
 
 import pytest
 import requests
+from bs4 import BeautifulSoup, Tag
 from pydantic import ValidationError
 
-from app.services.scrape.base import ScrapedArticle, fetch_elements
+from app.services.scrape.base import (
+    ArticleRecord,
+    FetchError,
+    ScrapedArticle,
+    Scraper,
+    fetch_elements,
+    validate_articles,
+)
 
 _HTML_SIMPLE = """
 <html>
@@ -23,11 +32,13 @@ def _make_response(text: str, status_code: int = 200) -> Any:
     class _Response:
         def __init__(self, body: str, code: int) -> None:
             self.text = body
+            self.content = body.encode()
             self.status_code = code
+            self.elapsed = timedelta(0)
 
         def raise_for_status(self) -> None:
             if self.status_code >= 400:
-                raise requests.HTTPError(f"status {self.status_code}")
+                raise requests.HTTPError(f"status {self.status_code}", response=self)
 
     return _Response(text, status_code)
 
@@ -43,6 +54,23 @@ def test_scraped_article_rejects_empty_title() -> None:
         ScrapedArticle(title="", url="https://example.com")
 
 
+def test_validate_articles_drops_invalid_records() -> None:
+    records = [
+        ArticleRecord(title="Titulo", url="https://example.com/1"),
+        ArticleRecord(title="", url="https://example.com/2"),
+        ArticleRecord(title="T" * 501, url="https://example.com/3"),
+        ArticleRecord(title="Outro titulo", url="https://example.com/4"),
+    ]
+
+    articles, invalid = validate_articles(records)
+
+    assert invalid == 2
+    assert [article.url for article in articles] == [
+        "https://example.com/1",
+        "https://example.com/4",
+    ]
+
+
 def test_fetch_elements_returns_matching_tags(monkeypatch: pytest.MonkeyPatch) -> None:
     def fake_get(url: str, headers: dict[str, str], timeout: int) -> Any:
         return _make_response(_HTML_SIMPLE)
@@ -64,6 +92,77 @@ def test_fetch_elements_handles_request_exception(
 
     monkeypatch.setattr(requests, "get", fake_get)
 
-    elements = fetch_elements("https://example.com", tag="a")
+    with pytest.raises(FetchError) as exc_info:
+        fetch_elements("https://example.com", tag="a")
+
+    assert exc_info.value.retryable
+
+
+def test_fetch_elements_does_not_retry_client_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fake_get(url: str, headers: dict[str, str], timeout: int) -> Any:
+        return _make_response("", status_code=404)
+
+    monkeypatch.setattr(requests, "get", fake_get)
+
+    with pytest.raises(FetchError) as exc_info:
+        fetch_elements("https://example.com", tag="a")
+
+    assert not exc_info.value.retryable
+
+
+class _ListScraper(Scraper):
+    base_url = "https://example.com/"
+    min_title_length = 5
+
+    def __init__(self, html: str) -> None:
+        super().__init__("example")
+        self.html = html
+        self.elements: list[Tag] = []
+
+    def get_elements(self) -> list[Tag] | None:
+        soup = BeautifulSoup(self.html, "html.parser")
+        self.elements = list(soup.find_all("a"))
+        return self.elements
+
+    def extract_article(self, element: Tag) -> ArticleRecord | None:
+        return ArticleRecord(title=element.get_text(), url=str(element["href"]))
+
+
+def test_iter_articles_stops_at_the_limit_and_releases_the_tree() -> None:
+    html = "".join(
+        f'<p><a href="/noticia-{n}">Notícia número {n}</a></p>' for n in range(5)
+    )
+    scraper = _ListScraper(html)
+
+    articles = list(scraper.iter_articles(limit=2))
+
+    assert [article.url for article in articles] == [
+        "https://example.com/noticia-0",
+        "https://example.com/noticia-1",
+    ]
+    assert all(element.decomposed for element in scraper.elements)
+
+
+def test_iter_articles_releases_the_tree_when_the_caller_stops() -> None:
+    scraper = _ListScraper(
+        '<a href="/a">Primeira notícia</a><a href="/b">Outra notícia</a>'
+    )
+
+    articles = scraper.iter_articles()
+    assert next(articles).url == "https://example.com/a"
+    assert not scraper.elements[0].decomposed
+
+    articles.close()
+    assert all(element.decomposed for element in scraper.elements)
+
+
+def test_iter_articles_drops_malformed_links() -> None:
+    scraper = _ListScraper(
+        '<a href="http://[oops/x">Link quebrado</a><a href="/b">Outra notícia</a>'
+    )
+
+    articles = list(scraper.iter_articles())
 
-    assert elements is None
+    assert [article.url for article in articles] == ["https://example.com/b"]
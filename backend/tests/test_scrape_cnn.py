@@ -4,7 +4,7 @@ import pytest
 from bs4 import BeautifulSoup, Tag
 
 from app.services.scrape import base as base_module
-from app.services.scrape.cnn import CNNScraper
+from app.services.scrape.spec import SpecScraper
 
 _HTML_CNN_HOME = """
 <html>
@@ -35,7 +35,7 @@ _HTML_CNN_HOME = """
 """
 
 
-def _fake_fetch_elements(url: str, tag: str = "figure") -> list[Tag]:
+def _fake_fetch_elements(url: str, tag: str = "figure", **kwargs) -> list[Tag]:
     soup = BeautifulSoup(_HTML_CNN_HOME, "html.parser")
     return list(soup.find_all(tag))
 
@@ -43,7 +43,7 @@ def _fake_fetch_elements(url: str, tag: str = "figure") -> list[Tag]:
 def test_cnn_scraper_extracts_clean_titles(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(base_module, "fetch_elements", _fake_fetch_elements)
 
-    scraper = CNNScraper()
+    scraper = SpecScraper("cnn")
     articles = scraper.scrape()
 
     titles = {article.title for article in articles}
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+from bs4 import BeautifulSoup, Tag
+
+from app.services.scrape import base as base_module
+from app.services.scrape import feeds as feeds_module
+from app.services.scrape.circuit_breaker import HostCircuitBreaker
+from app.services.scrape.feeds import iter_feed
+from app.services.scrape.spec import SpecScraper
+from app.services.scrape_runs import ScrapeRun, current_run
+
+_RSS = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/">
+  <channel>
+    <title>VEJA</title>
+    <link>https://veja.abril.com.br</link>
+    <image><url>https://veja.abril.com.br/logo.png</url><title>VEJA</title></image>
+    <item>
+      <media:content url="https://veja.abril.com.br/foto.jpg"><media:title>Foto</media:title></media:content>
+      <title>Governo anuncia novas medidas para a economia</title>
+      <link>https://veja.abril.com.br/economia/novas-medidas/</link>
+      <pubDate>{published}</pubDate>
+    </item>
+    <item>
+      <title>Notícia sem link</title>
+    </item>
+    <item>
+      <title><![CDATA[Congresso aprova a reforma em segundo turno]]></title>
+      <link>https://veja.abril.com.br/politica/reforma-aprovada/</link>
+    </item>
+  </channel>
+</rss>
+"""
+
+_ATOM = """<?xml version="1.0" encoding="ISO-8859-1"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Livecoins</title>
+  <entry>
+    <title>Bitcoin atinge novo recorde histórico</title>
+    <link rel="self" href="https://livecoins.com.br/feed/1"/>
+    <link href="https://livecoins.com.br/bitcoin-recorde/"/>
+    <updated>2026-03-10T15:00:00Z</updated>
+    <published>2026-03-10T12:30:00-03:00</published>
+  </entry>
+</feed>
+"""
+
+_NEWS_SITEMAP = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:news="http://www.google.com/schemas/sitemap-news/0.9"
+        xmlns:image="http://www.google.com/schemas/sitemap-image/1.1">
+  <url>
+    <loc>https://www.poder360.com.br/politica/senado-vota-orcamento/</loc>
+    <image:image><image:title>Plenário do Senado</image:title></image:image>
+    <news:news>
+      <news:publication_date>2026-03-10T09:15:00</news:publication_date>
+      <news:title>Senado vota o orçamento nesta terça-feira</news:title>
+    </news:news>
+  </url>
+  <url>
+    <loc>https://www.poder360.com.br/sobre/</loc>
+    <lastmod>2026-03-01</lastmod>
+  </url>
+</urlset>
+"""
+
+_HTML_VEJA_HOME = """
+<a href="https://veja.abril.com.br/politica/noticia-1">
+  <h2 class="title">Manchete sobre politica brasileira</h2>
+</a>
+"""
+
+
+def _rss(published: datetime) -> bytes:
+    return _RSS.format(published=format_datetime(published)).encode()
+
+
+def test_iter_feed_reads_rss_items() -> None:
+    published = datetime(2026, 3, 10, 14, 5, tzinfo=timezone.utc)
+
+    articles = list(iter_feed(_rss(published)))
+
+    assert [(a.title, a.url, a.published_at) for a in articles] == [
+        (
+            "Governo anuncia novas medidas para a economia",
+            "https://veja.abril.com.br/economia/novas-medidas/",
+            published,
+        ),
+        (
+            "Congresso aprova a reforma em segundo turno",
+            "https://veja.abril.com.br/politica/reforma-aprovada/",
+            None,
+        ),
+    ]
+
+
+def test_iter_feed_reads_atom_entries_and_news_sitemaps(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Items split across chunks are read all the same.
+    monkeypatch.setattr(feeds_module, "_CHUNK_SIZE", 7)
+
+    (entry,) = iter_feed(_ATOM.encode("iso-8859-1"))
+    (news,) = iter_feed(_NEWS_SITEMAP.encode())
+
+    assert entry.title == "Bitcoin atinge novo recorde histórico"
+    assert entry.url == "https://livecoins.com.br/bitcoin-recorde/"
+    assert entry.published_at == datetime(2026, 3, 10, 15, 30, tzinfo=timezone.utc)
+    assert news.title == "Senado vota o orçamento nesta terça-feira"
+    assert news.url == "https://www.poder360.com.br/politica/senado-vota-orcamento/"
+    assert news.published_at == datetime(2026, 3, 10, 9, 15, tzinfo=timezone.utc)
+
+
+def _fake_fetch_elements(url: str, tag: str = "a", **kwargs) -> list[Tag]:
+    soup = BeautifulSoup(_HTML_VEJA_HOME, "html.parser")
+    return list(soup.find_all(tag))
+
+
+@pytest.mark.parametrize(
+    ("age", "expected"),
+    [
+        (timedelta(minutes=5), "Governo anuncia novas medidas para a economia"),
+        (timedelta(days=2), "Manchete sobre politica brasileira"),
+    ],
+)
+def test_scraper_falls_back_to_the_page_when_the_feed_is_stale(
+    monkeypatch: pytest.MonkeyPatch, age: timedelta, expected: str
+) -> None:
+    feed = _rss(datetime.now(timezone.utc) - age)
+    monkeypatch.setattr(base_module, "fetch_page", lambda url, *a, **kw: feed)
+    monkeypatch.setattr(base_module, "fetch_elements", _fake_fetch_elements)
+
+    articles = SpecScraper("veja").scrape()
+
+    assert articles[0].title == expected
+
+
+def test_scraper_falls_back_to_the_page_when_the_feed_is_malformed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(base_module, "fetch_page", lambda url, *a, **kw: b"<rss><")
+    monkeypatch.setattr(base_module, "fetch_elements", _fake_fetch_elements)
+
+    articles = SpecScraper("veja").scrape()
+
+    assert [article.title for article in articles] == [
+        "Manchete sobre politica brasileira"
+    ]
+
+
+def test_failed_feed_is_not_held_against_the_host(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fake_get(url: str, headers: dict[str, str], timeout: int) -> None:
+        raise requests.ConnectionError("down")
+
+    breaker = HostCircuitBreaker(failure_threshold=1, cooldown_seconds=60)
+    monkeypatch.setattr(base_module, "circuit_breaker", breaker)
+    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr(base_module, "fetch_elements", _fake_fetch_elements)
+    run = ScrapeRun(site_id=1)
+    token = current_run.set(run)
+    try:
+        articles = SpecScraper("veja").scrape()
+    finally:
+        current_run.reset(token)
+
+    assert len(articles) == 1
+    assert breaker.allow("veja.abril.com.br")
+    assert run.error is None
+
+
+def test_feed_links_outside_the_site_are_dropped(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    feed = _rss(datetime.now(timezone.utc)).replace(
+        b"https://veja.abril.com.br/politica/", b"https://golpe.example.com/"
+    )
+    monkeypatch.setattr(base_module, "fetch_page", lambda url, *a, **kw: feed)
+
+    articles = SpecScraper("veja").scrape()
+
+    assert [article.url for article in articles] == [
+        "https://veja.abril.com.br/economia/novas-medidas/"
+    ]
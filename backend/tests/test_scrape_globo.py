@@ -4,7 +4,7 @@ import pytest
 from bs4 import BeautifulSoup, Tag
 
 from app.services.scrape import base as base_module
-from app.services.scrape.globo import GloboScraper
+from app.services.scrape.spec import SpecScraper
 
 _HTML_GLOBO_HOME = """
 <html>
@@ -26,7 +26,7 @@ _HTML_GLOBO_HOME = """
 """
 
 
-def _fake_fetch_elements(url: str, tag: str = "a") -> list[Tag]:
+def _fake_fetch_elements(url: str, tag: str = "a", **kwargs) -> list[Tag]:
     soup = BeautifulSoup(_HTML_GLOBO_HOME, "html.parser")
     return list(soup.find_all(tag))
 
@@ -36,7 +36,7 @@ def test_globo_scraper_extracts_articles_from_home(
 ) -> None:
     monkeypatch.setattr(base_module, "fetch_elements", _fake_fetch_elements)
 
-    scraper = GloboScraper()
+    scraper = SpecScraper("globo")
     articles = scraper.scrape()
 
     titles = {article.title for article in articles}
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models import Base, ScrapeJobModel, SiteModel
+from app.services.scrape_leases import (
+    claim_due_sites,
+    ensure_jobs_exist,
+    release_lease,
+    renew_leases,
+)
+
+_TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not _TEST_DATABASE_URL,
+    reason="TEST_DATABASE_URL not set; lease tests need a disposable Postgres",
+)
+
+
+@pytest.fixture
+def session_factory() -> Iterator[sessionmaker[Session]]:
+    assert _TEST_DATABASE_URL is not None
+    engine = create_engine(_TEST_DATABASE_URL, future=True)
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    try:
+        yield factory
+    finally:
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+
+
+@pytest.fixture
+def site_ids(session_factory: sessionmaker[Session]) -> list[int]:
+    with session_factory() as db:
+        sites = [SiteModel(slug=f"site{i}", name=f"Site {i}") for i in range(3)]
+        db.add_all(sites)
+        db.commit()
+        ids = [site.id for site in sites]
+        ensure_jobs_exist(db, ids)
+        return ids
+
+
+def test_concurrent_workers_never_claim_the_same_site(
+    session_factory: sessionmaker[Session],
+    site_ids: list[int],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    with session_factory() as first, session_factory() as second:
+        # The first claim's transaction stays open, so its rows are still
+        # locked and their leases not yet visible when the second one runs.
+        with monkeypatch.context() as patch:
+            patch.setattr(first, "commit", first.flush)
+            claimed_first = claim_due_sites(first, "worker-a", site_ids, 60, limit=2)
+        # Waiting on the locks instead of skipping them fails fast.
+        second.execute(text("SET LOCAL lock_timeout = '2s'"))
+        claimed_second = claim_due_sites(second, "worker-b", site_ids, 60)
+        first.commit()
+
+    assert len(claimed_first) == 2
+    assert len(claimed_second) == 1
+    assert set(claimed_first).isdisjoint(claimed_second)
+
+
+def test_released_site_is_not_due_until_next_run(
+    session_factory: sessionmaker[Session], site_ids: list[int]
+) -> None:
+    with session_factory() as db:
+        claimed = claim_due_sites(db, "worker-a", site_ids, 60)
+        next_run_at = datetime.now(timezone.utc) + timedelta(hours=1)
+        for site_id in claimed:
+            release_lease(db, "worker-a", site_id, next_run_at)
+
+        assert claim_due_sites(db, "worker-b", site_ids, 60) == []
+        job = db.get(ScrapeJobModel, claimed[0])
+        assert job is not None
+        assert job.lease_owner is None
+
+
+def test_renew_only_touches_own_leases(
+    session_factory: sessionmaker[Session], site_ids: list[int]
+) -> None:
+    with session_factory() as db:
+        claimed = claim_due_sites(db, "worker-a", site_ids, 60)
+
+        assert renew_leases(db, "worker-a", claimed, 60) == len(claimed)
+        assert renew_leases(db, "worker-b", claimed, 60) == 0
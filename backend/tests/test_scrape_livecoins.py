@@ -4,7 +4,7 @@ import pytest
 from bs4 import BeautifulSoup, Tag
 
 from app.services.scrape import base as base_module
-from app.services.scrape.livecoins import LivecoinsScraper
+from app.services.scrape.spec import SpecScraper
 
 _HTML_LIVECOINS_HOME = """
 <html>
@@ -17,17 +17,22 @@ _HTML_LIVECOINS_HOME = """
 """
 
 
-def _fake_fetch_elements(url: str, tag: str = "a") -> list[Tag]:
+def _fake_fetch_elements(url: str, tag: str = "a", **kwargs) -> list[Tag]:
     soup = BeautifulSoup(_HTML_LIVECOINS_HOME, "html.parser")
     return list(soup.find_all(tag))
 
 
+def _unavailable_feed(url: str, *args, **kwargs) -> str:
+    raise base_module.FetchError(url, "Feed unavailable", retryable=False)
+
+
 def test_livecoins_scraper_filters_by_rel_bookmark(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     monkeypatch.setattr(base_module, "fetch_elements", _fake_fetch_elements)
+    monkeypatch.setattr(base_module, "fetch_page", _unavailable_feed)
 
-    scraper = LivecoinsScraper()
+    scraper = SpecScraper("livecoins")
     articles = scraper.scrape()
 
     titles = {article.title for article in articles}
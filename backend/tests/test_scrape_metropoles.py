@@ -4,7 +4,7 @@ import pytest
 from bs4 import BeautifulSoup, Tag
 
 from app.services.scrape import base as base_module
-from app.services.scrape.metropoles import MetropolesScraper
+from app.services.scrape.spec import SpecScraper
 
 _HTML_METROPOLES_HOME = """
 <html>
@@ -23,17 +23,22 @@ _HTML_METROPOLES_HOME = """
 """
 
 
-def _fake_fetch_elements(url: str, tag: str = "a") -> list[Tag]:
+def _fake_fetch_elements(url: str, tag: str = "a", **kwargs) -> list[Tag]:
     soup = BeautifulSoup(_HTML_METROPOLES_HOME, "html.parser")
     return list(soup.find_all(tag))
 
 
+def _unavailable_feed(url: str, *args, **kwargs) -> str:
+    raise base_module.FetchError(url, "Feed unavailable", retryable=False)
+
+
 def test_metropoles_scraper_matches_news_pattern(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     monkeypatch.setattr(base_module, "fetch_elements", _fake_fetch_elements)
+    monkeypatch.setattr(base_module, "fetch_page", _unavailable_feed)
 
-    scraper = MetropolesScraper()
+    scraper = SpecScraper("metropoles")
     articles = scraper.scrape()
 
     assert len(articles) == 1
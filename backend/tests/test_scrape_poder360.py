@@ -4,7 +4,7 @@ import pytest
 from bs4 import BeautifulSoup, Tag
 
 from app.services.scrape import base as base_module
-from app.services.scrape.poder360 import Poder360Scraper
+from app.services.scrape.spec import SpecScraper
 
 _HTML_PODER360_HOME = """
 <html>
@@ -23,17 +23,22 @@ _HTML_PODER360_HOME = """
 """
 
 
-def _fake_fetch_elements(url: str, tag: str = "h2") -> list[Tag]:
+def _fake_fetch_elements(url: str, tag: str = "h2", **kwargs) -> list[Tag]:
     soup = BeautifulSoup(_HTML_PODER360_HOME, "html.parser")
     return list(soup.find_all(["h2", "h3"]))
 
 
+def _unavailable_feed(url: str, *args, **kwargs) -> str:
+    raise base_module.FetchError(url, "Feed unavailable", retryable=False)
+
+
 def test_poder360_scraper_filters_by_known_classes(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     monkeypatch.setattr(base_module, "fetch_elements", _fake_fetch_elements)
+    monkeypatch.setattr(base_module, "fetch_page", _unavailable_feed)
 
-    scraper = Poder360Scraper()
+    scraper = SpecScraper("poder360")
     articles = scraper.scrape()
 
     titles = {article.title for article in articles}
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+import requests
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models import Base, ScrapeRunModel, SiteModel
+from app.services.scrape.base import FetchError, fetch_elements
+from app.services.scrape_runs import (
+    ScrapeRun,
+    current_run,
+    record_runs,
+    summarize_runs,
+)
+
+
+@pytest.fixture
+def db() -> Iterator[Session]:
+    # The summary query is portable SQL, so an in-memory database is enough.
+    engine = create_engine("sqlite://", future=True)
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    with factory() as session:
+        yield session
+    engine.dispose()
+
+
+def _run(site_id: int, started_at: datetime, **fields: Any) -> ScrapeRun:
+    run = ScrapeRun(site_id=site_id, started_at=started_at)
+    for name, value in fields.items():
+        setattr(run, name, value)
+    run.finish()
+    return run
+
+
+def test_runs_are_written_in_one_batch_and_summarized(db: Session) -> None:
+    veja = SiteModel(slug="veja", name="Veja")
+    uol = SiteModel(slug="uol", name="UOL")
+    db.add_all([veja, uol])
+    db.commit()
+
+    now = datetime.now(timezone.utc)
+    record_runs(
+        db,
+        [
+            _run(veja.id, now - timedelta(days=2), extracted=50),
+            _run(veja.id, now - timedelta(minutes=10), extracted=40, new_articles=3),
+            _run(veja.id, now - timedelta(minutes=5), extracted=0, unchanged=True),
+            _run(
+                uol.id, now - timedelta(minutes=5), error="HTTPError", http_status=503
+            ),
+        ],
+    )
+    db.commit()
+
+    assert db.query(ScrapeRunModel).count() == 4
+
+    summary = {
+        row["site_slug"]: row for row in summarize_runs(db, now - timedelta(hours=1))
+    }
+
+    assert summary["veja"]["runs"] == 2
+    assert summary["veja"]["avg_extracted"] == 20.0
+    assert summary["veja"]["new_articles"] == 3
+    assert summary["veja"]["unchanged_runs"] == 1
+    assert summary["veja"]["last_extracted"] == 0
+    assert summary["uol"]["failures"] == 1
+    assert summary["uol"]["last_error"] == "HTTPError"
+    assert summary["uol"]["last_http_status"] == 503
+
+
+def test_fetch_elements_fills_the_current_run(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _Response:
+        status_code = 200
+        text = "<a href='https://example.com/1'>One</a>"
+        content = text.encode()
+        elapsed = timedelta(0)
+
+        def raise_for_status(self) -> None:
+            pass
+
+    monkeypatch.setattr(requests, "get", lambda *args, **kwargs: _Response())
+
+    run = ScrapeRun(site_id=1)
+    token = current_run.set(run)
+    try:
+        fetch_elements("https://example.com", tag="a")
+    finally:
+        current_run.reset(token)
+
+    assert run.http_status == 200
+    assert run.response_bytes == len(_Response.content)
+    assert run.page_digest() is not None
+
+
+def test_fetch_error_is_recorded_on_the_current_run(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fake_get(*args: Any, **kwargs: Any) -> Any:
+        raise requests.ConnectionError("boom")
+
+    monkeypatch.setattr(requests, "get", fake_get)
+
+    run = ScrapeRun(site_id=1)
+    token = current_run.set(run)
+    try:
+        with pytest.raises(FetchError):
+            fetch_elements("https://runs.example.com", tag="a")
+    finally:
+        current_run.reset(token)
+
+    assert run.error == "ConnectionError"
+    assert run.http_status is None
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from bs4 import BeautifulSoup, Tag
+
+from app.config import settings
+from app.services.scrape import base as base_module
+from app.services.scrape.base import ArticleRecord, FetchError, Scraper
+from app.services.scrape.host_limits import HostLimiter
+from app.services.scrape_runs import ScrapeRun, current_run
+
+_PAGES = {
+    "https://example.com/": (
+        '<a href="/politica/noticia-1">Primeira notícia da capa</a>'
+        '<a href="/economia/noticia-2">Segunda notícia da capa</a>'
+    ),
+    "https://example.com/politica/": (
+        '<a href="/politica/noticia-1">Primeira notícia da capa</a>'
+        '<a href="/politica/noticia-3">Notícia só de política</a>'
+    ),
+    # A link relative to the section, not to the homepage.
+    "https://example.com/economia/": '<a href="noticia-4">Notícia só de economia</a>',
+}
+
+
+class _SectionScraper(Scraper):
+    base_url = "https://example.com/"
+    section_urls = ["https://example.com/politica/", "https://example.com/economia/"]
+    min_title_length = 5
+
+    def extract_article(self, element: Tag) -> ArticleRecord | None:
+        return ArticleRecord(title=element.get_text(), url=str(element["href"]))
+
+
+def _fake_fetch_elements(url: str, tag: str = "a", **kwargs) -> list[Tag]:
+    if url not in _PAGES:
+        raise FetchError(url, "Not found", retryable=False)
+    return list(BeautifulSoup(_PAGES[url], "html.parser").find_all(tag))
+
+
+def test_sections_are_merged_without_duplicates(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(base_module, "fetch_elements", _fake_fetch_elements)
+
+    articles = _SectionScraper("example").scrape()
+
+    assert [article.url for article in articles] == [
+        "https://example.com/politica/noticia-1",
+        "https://example.com/economia/noticia-2",
+        "https://example.com/politica/noticia-3",
+        "https://example.com/economia/noticia-4",
+    ]
+
+
+def test_failed_section_is_skipped(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fetch(url: str, tag: str = "a", **kwargs) -> list[Tag]:
+        if url.endswith("/politica/"):
+            if (run := current_run.get()) is not None:
+                run.error = "HTTPError"
+            raise FetchError(url, "Server error", retryable=True)
+        return _fake_fetch_elements(url, tag)
+
+    monkeypatch.setattr(base_module, "fetch_elements", fetch)
+    run = ScrapeRun(site_id=1)
+    token = current_run.set(run)
+    try:
+        articles = _SectionScraper("example").scrape()
+    finally:
+        current_run.reset(token)
+
+    assert len(articles) == 3
+    assert run.error is None
+    assert run.elements == 3
+
+
+def test_failed_homepage_fails_the_site(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fetch(url: str, tag: str = "a", **kwargs) -> list[Tag]:
+        if url == "https://example.com/":
+            raise FetchError(url, "Server error", retryable=True)
+        return _fake_fetch_elements(url, tag)
+
+    monkeypatch.setattr(base_module, "fetch_elements", fetch)
+
+    with pytest.raises(FetchError):
+        _SectionScraper("example").scrape()
+
+
+def test_pages_are_fetched_in_parallel(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "scrape_host_concurrency", 3)
+    # Every page waits for the other two: fetched one by one, none would return.
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fetch(url: str, tag: str = "a", **kwargs) -> list[Tag]:
+        barrier.wait()
+        return _fake_fetch_elements(url, tag)
+
+    monkeypatch.setattr(base_module, "fetch_elements", fetch)
+
+    assert len(_SectionScraper("example").scrape()) == 4
+
+
+def test_offline_scrape_reads_only_archived_pages() -> None:
+    scraper = _SectionScraper("example")
+    token = base_module.offline_pages.set(
+        {"https://example.com/economia/": _PAGES["https://example.com/economia/"]}
+    )
+    try:
+        articles = scraper.scrape()
+    finally:
+        base_module.offline_pages.reset(token)
+
+    assert [article.title for article in articles] == ["Notícia só de economia"]
+
+
+def test_host_limiter_caps_requests_per_host() -> None:
+    limiter = HostLimiter(max_concurrent=2)
+    lock = threading.Lock()
+    in_flight: dict[str, int] = {"a.com": 0, "b.com": 0}
+    peak: dict[str, int] = {"a.com": 0, "b.com": 0}
+
+    def request(host: str) -> None:
+        with limiter.slot(host):
+            with lock:
+                in_flight[host] += 1
+                peak[host] = max(peak[host], in_flight[host])
+            time.sleep(0.02)
+            with lock:
+                in_flight[host] -= 1
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(request, ["a.com"] * 6 + ["b.com"] * 6))
+
+    assert peak == {"a.com": 2, "b.com": 2}
+
+
+def test_run_digest_does_not_depend_on_which_page_arrives_first(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def scrape(slow_url: str) -> bytes | None:
+        def fetch(url: str, tag: str = "a", **kwargs) -> list[Tag]:
+            if url == slow_url:
+                time.sleep(0.05)
+            html = _PAGES[url]
+            current_run.get().record_response(200, html.encode())
+            return _fake_fetch_elements(url, tag)
+
+        monkeypatch.setattr(base_module, "fetch_elements", fetch)
+        run = ScrapeRun(site_id=1)
+        token = current_run.set(run)
+        try:
+            _SectionScraper("example").scrape()
+        finally:
+            current_run.reset(token)
+        assert run.response_bytes == sum(len(html.encode()) for html in _PAGES.values())
+        return run.page_digest()
+
+    assert scrape("https://example.com/") == scrape("https://example.com/economia/")
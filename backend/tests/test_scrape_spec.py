@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup
+
+from app.services import scraping_core
+from app.services.scrape import spec as spec_module
+from app.services.scrape.spec import SpecScraper, load_specs
+from app.services.site_registry import (
+    DEFAULT_SPEC_FILE,
+    SITE_DISPLAY_NAMES,
+    SUPPORTED_SITE_SLUGS,
+    load_sites,
+)
+
+_SPEC = """
+[exemplo]
+base_url = "https://exemplo.com.br/"
+tags = ["article"]
+required_classes = ["card"]
+link = ["a[href]"]
+url = { pattern = "^https://exemplo\\\\.com\\\\.br/", year_in_path = true }
+title = [
+    { select = ["h2"], classes = ["manchete"] },
+    { select = ["a[href]"], attribute = "title" },
+]
+title_cleanup = '^Ao vivo:\\s*'
+"""
+
+_HTML = """
+<article class="card">
+  <a href="https://exemplo.com.br/2026/03/noticia-1"><h2 class="manchete">Ao vivo: Primeira notícia</h2></a>
+</article>
+<article class="card">
+  <a href="https://exemplo.com.br/2026/03/noticia-2" title=" Segunda notícia "><h2>Chamada</h2></a>
+</article>
+<article class="card">
+  <a href="https://exemplo.com.br/servicos/noticia-3"><h2 class="manchete">Sem ano</h2></a>
+</article>
+<article>
+  <a href="https://exemplo.com.br/2026/03/noticia-4"><h2 class="manchete">Sem classe</h2></a>
+</article>
+"""
+
+
+def test_bundled_specs_cover_every_supported_site() -> None:
+    specs = load_specs(DEFAULT_SPEC_FILE)
+
+    assert set(SUPPORTED_SITE_SLUGS) == set(specs)
+    assert SITE_DISPLAY_NAMES["metropoles"] == "Metrópoles"
+
+
+def test_site_listed_only_in_the_spec_file_is_supported(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "sites.toml"
+    path.write_text(_SPEC, encoding="utf-8")
+    specs = load_specs(path)
+    monkeypatch.setattr(spec_module, "site_specs", lambda: specs)
+    monkeypatch.setattr(scraping_core, "site_specs", lambda: specs)
+    monkeypatch.setattr(scraping_core, "_scrapers", {})
+
+    assert load_sites(path) == {"exemplo": "EXEMPLO"}
+    assert isinstance(scraping_core.get_scraper("exemplo"), SpecScraper)
+
+
+def test_spec_extracts_articles_from_elements(tmp_path: Path) -> None:
+    path = tmp_path / "sites.toml"
+    path.write_text(_SPEC, encoding="utf-8")
+    spec = load_specs(path)["exemplo"]
+
+    soup = BeautifulSoup(_HTML, "html.parser")
+    articles = [spec.extract(element) for element in soup.find_all(spec.tags)]
+
+    assert [(a.title, a.url) if a else None for a in articles] == [
+        ("Primeira notícia", "https://exemplo.com.br/2026/03/noticia-1"),
+        ("Segunda notícia", "https://exemplo.com.br/2026/03/noticia-2"),
+        None,
+        None,
+    ]
+
+
+@pytest.mark.parametrize(
+    "table",
+    [
+        'base_url = "https://exemplo.com.br/"\nmatch = "a[href"',
+        'base_url = "https://exemplo.com.br/"\ntitle_cleanup = "("',
+        'base_url = "https://exemplo.com.br/"\ntitle = [{ text = "upper" }]',
+    ],
+)
+def test_invalid_spec_is_rejected(tmp_path: Path, table: str) -> None:
+    path = tmp_path / "sites.toml"
+    path.write_text(f"[exemplo]\n{table}\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="exemplo"):
+        load_specs(path)
@@ -4,7 +4,7 @@ import pytest
 from bs4 import BeautifulSoup, Tag
 
 from app.services.scrape import base as base_module
-from app.services.scrape.uol import UOLScraper
+from app.services.scrape.spec import SpecScraper
 
 _HTML_UOL_HOME = """
 <html>
@@ -23,7 +23,7 @@ _HTML_UOL_HOME = """
 """
 
 
-def _fake_fetch_elements(url: str, tag: str = "a") -> list[Tag]:
+def _fake_fetch_elements(url: str, tag: str = "a", **kwargs) -> list[Tag]:
     soup = BeautifulSoup(_HTML_UOL_HOME, "html.parser")
     return list(soup.find_all(tag))
 
@@ -33,7 +33,7 @@ def test_uol_scraper_accepts_only_news_like_urls(
 ) -> None:
     monkeypatch.setattr(base_module, "fetch_elements", _fake_fetch_elements)
 
-    scraper = UOLScraper()
+    scraper = SpecScraper("uol")
     articles = scraper.scrape()
 
     assert len(articles) == 1
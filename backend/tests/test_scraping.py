@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.orm import Session
+
+from app.models import ScrapeRunModel
+from app.services import scraping as scraping_module
+from app.services.news_writer import NewsWriter
+from app.services.scrape.base import ArticleRecord
+from app.services.scraping import Scraping
+
+
+def test_site_whose_articles_failed_to_store_is_backed_off(
+    sqlite_engine, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    class BrokenSession(Session):
+        def commit(self) -> None:
+            raise ProgrammingError("INSERT", {}, Exception("no such column"))
+
+    scraping = Scraping(interval_seconds=60)
+    monkeypatch.setattr(
+        scraping_module,
+        "scrape_site",
+        lambda slug: iter(
+            [ArticleRecord(title="Notícia da capa", url="https://veja.com/n/1")]
+        ),
+    )
+    monkeypatch.setattr(
+        scraping,
+        "_build_writer",
+        lambda db: NewsWriter(
+            lambda: BrokenSession(sqlite_engine, autoflush=False),
+            scraping.recent_urls,
+            queue_size=1,
+            batch_size=100,
+            batch_seconds=0.01,
+            max_retries=0,
+            retry_delay=0.01,
+        ),
+    )
+
+    with Session(sqlite_engine) as db:
+        scraping.scrape_all_sites_once(db, slugs=["veja"])
+        (error,) = db.query(ScrapeRunModel.error).one()
+
+    assert error == "ProgrammingError"
+    assert "veja" not in scraping.scheduler.due_sites()
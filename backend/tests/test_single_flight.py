@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Hashable
+from typing import Any
+
+import pytest
+
+from app.utils import SingleFlight
+
+
+def test_single_flight_shares_result_between_concurrent_callers() -> None:
+    flight: SingleFlight[int] = SingleFlight(max_keys=10, timeout_seconds=5.0)
+    # No caller goes on until all five have joined, so the leader can't finish
+    # before the others arrive.
+    joined = threading.Barrier(5, timeout=5.0)
+    join_or_lead = flight._join_or_lead
+
+    def join_and_wait(key: Hashable) -> tuple[Any, bool]:
+        result = join_or_lead(key)
+        joined.wait()
+        return result
+
+    flight._join_or_lead = join_and_wait  # type: ignore[method-assign]
+    calls = 0
+
+    def compute() -> int:
+        nonlocal calls
+        calls += 1
+        return 42
+
+    results: list[int] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("key", compute)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5.0)
+
+    assert results == [42] * 5
+    assert calls == 1
+    assert flight.in_flight() == 0
+
+
+def test_single_flight_propagates_leader_error() -> None:
+    flight: SingleFlight[int] = SingleFlight(max_keys=10, timeout_seconds=5.0)
+
+    def fail() -> int:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        flight.do("key", fail)
+
+    assert flight.in_flight() == 0
+
+
+def test_single_flight_falls_back_when_leader_is_stuck() -> None:
+    flight: SingleFlight[str] = SingleFlight(max_keys=10, timeout_seconds=0.05)
+    started = threading.Event()
+    release = threading.Event()
+
+    def stuck() -> str:
+        started.set()
+        return str(release.wait(timeout=5.0))
+
+    leader = threading.Thread(target=lambda: flight.do("key", stuck))
+    leader.start()
+    assert started.wait(timeout=5.0)
+
+    assert flight.do("key", lambda: "own") == "own"
+
+    release.set()
+    leader.join(timeout=5.0)
+
+
+def test_single_flight_runs_uncoalesced_when_full() -> None:
+    flight: SingleFlight[str] = SingleFlight(max_keys=0, timeout_seconds=5.0)
+
+    assert flight.do("key", lambda: "direct") == "direct"
+    assert flight.in_flight() == 0
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from app.services import backfill as backfill_module
+from app.services.backfill import _extract
+from app.services.snapshot_archive import SnapshotArchive
+
+_NOW = datetime(2026, 3, 10, 12, tzinfo=timezone.utc)
+_URL = "https://livecoins.com.br/"
+_HTML = """
+<html><body>
+  <a rel="bookmark" href="https://livecoins.com.br/bitcoin-sobe-forte-hoje/"
+     title="Bitcoin sobe forte hoje apos anuncio do banco central">Bitcoin</a>
+</body></html>
+"""
+
+
+def _object_files(root: Path) -> list[Path]:
+    return list((root / "objects").glob("*/*.html.gz"))
+
+
+def test_identical_pages_are_stored_once(tmp_path: Path) -> None:
+    archive = SnapshotArchive(tmp_path, retention_days=7)
+
+    first = archive.store("uol", _URL, b"<html>1</html>", "utf-8", _NOW)
+    again = archive.store("uol", _URL, b"<html>1</html>", "utf-8", _NOW)
+    archive.store("uol", _URL, b"<html>2</html>", "utf-8", _NOW)
+
+    assert first == again
+    assert len(_object_files(tmp_path)) == 2
+    assert len(list(archive.snapshots())) == 3
+    assert archive.load(first) == b"<html>1</html>"
+
+
+def test_prune_drops_expired_captures_and_their_pages(tmp_path: Path) -> None:
+    archive = SnapshotArchive(tmp_path, retention_days=7)
+    old = archive.store("uol", _URL, b"old", "utf-8", _NOW - timedelta(days=10))
+    kept = archive.store("uol", _URL, b"new", "utf-8", _NOW - timedelta(days=1))
+    settled = (_NOW - timedelta(days=1)).timestamp()
+    for path in _object_files(tmp_path):
+        os.utime(path, (settled, settled))
+
+    assert archive.prune(_NOW) == 1
+    assert [snapshot.sha256 for snapshot in archive.snapshots()] == [kept]
+    assert all(old not in path.name for path in _object_files(tmp_path))
+
+
+def test_extract_runs_the_current_scraper_over_a_snapshot(tmp_path: Path) -> None:
+    archive = SnapshotArchive(tmp_path, retention_days=7)
+    archive.store("livecoins", _URL, _HTML.encode(), "utf-8", _NOW)
+    snapshot = next(archive.snapshots())
+
+    slug, captured_at, articles = _extract((str(tmp_path), snapshot))
+
+    assert (slug, captured_at) == ("livecoins", _NOW)
+    assert articles == [
+        (
+            "Bitcoin sobe forte hoje apos anuncio do banco central",
+            "https://livecoins.com.br/bitcoin-sobe-forte-hoje/",
+        )
+    ]
+
+
+def test_extract_skips_a_snapshot_that_fails_to_parse(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    class BrokenScraper:
+        def iter_articles(self) -> list[object]:
+            raise ValueError("Invalid IPv6 URL")
+
+    archive = SnapshotArchive(tmp_path, retention_days=7)
+    archive.store("livecoins", _URL, _HTML.encode(), "utf-8", _NOW)
+    snapshot = next(archive.snapshots())
+    monkeypatch.setattr(backfill_module, "get_scraper", lambda slug: BrokenScraper())
+
+    assert _extract((str(tmp_path), snapshot)) == ("livecoins", _NOW, [])
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import hashlib
+
+from app.services.url_keys import canonical_url, url_hash
+
+
+def test_variants_of_a_link_share_the_canonical_form() -> None:
+    canonical = "https://g1.globo.com/politica/noticia/2026/03/10/reforma.ghtml"
+    variants = [
+        canonical,
+        "/politica/noticia/2026/03/10/reforma.ghtml",
+        "HTTPS://G1.Globo.com:443/politica/noticia/2026/03/10/reforma.ghtml",
+        canonical + "#comentarios",
+        canonical + "?utm_source=home&utm_medium=destaque",
+        canonical + "?fbclid=abc123",
+    ]
+
+    assert {canonical_url(url, "https://g1.globo.com/") for url in variants} == {
+        canonical
+    }
+
+
+def test_content_parameters_and_path_case_are_kept() -> None:
+    url = "https://www.uol.com.br/Busca/?q=Juros&utm_campaign=x&page=2"
+
+    assert canonical_url(url) == "https://www.uol.com.br/Busca/?q=Juros&page=2"
+    assert canonical_url("http://example.com:8080") == "http://example.com:8080/"
+
+
+def test_url_hash_matches_postgres_md5_uuid() -> None:
+    url = "https://veja.abril.com.br/politica/reforma"
+
+    assert url_hash(url).hex == hashlib.md5(url.encode()).hexdigest()
+    assert url_hash(url) != url_hash(url + "/")